@@ -5,3 +5,5 @@ ROOT_DIR = os.path.dirname(__file__)
 DATA_DIR = os.path.join(ROOT_DIR, "data")
 
 LOGS_DIR = os.path.join(ROOT_DIR, "logs")
+
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
@@ -1,7 +1,10 @@
+from src.api_classes import HeadHunterVacanciesSource
+from src.response_cache import ResponseCache
 from src.vacancy_interaction import VacancyInteraction
 
 
 def user_interaction() -> None:
+    hh_api = HeadHunterVacanciesSource(cache=ResponseCache())
     while True:
         search_query = input("Введите ключевое слово для поискового запроса: ")
         filter_words = input("Введите ключевые слова для фильтрации вакансий: ").split()
@@ -9,8 +12,9 @@ def user_interaction() -> None:
         max_salary_range = int(input("Введите верхнюю границу заработной платы: "))
         top_n = int(input("Введите количество вакансий для вывода в топ N: "))
 
-        filtered_vacancies = VacancyInteraction(search_query, filter_words, min_salary_range, max_salary_range, top_n)
-        filtered_vacancies.get_vacancies()
+        filtered_vacancies = VacancyInteraction(search_query, filter_words, min_salary_range, max_salary_range, top_n,
+                                                hh_api)
+        filtered_vacancies.get_vacancies(top_only=True)
         if filtered_vacancies.__len__() > 0:
             print(f"Найдено {filtered_vacancies.__len__()} вакансий\n")
             filtered_vacancies.get_top_vacancies()
@@ -0,0 +1,128 @@
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Optional
+
+from src.api_classes import BaseVacanciesSource, HeadHunterVacanciesSource
+from src.class_vacancy import Vacancy
+from src.logging_config import LoggingConfigClassMixin
+
+
+class SourceRegistry:
+    """Реестр источников вакансий"""
+
+    __default_registry: Optional["SourceRegistry"] = None
+    __default_registry_lock = Lock()
+
+    def __init__(self) -> None:
+        """Конструктор для реестра источников"""
+        self.__sources: dict[str, BaseVacanciesSource] = {}
+        self.__lock = Lock()
+
+    @classmethod
+    def default(cls) -> "SourceRegistry":
+        """Возвращает общий реестр источников с зарегистрированным источником HeadHunter.ru"""
+        with cls.__default_registry_lock:
+            if cls.__default_registry is None:
+                cls.__default_registry = cls()
+                cls.__default_registry.register("hh", HeadHunterVacanciesSource())
+            return cls.__default_registry
+
+    def register(self, name: str, source: BaseVacanciesSource) -> None:
+        """Регистрирует источник вакансий под заданным именем"""
+        if not isinstance(source, BaseVacanciesSource):
+            raise TypeError("Источник должен быть наследником BaseVacanciesSource")
+        with self.__lock:
+            self.__sources[name] = source
+
+    def unregister(self, name: str) -> None:
+        """Удаляет источник вакансий из реестра"""
+        with self.__lock:
+            self.__sources.pop(name, None)
+
+    def get(self, name: str) -> Optional[BaseVacanciesSource]:
+        """Возвращает источник вакансий по имени"""
+        return self.__sources.get(name)
+
+    @property
+    def names(self) -> list[str]:
+        """Возвращает имена зарегистрированных источников"""
+        return list(self.__sources)
+
+    def items(self) -> list[tuple[str, BaseVacanciesSource]]:
+        """Возвращает пары из имени и источника вакансий"""
+        with self.__lock:
+            return list(self.__sources.items())
+
+    def __len__(self) -> int:
+        """Возвращает количество зарегистрированных источников"""
+        return len(self.__sources)
+
+
+class VacancyAggregator(LoggingConfigClassMixin):
+    """
+    Класс для параллельного получения вакансий из всех зарегистрированных источников
+    :registry: реестр источников (по умолчанию общий)
+    :timeout: время ожидания ответов источников в секундах, после которого незавершенные источники пропускаются
+    """
+
+    def __init__(self, registry: Optional[SourceRegistry] = None, timeout: float = 30) -> None:
+        """Конструктор для агрегатора вакансий"""
+        self.__registry = registry if registry is not None else SourceRegistry.default()
+        self.__timeout = timeout
+        super().__init__()
+        self.logger = self.configure()
+
+    @staticmethod
+    def _dedup_key(vacancy: Vacancy) -> tuple:
+        """Возвращает ключ для поиска одной и той же вакансии, опубликованной в разных источниках"""
+        return (" ".join(vacancy.name.lower().split()),
+                " ".join(vacancy.employer_name.lower().split()),
+                vacancy.area.lower(),
+                vacancy.salary_range)
+
+    def _deduplicate(self, results: list[list[Vacancy]]) -> list[Vacancy]:
+        """
+        Объединяет вакансии из разных источников без повторов: внутри одного источника повторы определяются
+        по id вакансии (у одного работодателя может быть несколько одинаковых вакансий), а между источниками -
+        по названию, работодателю, региону и зарплате
+        """
+        unique: list[Vacancy] = []
+        seen_keys: set[tuple] = set()
+        for vacancies in results:
+            source_vacancies: dict[str, Vacancy] = {}
+            for vacancy in vacancies:
+                source_vacancies.setdefault(vacancy.vac_id, vacancy)
+            source_keys = set()
+            for vacancy in source_vacancies.values():
+                key = self._dedup_key(vacancy)
+                if key not in seen_keys:
+                    source_keys.add(key)
+                    unique.append(vacancy)
+            seen_keys |= source_keys
+        return unique
+
+    def get_vacancies(self, key_word: str) -> list[Vacancy]:
+        """Параллельно получает вакансии из всех источников и объединяет их без повторов"""
+        sources = self.__registry.items()
+        if not sources:
+            self.logger.info("Нет зарегистрированных источников вакансий")
+            return []
+
+        executor = ThreadPoolExecutor(max_workers=len(sources))
+        futures: dict[Future, str] = {executor.submit(source.get_vacancies, key_word): name
+                                      for name, source in sources}
+        _, not_done = wait(futures, timeout=self.__timeout)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        results = []
+        for future, name in futures.items():
+            if future in not_done:
+                self.logger.warning(f"Источник {name} не ответил за {self.__timeout} с и пропущен")
+                continue
+            try:
+                results.append(future.result())
+            except Exception as err:
+                self.logger.error(f"Ошибка получения вакансий из источника {name}: {err}")
+        vacancies = self._deduplicate(results)
+        self.logger.info(f"Из {len(results)} источников получено {len(vacancies)} уникальных вакансий")
+        return vacancies
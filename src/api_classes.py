@@ -1,11 +1,65 @@
+import logging
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from threading import Lock
+from typing import Any, Iterable, Iterator, Optional
 
 import requests
-from requests import Response
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.class_vacancy import Vacancy
 from src.logging_config import LoggingConfigClassMixin
+from src.request_scheduler import RequestScheduler
+from src.response_cache import ResponseCache
+
+HH_API_URL = "https://api.hh.ru/vacancies"
+
+HH_HEADERS = {"User-Agent": "api-test-agent"}
+
+HH_MAX_DEPTH = 2000
+
+HH_DEFAULT_PARAMS = {"text": "",
+                     "page": 0,
+                     "per_page": 100,
+                     "only_with_salary": True,
+                     "currency": "RUR",
+                     "area": 113}
+
+
+class HeadHunterFormatterMixin:
+    """Миксин для преобразования данных о вакансиях HeadHunter.ru в объекты Vacancy"""
+
+    logger: logging.Logger
+
+    @staticmethod
+    def _filter_by_currency(vacancies_data: list[dict], currency: str = "RUR") -> list[dict]:
+        """Оставляет только вакансии с зарплатой в заданной валюте"""
+        return [vac for vac in vacancies_data if vac["salary"] and vac["salary"]["currency"] == currency]
+
+    @staticmethod
+    def iter_format_vacancies(vacancies_data: Iterable[dict]) -> Iterator[Vacancy]:
+        """Возвращает объекты Vacancy по одному, не создавая промежуточный список"""
+        for vac in vacancies_data:
+            yield Vacancy(
+                vac_id=str(vac.get("id") or ""),
+                name=str(vac.get("name") or ""),
+                url=str(vac.get("alternate_url") or ""),
+                salary_from=vac.get("salary", {}).get("from"),
+                salary_to=vac.get("salary", {}).get("to"),
+                employer_name=str(vac.get("employer", {}).get("name") or ""),
+                employer_url=str(vac.get("employer", {}).get("alternate_url") or ""),
+                requirements=str(vac.get("snippet", {}).get("requirement") or ""),
+                area=str(vac.get("area", {}).get("name") or "")
+            )
+
+    def format_vacancies(self, vacancies_data: list[dict]) -> list[Vacancy]:
+        """Формирует список объектов Vacancy"""
+        vacancies = list(self.iter_format_vacancies(vacancies_data))
+        self.logger.info("Данные о вакансиях преобразованы в объекты класса Vacancy")
+        return vacancies
 
 
 class BaseVacanciesSource(ABC):
@@ -21,82 +75,396 @@ class BaseVacanciesSource(ABC):
         """Обрабатывает GET-запрос и получает данные о вакансиях"""
         pass
 
+    @abstractmethod
+    def get_vacancies(self, key_word: str) -> list[Vacancy]:
+        """Получает данные о вакансиях и возвращает список объектов Vacancy"""
+        pass
+
 
-class HeadHunterVacanciesSource(BaseVacanciesSource, LoggingConfigClassMixin):
+def create_session(pool_size: int = 10, max_retries: int = 3) -> Session:
+    """
+    Создает HTTP-сессию с пулом keep-alive соединений и повторными попытками на транспортном уровне
+    (ответы 429 и 5xx повторяет RequestScheduler)
+    """
+    retries = Retry(total=max_retries,
+                    backoff_factor=0.5,
+                    allowed_methods=("GET",))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class HeadHunterVacanciesSource(BaseVacanciesSource, HeadHunterFormatterMixin, LoggingConfigClassMixin):
     """Класс для получения через API данных сайта HeadHunter.ru о вакансиях по ключевому слову"""
 
-    __slots__ = ("__url", "__headers", "__params")
+    __slots__ = ("__url", "__headers", "__params", "__max_workers", "__session", "__check_connection", "__cache",
+                 "__scheduler", "__max_pages", "__timeout")
     __url: str
     __headers: dict
     __params: dict
+    __max_workers: int
+    __session: Session
+    __check_connection: bool
+    __cache: Optional[ResponseCache]
+    __scheduler: RequestScheduler
+    __max_pages: int
+    __timeout: float
+
+    MAX_PAGES = 5
 
-    def __init__(self) -> None:
-        """Конструктор для получения вакансий через API"""
-        self.__url = "https://api.hh.ru/vacancies"
-        self.__headers = {"User-Agent": "api-test-agent"}
-        self.__params = {"text": "",
-                         "page": 0,
-                         "per_page": 100,
-                         "only_with_salary": True,
-                         "currency": "RUR",
-                         "area": 113}
+    __shared_sessions: dict[tuple[int, int], Session] = {}
+    __shared_sessions_lock = Lock()
+
+    def __init__(self,
+                 max_workers: int = 4,
+                 session: Optional[Session] = None,
+                 pool_size: int = 10,
+                 max_retries: int = 3,
+                 check_connection: bool = True,
+                 cache: Optional[ResponseCache] = None,
+                 scheduler: Optional[RequestScheduler] = None,
+                 max_pages: int = MAX_PAGES,
+                 timeout: float = 30) -> None:
+        """
+        Конструктор для получения вакансий через API
+        :check_connection: если False, отдельный проверочный запрос не выполняется,
+        проверкой подключения служит ответ на запрос первой страницы
+        :cache: дисковый кэш ответов API (по умолчанию не используется)
+        :scheduler: планировщик запросов (по умолчанию общий для всех источников)
+        :max_pages: максимальное количество страниц на запрос (не глубже HH_MAX_DEPTH вакансий)
+        :timeout: время ожидания ответа API на один запрос в секундах
+        """
+        self.__url = HH_API_URL
+        self.__headers = dict(HH_HEADERS)
+        self.__params = dict(HH_DEFAULT_PARAMS)
+        self.__max_workers = max(1, max_workers)
+        self.__session = session or self.get_shared_session(max(pool_size, self.__max_workers), max_retries)
+        self.__check_connection = check_connection
+        self.__cache = cache
+        self.__scheduler = scheduler or RequestScheduler.shared()
+        self.__max_pages = max(1, min(max_pages, HH_MAX_DEPTH // self.__params["per_page"]))
+        self.__timeout = timeout
         super().__init__()
         super().__init__()
         self.logger = self.configure()
 
+    @classmethod
+    def get_shared_session(cls, pool_size: int = 10, max_retries: int = 3) -> Session:
+        """Возвращает общую для всех экземпляров HTTP-сессию с заданными параметрами пула"""
+        key = (pool_size, max_retries)
+        with cls.__shared_sessions_lock:
+            if key not in cls.__shared_sessions:
+                cls.__shared_sessions[key] = create_session(pool_size, max_retries)
+            return cls.__shared_sessions[key]
+
+    @property
+    def session(self) -> Session:
+        """Возвращает HTTP-сессию, через которую выполняются запросы"""
+        return self.__session
+
+    def __send(self, params: Optional[dict] = None, headers: Optional[dict] = None) -> Response:
+        """Делает GET-запрос с учетом лимита частоты и повторяет его при ответах 429 и 5xx"""
+        attempt = 0
+        while True:
+            self.__scheduler.acquire()
+            try:
+                response = self.__session.get(self.__url, headers={**self.__headers, **(headers or {})},
+                                              params=params, timeout=self.__timeout)
+            except requests.RequestException as err:
+                if attempt >= self.__scheduler.max_retries:
+                    raise
+                delay = self.__scheduler.backoff_delay(attempt)
+                self.logger.warning(f"Ошибка запроса к API: {err}, повтор через {delay:.1f} с")
+            else:
+                if not self.__scheduler.should_retry(response.status_code) or attempt >= self.__scheduler.max_retries:
+                    return response
+                delay = self.__scheduler.backoff_delay(attempt, response.headers.get("Retry-After"))
+                if response.status_code == 429:
+                    self.__scheduler.penalize(delay)
+                self.logger.warning(f"Ответ API со статус-кодом {response.status_code}, "
+                                    f"повтор через {delay:.1f} с")
+            self.__scheduler.wait(delay)
+            attempt += 1
+
     def _connect(self) -> Response | None:
         """Делает GET-запрос, проверяет статус-код ответа"""
-        response = requests.get(self.__url, headers=self.__headers)
+        response = self.__send()
         if response.status_code != 200:
             self.logger.error("Ошибка подключения через API")
             return None
         self.logger.info("Успешное подключение через API")
         return response
 
-    def get_vacancies_data(self, key_word: str) -> list:
+    def _request_page(self, params: dict, headers: Optional[dict] = None) -> Response:
+        """Делает GET-запрос одной страницы с данными о вакансиях"""
+        response = self.__send(params, headers)
+        self.logger.info(f"Получены данные о вакансиях, страница {params['page']}")
+        return response
+
+    @property
+    def max_pages(self) -> int:
+        """Возвращает максимальное количество страниц на запрос"""
+        return self.__max_pages
+
+    @property
+    def per_page(self) -> int:
+        """Возвращает количество вакансий на странице"""
+        return int(self.__params["per_page"])
+
+    def _get_page(self,
+                  key_word: str,
+                  page: int,
+                  check_status: bool = False,
+                  extra_params: Optional[dict] = None) -> dict | None:
+        """Получает одну страницу с данными о вакансиях, используя кэш ответов, если он задан"""
+        params = self.__page_params(key_word, page, extra_params)
+        entry = self.__cache.get(params) if self.__cache is not None else None
+        if self.__cache is not None and entry and self.__cache.is_fresh(entry):
+            self.logger.info(f"Данные о вакансиях получены из кэша, страница {page}")
+            return dict(entry["data"])
+
+        response = self._request_page(params, ResponseCache.conditional_headers(entry))
+        if self.__cache is not None and entry and response.status_code == 304:
+            self.__cache.refresh(params, entry)
+            self.logger.info(f"Данные о вакансиях не изменились, страница {page} получена из кэша")
+            return dict(entry["data"])
+        if response.status_code != 200:
+            self.logger.error("Ошибка подключения через API" if check_status
+                              else f"Ошибка получения данных: статус-код ответа {response.status_code}")
+            return None
+        if check_status:
+            self.logger.info("Успешное подключение через API")
+
+        result = self.__page_to_json(response)
+        if self.__cache is not None and response.status_code == 200:
+            self.__cache.set(params, result, response.headers)
+        return result
+
+    def __page_params(self, key_word: str, page: int, extra_params: Optional[dict]) -> dict:
+        """Возвращает параметры запроса страницы с данными о вакансиях"""
+        return {**self.__params, **(extra_params or {}), "text": key_word, "page": page}
+
+    def __is_cached(self, key_word: str, page: int, extra_params: Optional[dict]) -> bool:
+        """Проверяет, что страница есть в кэше ответов и не устарела"""
+        if self.__cache is None:
+            return False
+        entry = self.__cache.get(self.__page_params(key_word, page, extra_params))
+        return entry is not None and self.__cache.is_fresh(entry)
+
+    def __get_first_page(self, key_word: str, extra_params: Optional[dict]) -> dict | None:
+        """
+        Получает первую страницу, проверяя подключение отдельным запросом или по ответу на саму страницу.
+        Если первая страница получена из кэша, подключение не проверяется
+        """
+        if self.__check_connection and not self.__is_cached(key_word, 0, extra_params):
+            if not self._connect():
+                return None
+            return self._get_page(key_word, 0, extra_params=extra_params)
+        return self._get_page(key_word, 0, check_status=True, extra_params=extra_params)
+
+    def __page_to_json(self, response: Response) -> dict:
+        """Преобразует ответ API в json-формат"""
+        result: dict = response.json()
+        self.logger.info("Данные о вакансиях преобразованы в json-формат")
+        return result
+
+    def __fetch_page_items(self, key_word: str, page: int, extra_params: Optional[dict]) -> Optional[list]:
+        """Возвращает вакансии со страницы или None, если страницу получить не удалось"""
+        try:
+            result = self._get_page(key_word, page, extra_params=extra_params)
+        except Exception as err:
+            self.logger.error(f"Ошибка получения данных: {err}")
+            return None
+        return None if result is None else list(result.get("items", []))
+
+    def __iter_other_pages(self,
+                           key_word: str,
+                           extra_params: Optional[dict],
+                           first_page: dict) -> Iterator[tuple[int, Optional[list]]]:
+        """Параллельно получает страницы после первой и возвращает их номера и вакансии (None при ошибке)"""
+        total_pages = min(first_page.get("pages", 1), self.__max_pages)
+        other_pages = range(1, total_pages)
+        if not other_pages:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(self.__max_workers, len(other_pages)))
+        try:
+            futures = {executor.submit(self.__fetch_page_items, key_word, page, extra_params): page
+                       for page in other_pages}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def count_vacancies(self, key_word: str, extra_params: Optional[dict] = None) -> Optional[int]:
+        """
+        Возвращает количество найденных по запросу вакансий, запрашивая одну вакансию.
+        Если количество получить не удалось, возвращает None (в отличие от 0 - вакансий не найдено)
+        """
+        try:
+            result = self._get_page(key_word, 0, extra_params={**(extra_params or {}), "per_page": 1})
+        except Exception as err:
+            self.logger.error(f"Ошибка получения данных: {err}")
+            return None
+        if result is None or "found" not in result:
+            return None
+        return int(result["found"])
+
+    def _iter_pages(self, key_word: str, extra_params: Optional[dict] = None) -> Iterator[tuple[int, list]]:
+        """
+        Возвращает номера и вакансии страниц по мере получения ответов API
+        :extra_params: дополнительные параметры запроса (например, area, date_from, date_to)
+        """
+        try:
+            first_page = self.__get_first_page(key_word, extra_params)
+        except Exception as err:
+            self.logger.error(f"Ошибка получения данных: {err}")
+            return
+        if first_page is None:
+            return
+        yield 0, list(first_page.get("items", []))
+        for page, items in self.__iter_other_pages(key_word, extra_params, first_page):
+            yield page, items or []
+
+    def iter_vacancies_data(self, key_word: str, extra_params: Optional[dict] = None) -> Iterator[list]:
+        """Возвращает данные о вакансиях постранично по мере получения ответов API"""
+        for _, items in self._iter_pages(key_word, extra_params):
+            yield items
+
+    def get_vacancies_data(self, key_word: str, extra_params: Optional[dict] = None) -> list:
         """Обрабатывает GET-запрос и получает данные о вакансиях"""
-        vacancies_data = []
-        page = 0
-        if self._connect():
-            while True:
-                self.__params["text"] = key_word
-                self.__params["page"] = page
-                try:
-                    response = requests.get(self.__url, headers=self.__headers, params=self.__params)
-                    self.logger.info("Получены данные о вакансиях")
-                    result = response.json()
-                    self.logger.info("Данные о вакансиях преобразованы в json-формат")
-                    data = result.get("items", [])
-                    vacancies_data.extend(data)
-                    total_pages = result.get("pages", 1)
-                    if page >= 4 or page + 1 >= total_pages:
-                        break
-                    page += 1
-                except Exception as err:
-                    self.logger.error(f"Ошибка получения данных: {err}")
-                    break
+        vacancies_data: list = []
+        for _, items in sorted(self._iter_pages(key_word, extra_params), key=itemgetter(0)):
+            vacancies_data.extend(items)
         return vacancies_data
 
+    def fetch_vacancies_data(self, key_word: str, extra_params: Optional[dict] = None) -> tuple[list, int, int]:
+        """
+        Получает данные о вакансиях и сведения о полноте результата. Возвращает данные о вакансиях,
+        количество найденных по запросу вакансий и количество страниц, которые не удалось получить.
+        Результат полный, если все страницы получены и получено не меньше вакансий, чем найдено
+        """
+        try:
+            first_page = self.__get_first_page(key_word, extra_params)
+        except Exception as err:
+            self.logger.error(f"Ошибка получения данных: {err}")
+            first_page = None
+        if first_page is None:
+            return [], 0, 1
+        pages = {0: list(first_page.get("items", []))}
+        failed_pages = 0
+        for page, items in self.__iter_other_pages(key_word, extra_params, first_page):
+            if items is None:
+                failed_pages += 1
+            else:
+                pages[page] = items
+        vacancies_data = [vac for page in sorted(pages) for vac in pages[page]]
+        return vacancies_data, int(first_page.get("found", len(vacancies_data))), failed_pages
+
+    def iter_vacancies(self, key_word: str) -> Iterator[Vacancy]:
+        """Возвращает объекты Vacancy постранично по мере получения ответов API"""
+        for items in self.iter_vacancies_data(key_word):
+            yield from self.iter_format_vacancies(self._filter_by_currency(items))
+
     def get_vacancies(self, key_word: str) -> list[Vacancy]:
         """Получает данные о вакансиях и возвращает список объектов Vacancy"""
         vacancies = self.get_vacancies_data(key_word)
-        filtered = [vac for vac in vacancies if vac["salary"] and vac["salary"]["currency"] == "RUR"]
-        return self.format_vacancies(filtered)
+        return self.format_vacancies(self._filter_by_currency(vacancies))
+
+
+class JsonFeedVacanciesSource(BaseVacanciesSource, LoggingConfigClassMixin):
+    """
+    Класс для получения вакансий из произвольного JSON-источника (API или фида) по ключевому слову
+    :url: адрес источника
+    :field_map: соответствие полей Vacancy путям к значениям в элементе фида (через точку, например "salary.from")
+    :items_path: путь к списку вакансий в ответе (пустая строка, если ответ - сам список)
+    :query_param: имя параметра запроса с ключевым словом
+    :params: дополнительные параметры запроса
+    """
+
+    def __init__(self,
+                 url: str,
+                 field_map: dict[str, str],
+                 items_path: str = "items",
+                 query_param: str = "text",
+                 params: Optional[dict] = None,
+                 headers: Optional[dict] = None,
+                 session: Optional[Session] = None,
+                 timeout: float = 30) -> None:
+        """Конструктор для получения вакансий из JSON-источника"""
+        self.__url = url
+        self.__field_map = field_map
+        self.__items_path = items_path
+        self.__query_param = query_param
+        self.__params = dict(params or {})
+        self.__headers = dict(headers or HH_HEADERS)
+        self.__session = session or HeadHunterVacanciesSource.get_shared_session()
+        self.__timeout = timeout
+        super().__init__()
+        self.logger = self.configure()
+
+    @staticmethod
+    def _get_by_path(data: Any, path: str) -> Any:
+        """Возвращает значение по пути из ключей, разделенных точкой"""
+        for key in filter(None, path.split(".")):
+            if not isinstance(data, dict):
+                return None
+            data = data.get(key)
+        return data
+
+    def _connect(self) -> Response | None:
+        """Делает GET-запрос, проверяет статус-код ответа"""
+        response = self.__session.get(self.__url, headers=self.__headers, timeout=self.__timeout)
+        if response.status_code != 200:
+            self.logger.error(f"Ошибка подключения к источнику {self.__url}")
+            return None
+        return response
+
+    def get_vacancies_data(self, key_word: str) -> list:
+        """Обрабатывает GET-запрос и получает данные о вакансиях"""
+        try:
+            response = self.__session.get(self.__url,
+                                          headers=self.__headers,
+                                          params={**self.__params, self.__query_param: key_word},
+                                          timeout=self.__timeout)
+            if response.status_code != 200:
+                self.logger.error(f"Ошибка подключения к источнику {self.__url}")
+                return []
+            items = self._get_by_path(response.json(), self.__items_path)
+        except Exception as err:
+            self.logger.error(f"Ошибка получения данных: {err}")
+            return []
+        self.logger.info(f"Получены данные о вакансиях из источника {self.__url}")
+        return list(items) if isinstance(items, list) else []
+
+    def __field(self, vac: dict, field: str) -> Any:
+        """Возвращает значение поля Vacancy из элемента фида"""
+        path = self.__field_map.get(field)
+        return self._get_by_path(vac, path) if path else None
+
+    def __text_field(self, vac: dict, field: str) -> str:
+        """Возвращает строковое значение поля Vacancy из элемента фида"""
+        return str(self.__field(vac, field) or "")
 
     def format_vacancies(self, vacancies_data: list[dict]) -> list[Vacancy]:
-        """Формирует список объектов Vacancy"""
+        """Формирует список объектов Vacancy по соответствию полей"""
         vacancies = [
             Vacancy(
-                vac_id=str(vac.get("id") or ""),
-                name=str(vac.get("name") or ""),
-                url=str(vac.get("alternate_url") or ""),
-                salary_from=vac.get("salary", {}).get("from"),
-                salary_to=vac.get("salary", {}).get("to"),
-                employer_name=str(vac.get("employer", {}).get("name") or ""),
-                employer_url=str(vac.get("employer", {}).get("alternate_url") or ""),
-                requirements=str(vac.get("snippet", {}).get("requirement") or ""),
-                area=str(vac.get("area", {}).get("name") or "")
+                vac_id=self.__text_field(vac, "vac_id"),
+                name=self.__text_field(vac, "name"),
+                url=self.__text_field(vac, "url"),
+                salary_from=self.__field(vac, "salary_from"),
+                salary_to=self.__field(vac, "salary_to"),
+                employer_name=self.__text_field(vac, "employer_name"),
+                employer_url=self.__text_field(vac, "employer_url"),
+                requirements=self.__text_field(vac, "requirements"),
+                area=self.__text_field(vac, "area")
             )
             for vac in vacancies_data]
         self.logger.info("Данные о вакансиях преобразованы в объекты класса Vacancy")
         return vacancies
+
+    def get_vacancies(self, key_word: str) -> list[Vacancy]:
+        """Получает данные о вакансиях и возвращает список объектов Vacancy"""
+        return self.format_vacancies(self.get_vacancies_data(key_word))
@@ -0,0 +1,205 @@
+import asyncio
+from abc import ABC, abstractmethod
+from operator import itemgetter
+from typing import Any, AsyncIterator, Optional
+
+import aiohttp
+
+from src.api_classes import HH_API_URL, HH_DEFAULT_PARAMS, HH_HEADERS, HeadHunterFormatterMixin
+from src.class_vacancy import Vacancy
+from src.logging_config import LoggingConfigClassMixin
+from src.request_scheduler import RequestScheduler
+
+
+class AsyncBaseVacanciesSource(ABC):
+    """Абстрактный класс для асинхронного получения данных через API по ключевому слову"""
+
+    @abstractmethod
+    async def get_vacancies_data(self, key_word: str) -> Any:
+        """Обрабатывает GET-запрос и получает данные о вакансиях"""
+        pass
+
+    @abstractmethod
+    async def get_vacancies(self, key_word: str) -> list[Vacancy]:
+        """Получает данные о вакансиях и возвращает список объектов Vacancy"""
+        pass
+
+
+class AsyncHeadHunterVacanciesSource(AsyncBaseVacanciesSource, HeadHunterFormatterMixin, LoggingConfigClassMixin):
+    """Класс для асинхронного получения через API данных сайта HeadHunter.ru о вакансиях по ключевому слову"""
+
+    __slots__ = ("__url", "__headers", "__params", "__max_concurrency", "__pool_size", "__timeout",
+                 "__check_connection", "__session", "__own_session", "__scheduler")
+    __url: str
+    __headers: dict
+    __params: dict
+    __max_concurrency: int
+    __pool_size: int
+    __timeout: aiohttp.ClientTimeout
+    __check_connection: bool
+    __session: Optional[aiohttp.ClientSession]
+    __own_session: bool
+    __scheduler: RequestScheduler
+
+    MAX_PAGES = 5
+
+    def __init__(self,
+                 url: str = HH_API_URL,
+                 max_concurrency: int = 4,
+                 pool_size: int = 10,
+                 timeout: float = 30,
+                 check_connection: bool = True,
+                 session: Optional[aiohttp.ClientSession] = None,
+                 scheduler: Optional[RequestScheduler] = None) -> None:
+        """
+        Конструктор для асинхронного получения вакансий через API
+        :check_connection: если False, отдельный проверочный запрос не выполняется,
+        проверкой подключения служит ответ на запрос первой страницы
+        :scheduler: планировщик запросов (по умолчанию общий для всех источников)
+        """
+        self.__url = url
+        self.__headers = dict(HH_HEADERS)
+        self.__params = dict(HH_DEFAULT_PARAMS)
+        self.__max_concurrency = max(1, max_concurrency)
+        self.__pool_size = max(pool_size, self.__max_concurrency)
+        self.__timeout = aiohttp.ClientTimeout(total=timeout)
+        self.__check_connection = check_connection
+        self.__session = session
+        self.__own_session = session is None
+        self.__scheduler = scheduler or RequestScheduler.shared()
+        super().__init__()
+        self.logger = self.configure()
+
+    async def __aenter__(self) -> "AsyncHeadHunterVacanciesSource":
+        """Открывает HTTP-сессию при входе в контекстный менеджер"""
+        self.__get_session()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Закрывает HTTP-сессию при выходе из контекстного менеджера"""
+        await self.close()
+
+    async def close(self) -> None:
+        """Закрывает HTTP-сессию, если она была создана источником"""
+        if self.__own_session and self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        if self.__own_session:
+            self.__session = None
+
+    def __get_session(self) -> aiohttp.ClientSession:
+        """Возвращает HTTP-сессию, создавая ее в текущем цикле событий при первом обращении"""
+        if self.__session is None or self.__session.closed:
+            connector = aiohttp.TCPConnector(limit=self.__pool_size)
+            self.__session = aiohttp.ClientSession(connector=connector, timeout=self.__timeout)
+            self.__own_session = True
+        return self.__session
+
+    async def __send(self, params: Optional[dict] = None) -> tuple[int, Optional[dict]]:
+        """
+        Делает GET-запрос с учетом лимита частоты и повторяет его при ответах 429 и 5xx.
+        Возвращает статус-код ответа и данные в json-формате (для успешного ответа)
+        """
+        attempt = 0
+        while True:
+            await self.__scheduler.acquire_async()
+            try:
+                async with self.__get_session().get(self.__url, headers=self.__headers, params=params) as response:
+                    if (not self.__scheduler.should_retry(response.status)
+                            or attempt >= self.__scheduler.max_retries):
+                        if response.status != 200:
+                            return response.status, None
+                        return response.status, await response.json(content_type=None)
+                    delay = self.__scheduler.backoff_delay(attempt, response.headers.get("Retry-After"))
+                    if response.status == 429:
+                        self.__scheduler.penalize(delay)
+                    self.logger.warning(f"Ответ API со статус-кодом {response.status}, "
+                                        f"повтор через {delay:.1f} с")
+            except aiohttp.ClientError as err:
+                if attempt >= self.__scheduler.max_retries:
+                    raise
+                delay = self.__scheduler.backoff_delay(attempt)
+                self.logger.warning(f"Ошибка запроса к API: {err}, повтор через {delay:.1f} с")
+            await self.__scheduler.wait_async(delay)
+            attempt += 1
+
+    async def _connect(self) -> bool:
+        """Делает GET-запрос, проверяет статус-код ответа"""
+        status, _ = await self.__send()
+        if status != 200:
+            self.logger.error("Ошибка подключения через API")
+            return False
+        self.logger.info("Успешное подключение через API")
+        return True
+
+    async def _get_page(self, key_word: str, page: int, check_status: bool = False) -> dict | None:
+        """Получает одну страницу с данными о вакансиях"""
+        params = {**self.__params, "text": key_word, "page": page}
+        params = {key: str(value).lower() if isinstance(value, bool) else value for key, value in params.items()}
+        status, result = await self.__send(params)
+        self.logger.info(f"Получены данные о вакансиях, страница {page}")
+        if status != 200:
+            self.logger.error("Ошибка подключения через API" if check_status
+                              else f"Ошибка получения данных: статус-код ответа {status}")
+            return None
+        if check_status:
+            self.logger.info("Успешное подключение через API")
+        self.logger.info("Данные о вакансиях преобразованы в json-формат")
+        return result
+
+    async def __get_page_items(self, key_word: str, page: int, semaphore: asyncio.Semaphore) -> tuple[int, list]:
+        """Возвращает номер страницы и вакансии с нее или пустой список при ошибке"""
+        async with semaphore:
+            try:
+                result = await self._get_page(key_word, page)
+                return page, list(result.get("items", [])) if result else []
+            except Exception as err:
+                self.logger.error(f"Ошибка получения данных: {err}")
+                return page, []
+
+    async def _iter_pages(self, key_word: str) -> AsyncIterator[tuple[int, list]]:
+        """Возвращает номера и вакансии страниц по мере получения ответов API"""
+        try:
+            if self.__check_connection and not await self._connect():
+                return
+            first_page = await self._get_page(key_word, 0, check_status=not self.__check_connection)
+        except Exception as err:
+            self.logger.error(f"Ошибка получения данных: {err}")
+            return
+        if first_page is None:
+            return
+        yield 0, list(first_page.get("items", []))
+
+        total_pages = min(first_page.get("pages", 1), self.MAX_PAGES)
+        semaphore = asyncio.Semaphore(self.__max_concurrency)
+        tasks = [asyncio.ensure_future(self.__get_page_items(key_word, page, semaphore))
+                 for page in range(1, total_pages)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def iter_vacancies_data(self, key_word: str) -> AsyncIterator[list]:
+        """Возвращает данные о вакансиях постранично по мере получения ответов API"""
+        async for _, items in self._iter_pages(key_word):
+            yield items
+
+    async def get_vacancies_data(self, key_word: str) -> list:
+        """Обрабатывает GET-запрос и получает данные о вакансиях"""
+        pages = [page async for page in self._iter_pages(key_word)]
+        vacancies_data: list = []
+        for _, items in sorted(pages, key=itemgetter(0)):
+            vacancies_data.extend(items)
+        return vacancies_data
+
+    async def iter_vacancies(self, key_word: str) -> AsyncIterator[Vacancy]:
+        """Возвращает объекты Vacancy постранично по мере получения ответов API"""
+        async for items in self.iter_vacancies_data(key_word):
+            for vacancy in self.iter_format_vacancies(self._filter_by_currency(items)):
+                yield vacancy
+
+    async def get_vacancies(self, key_word: str) -> list[Vacancy]:
+        """Получает данные о вакансиях и возвращает список объектов Vacancy"""
+        vacancies = await self.get_vacancies_data(key_word)
+        return self.format_vacancies(self._filter_by_currency(vacancies))
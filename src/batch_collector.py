@@ -0,0 +1,80 @@
+import asyncio
+import os.path
+from typing import Iterable, Optional
+
+from config import DATA_DIR
+from src.async_api_classes import AsyncHeadHunterVacanciesSource
+from src.class_vacancy import Vacancy
+from src.file_manager import FileManager, JsonVacanciesFileManager
+from src.logging_config import LoggingConfigClassMixin
+
+
+class VacancyBatchCollector(LoggingConfigClassMixin):
+    """Класс для получения вакансий сразу по нескольким поисковым запросам"""
+
+    def __init__(self,
+                 source: Optional[AsyncHeadHunterVacanciesSource] = None,
+                 file_manager: Optional[FileManager] = None) -> None:
+        """
+        Конструктор для пакетного сбора вакансий
+        :source: асинхронный источник вакансий (по умолчанию создается на время сбора)
+        :file_manager: файловый менеджер для сохранения объединенного результата
+        """
+        self.__source = source
+        self.__file_manager = file_manager
+        super().__init__()
+        self.logger = self.configure()
+
+    @property
+    def file_manager(self) -> FileManager:
+        """Возвращает файловый менеджер, создавая JSON-менеджер по умолчанию"""
+        if self.__file_manager is None:
+            self.__file_manager = JsonVacanciesFileManager(os.path.join(DATA_DIR, "vacancies.json"))
+        return self.__file_manager
+
+    @staticmethod
+    def _unique_queries(queries: Iterable[str]) -> list[str]:
+        """Возвращает непустые поисковые запросы без повторов с сохранением порядка"""
+        return list(dict.fromkeys(query.strip() for query in queries if query and query.strip()))
+
+    @staticmethod
+    def _deduplicate(pages: Iterable[list[dict]]) -> list[dict]:
+        """Объединяет данные о вакансиях нескольких запросов, удаляя повторы по id"""
+        unique: dict[str, dict] = {}
+        for vacancies_data in pages:
+            for vac in vacancies_data:
+                unique.setdefault(str(vac.get("id") or ""), vac)
+        return list(unique.values())
+
+    async def __fetch(self, source: AsyncHeadHunterVacanciesSource, queries: list[str]) -> list[dict]:
+        """Параллельно получает данные о вакансиях по всем запросам"""
+        results = await asyncio.gather(*(source.get_vacancies_data(query) for query in queries))
+        return self._deduplicate(results)
+
+    async def collect_async(self, queries: Iterable[str], save: bool = True) -> list[Vacancy]:
+        """
+        Асинхронно получает вакансии по всем запросам, объединяет их и сохраняет одной записью:
+        полученные вакансии заменяют сохраненные с теми же id, остальные вакансии в файле сохраняются.
+        Файл сохраняется в отдельном потоке, чтобы ожидание блокировки файла не останавливало цикл событий
+        """
+        unique_queries = self._unique_queries(queries)
+        if not unique_queries:
+            self.logger.info("Список поисковых запросов пуст")
+            return []
+
+        if self.__source is None:
+            async with AsyncHeadHunterVacanciesSource() as source:
+                vacancies_data = await self.__fetch(source, unique_queries)
+        else:
+            source = self.__source
+            vacancies_data = await self.__fetch(source, unique_queries)
+        self.logger.info(f"По {len(unique_queries)} запросам получено {len(vacancies_data)} уникальных вакансий")
+
+        vacancies = source.format_vacancies(source._filter_by_currency(vacancies_data))
+        if save:
+            await asyncio.to_thread(self.file_manager.update_vacancies, vacancies, [vac.vac_id for vac in vacancies])
+        return vacancies
+
+    def collect(self, queries: Iterable[str], save: bool = True) -> list[Vacancy]:
+        """Получает вакансии по всем запросам, объединяет их и сохраняет одной записью"""
+        return asyncio.run(self.collect_async(queries, save))
@@ -0,0 +1,90 @@
+import time
+from threading import Lock
+from types import TracebackType
+from typing import Iterable, Optional
+
+from src.class_vacancy import Vacancy
+from src.file_manager import FileManager
+from src.logging_config import LoggingConfigClassMixin
+
+
+class BatchedVacancyWriter(LoggingConfigClassMixin):
+    """
+    Накапливает изменения файла с вакансиями и записывает их одним чтением и одной записью файла
+    под межпроцессной блокировкой. Изменения одной вакансии объединяются: добавление после удаления
+    заменяет вакансию, удаление после добавления отменяет добавление
+    :max_pending: количество накопленных изменений, при котором они записываются автоматически
+    :max_delay: время в секундах с первого накопленного изменения, по истечении которого изменения
+    записываются при очередном вызове add_vacancies или remove_vacancies
+    """
+
+    def __init__(self, file_manager: FileManager, max_pending: int = 500, max_delay: float = 5.0) -> None:
+        """Конструктор для пакетной записи изменений в файл"""
+        self.__file_manager = file_manager
+        self.__max_pending = max(1, max_pending)
+        self.__max_delay = max_delay
+        self.__added: dict[str, Vacancy] = {}
+        self.__removed: set[str] = set()
+        self.__first_pending_at: Optional[float] = None
+        self.__lock = Lock()
+        super().__init__()
+        self.logger = self.configure()
+
+    def __enter__(self) -> "BatchedVacancyWriter":
+        """Возвращает объект для использования в контекстном менеджере"""
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> None:
+        """Записывает накопленные изменения при выходе из контекстного менеджера"""
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Возвращает количество накопленных и еще не записанных изменений"""
+        with self.__lock:
+            return len(self.__added) + len(self.__removed)
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """Добавляет вакансии в очередь на запись"""
+        with self.__lock:
+            for vacancy in vacancies:
+                self.__added[vacancy.vac_id] = vacancy
+            self.__touch()
+        self.__flush_if_needed()
+
+    def remove_vacancies(self, vac_ids: Iterable[str]) -> None:
+        """Добавляет id вакансий в очередь на удаление"""
+        with self.__lock:
+            for vac_id in vac_ids:
+                self.__added.pop(vac_id, None)
+                self.__removed.add(vac_id)
+            self.__touch()
+        self.__flush_if_needed()
+
+    def __touch(self) -> None:
+        """Запоминает время первого накопленного изменения"""
+        if self.__first_pending_at is None:
+            self.__first_pending_at = time.monotonic()
+
+    def __flush_if_needed(self) -> None:
+        """Записывает изменения, если их накопилось достаточно или они ждут записи слишком долго"""
+        with self.__lock:
+            pending = len(self.__added) + len(self.__removed)
+            expired = (self.__first_pending_at is not None
+                       and time.monotonic() - self.__first_pending_at >= self.__max_delay)
+        if pending >= self.__max_pending or expired:
+            self.flush()
+
+    def flush(self) -> tuple[int, int]:
+        """Записывает накопленные изменения в файл. Возвращает количество добавленных и удаленных вакансий"""
+        with self.__lock:
+            added, removed = list(self.__added.values()), self.__removed
+            self.__added, self.__removed = {}, set()
+            self.__first_pending_at = None
+        if not added and not removed:
+            return 0, 0
+        self.logger.info(f"Запись накопленных изменений: {len(added)} вакансий добавить, {len(removed)} удалить")
+        return self.__file_manager.update_vacancies(added, removed)
@@ -6,7 +6,7 @@ from typing import Union
 class Vacancy:
     """Класс для создания вакансии"""
     __slots__ = ("__vac_id", "__name", "__url", "__salary_from", "__salary_to", "__employer_name",
-                 "__employer_url", "__requirements", "__area")
+                 "__employer_url", "__requirements", "__area", "__sort_key")
 
     def __init__(self,
                  vac_id: str,
@@ -28,6 +28,7 @@ class Vacancy:
         self.__employer_url = employer_url
         self.__requirements = requirements
         self.__area = area if area else "не указано"
+        self.__sort_key = (self.__salary_from, self.__salary_to)
 
     def __str__(self) -> str:
         """Возвращает строковое представление вакансии для пользователя"""
@@ -47,13 +48,13 @@ class Vacancy:
         """Сравнивает, является ли заработная плата в одной вакансии меньше, чем во второй"""
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.salary_range < other.salary_range
+        return self.__sort_key < other.__sort_key
 
     def __eq__(self, other: object) -> bool:
         """Сравнивает, являются ли заработные платы двух вакансий одинаковыми"""
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.salary_range == other.salary_range
+        return self.__sort_key == other.__sort_key
 
     @property
     def vac_id(self) -> str:
@@ -103,7 +104,15 @@ class Vacancy:
     @property
     def salary_range(self) -> tuple:
         """Возвращает кортеж с нижней и верхней границами заработной платы"""
-        return self.__salary_from, self.__salary_to
+        return self.__sort_key
+
+    @property
+    def sort_key(self) -> tuple[int, int]:
+        """
+        Возвращает вычисленный при создании вакансии ключ сортировки по заработной плате
+        для передачи в sorted(..., key=attrgetter("sort_key"))
+        """
+        return self.__sort_key
 
     @property
     def has_salary_from(self) -> bool:
@@ -0,0 +1,158 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from src.api_classes import HH_MAX_DEPTH, HeadHunterVacanciesSource
+from src.class_vacancy import Vacancy
+from src.logging_config import LoggingConfigClassMixin
+
+
+class QueryPartitioner(ABC, LoggingConfigClassMixin):
+    """
+    Абстрактный класс для получения полного результата широкого запроса: запрос разбивается
+    на подзапросы, каждый из которых укладывается в ограничение API на глубину выдачи
+    """
+
+    def __init__(self, source: Optional[HeadHunterVacanciesSource] = None, max_workers: int = 4) -> None:
+        """
+        Конструктор для разбиения запроса на подзапросы
+        :source: источник вакансий (по умолчанию запрашивает страницы на всю допустимую глубину выдачи)
+        :max_workers: количество подзапросов, выполняемых параллельно
+        """
+        self._source = source or HeadHunterVacanciesSource(max_pages=HH_MAX_DEPTH)
+        self._max_workers = max(1, max_workers)
+        super().__init__()
+        self.logger = self.configure()
+
+    @property
+    def depth(self) -> int:
+        """Возвращает максимальное количество вакансий, которое можно получить одним подзапросом"""
+        return self._source.max_pages * self._source.per_page
+
+    @abstractmethod
+    def split(self, key_word: str) -> list[dict]:
+        """Возвращает дополнительные параметры подзапросов"""
+        pass
+
+    def get_vacancies_data(self, key_word: str) -> list[dict]:
+        """Параллельно выполняет подзапросы и объединяет их результаты без повторов"""
+        partitions = self.split(key_word)
+        self.logger.info(f"Запрос '{key_word}' разбит на {len(partitions)} подзапросов")
+        if not partitions:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(partitions))) as executor:
+            results = list(executor.map(lambda params: self._source.get_vacancies_data(key_word, params), partitions))
+
+        unique: dict[str, dict] = {}
+        for vacancies_data in results:
+            for vac in vacancies_data:
+                unique.setdefault(str(vac.get("id") or ""), vac)
+        self.logger.info(f"По запросу '{key_word}' получено {len(unique)} уникальных вакансий")
+        return list(unique.values())
+
+    def get_vacancies(self, key_word: str) -> list[Vacancy]:
+        """Получает полный результат запроса и возвращает список объектов Vacancy"""
+        vacancies = self.get_vacancies_data(key_word)
+        return self._source.format_vacancies(self._source._filter_by_currency(vacancies))
+
+
+class AreaPartitioner(QueryPartitioner):
+    """Класс для разбиения запроса на подзапросы по регионам"""
+
+    def __init__(self,
+                 areas: Iterable[int | str],
+                 source: Optional[HeadHunterVacanciesSource] = None,
+                 max_workers: int = 4) -> None:
+        """Конструктор для разбиения запроса по списку идентификаторов регионов HeadHunter.ru"""
+        super().__init__(source, max_workers)
+        self.__areas = list(dict.fromkeys(areas))
+
+    def split(self, key_word: str) -> list[dict]:
+        """Возвращает параметры подзапросов по каждому региону"""
+        return [{"area": area} for area in self.__areas]
+
+
+class PublicationDatePartitioner(QueryPartitioner):
+    """
+    Класс для разбиения запроса на подзапросы по интервалам даты публикации: интервал делится пополам,
+    пока количество найденных в нем вакансий превышает глубину выдачи API. Границы интервалов передаются
+    с часовым поясом, так как даты публикации в API указаны с часовым поясом
+    """
+
+    DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+    def __init__(self,
+                 source: Optional[HeadHunterVacanciesSource] = None,
+                 max_workers: int = 4,
+                 period: timedelta = timedelta(days=30),
+                 min_window: timedelta = timedelta(minutes=10),
+                 date_to: Optional[datetime] = None,
+                 count_retries: int = 2) -> None:
+        """
+        Конструктор для разбиения запроса по интервалам даты публикации
+        :period: период публикации вакансий, отсчитываемый назад от date_to
+        :min_window: минимальный интервал, который больше не делится
+        :date_to: окончание периода (по умолчанию текущий момент в UTC); дата без часового пояса
+        считается местным временем
+        :count_retries: количество повторных запросов количества вакансий в интервале при ошибке
+        """
+        super().__init__(source, max_workers)
+        self.__period = period
+        self.__min_window = min_window
+        self.__date_to = date_to
+        self.__count_retries = max(0, count_retries)
+
+    def _window_params(self, start: datetime, end: datetime) -> dict:
+        """Возвращает параметры подзапроса для интервала даты публикации"""
+        return {"date_from": start.strftime(self.DATE_FORMAT), "date_to": end.strftime(self.DATE_FORMAT)}
+
+    def __count(self, executor: ThreadPoolExecutor, key_word: str,
+                windows: list[tuple[datetime, datetime]]) -> list[int]:
+        """
+        Возвращает количество вакансий в каждом интервале, повторяя запросы для интервалов, количество
+        в которых получить не удалось. Если количество так и не получено, выбрасывает RuntimeError,
+        чтобы интервал не был потерян для результата
+        """
+        counts: list[Optional[int]] = [None] * len(windows)
+        pending = list(range(len(windows)))
+        for attempt in range(self.__count_retries + 1):
+            if attempt:
+                self.logger.warning(f"Не удалось получить количество вакансий в {len(pending)} интервалах, "
+                                    f"повторная попытка {attempt}")
+            results = executor.map(
+                lambda index: self._source.count_vacancies(key_word, self._window_params(*windows[index])), pending)
+            for index, found in zip(pending, list(results)):
+                counts[index] = found
+            pending = [index for index in pending if counts[index] is None]
+            if not pending:
+                return [found for found in counts if found is not None]
+        start, end = windows[pending[0]]
+        self.logger.error(f"Не удалось получить количество вакансий в интервале {start} - {end}")
+        raise RuntimeError(f"Не удалось получить количество вакансий в интервале {start} - {end}")
+
+    def split(self, key_word: str) -> list[dict]:
+        """Возвращает параметры подзапросов по интервалам, каждый из которых укладывается в глубину выдачи"""
+        date_to = self.__date_to or datetime.now(timezone.utc)
+        if date_to.tzinfo is None:
+            date_to = date_to.astimezone()
+        date_to = date_to.replace(microsecond=0)
+        level = [(date_to - self.__period, date_to)]
+        windows: list[tuple[datetime, datetime]] = []
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while level:
+                counts = self.__count(executor, key_word, level)
+                next_level = []
+                for (start, end), found in zip(level, counts):
+                    if found == 0:
+                        continue
+                    if found <= self.depth or end - start <= self.__min_window:
+                        if found > self.depth:
+                            self.logger.warning(f"В интервале {start} - {end} найдено {found} вакансий, "
+                                                f"будут получены только первые {self.depth}")
+                        windows.append((start, end))
+                        continue
+                    middle = (start + (end - start) / 2).replace(microsecond=0)
+                    next_level.extend([(start, middle), (middle, end)])
+                level = next_level
+        return [self._window_params(start, end) for start, end in sorted(windows)]
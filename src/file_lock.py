@@ -0,0 +1,128 @@
+import os
+import sys
+import time
+from threading import Lock, RLock
+from types import TracebackType
+from typing import Optional
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    Межпроцессная блокировка на основе отдельного файла блокировки (fcntl.flock, в Windows - msvcrt.locking).
+    Блокировка реентерабельна: поток, владеющий ею, может захватывать ее повторно.
+    Объекты следует получать через for_path, тогда все файловые менеджеры процесса, работающие с одним файлом,
+    используют одну блокировку и потоки процесса также не мешают друг другу
+    """
+
+    __slots__ = ("__path", "__timeout", "__poll_interval", "__thread_lock", "__depth", "__fd")
+
+    __instances: dict[str, "FileLock"] = {}
+    __instances_lock = Lock()
+
+    def __init__(self, path: str, timeout: Optional[float] = None, poll_interval: float = 0.05) -> None:
+        """
+        Конструктор блокировки
+        :path: путь к файлу блокировки
+        :timeout: время ожидания блокировки в секундах (None - ждать без ограничения)
+        :poll_interval: интервал между попытками захватить блокировку, занятую другим процессом
+        """
+        self.__path = path
+        self.__timeout = timeout
+        self.__poll_interval = poll_interval
+        self.__thread_lock = RLock()
+        self.__depth = 0
+        self.__fd: Optional[int] = None
+
+    @classmethod
+    def for_path(cls, path: str) -> "FileLock":
+        """Возвращает общую для процесса блокировку указанного файла блокировки"""
+        key = os.path.abspath(path)
+        with cls.__instances_lock:
+            if key not in cls.__instances:
+                cls.__instances[key] = cls(key)
+            return cls.__instances[key]
+
+    @property
+    def path(self) -> str:
+        """Возвращает путь к файлу блокировки"""
+        return self.__path
+
+    @property
+    def is_locked(self) -> bool:
+        """Проверяет, захвачена ли блокировка этим процессом"""
+        return self.__fd is not None
+
+    def acquire(self) -> None:
+        """Захватывает блокировку, ожидая ее освобождения другими потоками и процессами"""
+        deadline = None if self.__timeout is None else time.monotonic() + self.__timeout
+        if not self.__thread_lock.acquire(timeout=-1 if self.__timeout is None else self.__timeout):
+            raise TimeoutError(f"Не удалось захватить блокировку {self.__path}")
+        try:
+            if self.__depth == 0:
+                self.__fd = self.__lock_file(deadline)
+            self.__depth += 1
+        except BaseException:
+            self.__thread_lock.release()
+            raise
+
+    def release(self) -> None:
+        """Освобождает блокировку"""
+        self.__depth -= 1
+        if self.__depth == 0 and self.__fd is not None:
+            try:
+                self.__unlock(self.__fd)
+            finally:
+                os.close(self.__fd)
+                self.__fd = None
+        self.__thread_lock.release()
+
+    def __enter__(self) -> "FileLock":
+        """Захватывает блокировку при входе в контекстный менеджер"""
+        self.acquire()
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> None:
+        """Освобождает блокировку при выходе из контекстного менеджера"""
+        self.release()
+
+    def __lock_file(self, deadline: Optional[float]) -> int:
+        """Открывает файл блокировки и захватывает его, повторяя попытки, пока файл занят другим процессом"""
+        directory = os.path.dirname(self.__path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(self.__path, os.O_RDWR | os.O_CREAT, 0o666)
+        while True:
+            try:
+                self.__try_lock(fd)
+                return fd
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise TimeoutError(f"Не удалось захватить блокировку {self.__path}")
+                time.sleep(self.__poll_interval)
+
+    @staticmethod
+    def __try_lock(fd: int) -> None:
+        """Пытается захватить файл блокировки без ожидания, если файл занят - выбрасывает OSError"""
+        os.lseek(fd, 0, os.SEEK_SET)
+        if sys.platform == "win32":
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    @staticmethod
+    def __unlock(fd: int) -> None:
+        """Освобождает файл блокировки"""
+        os.lseek(fd, 0, os.SEEK_SET)
+        if sys.platform == "win32":
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_UN)
@@ -1,22 +1,156 @@
 import json
 import os
+import sqlite3
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from contextlib import closing, contextmanager, suppress
+from threading import Lock, get_ident
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Literal, Optional
 
 import pandas as pd
 
 from config import DATA_DIR
 from src.class_vacancy import Vacancy
+from src.file_lock import FileLock
 from src.logging_config import LoggingConfigClassMixin
 
+ParquetCompression = Literal["snappy", "gzip", "brotli", "lz4", "zstd"]
+
+VACANCY_COLUMNS = ("vac_id", "name", "url", "salary_from", "salary_to",
+                   "employer_name", "employer_url", "requirements", "area")
+SALARY_COLUMNS = ("salary_from", "salary_to")
+
+
+def normalize_vacancy_frame(frame: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Оставляет в таблице с вакансиями указанные столбцы (по умолчанию все) и приводит их к единым типам
+    так же, как это делает класс Vacancy: зарплаты - к целым числам (пропуск верхней границы заменяется
+    нижней, пропуск нижней - нулем), остальные столбцы - к строкам
+    """
+    columns = list(columns or VACANCY_COLUMNS)
+    source = frame.reindex(columns=list(dict.fromkeys(columns + [c for c in SALARY_COLUMNS if c in frame])))
+    salaries = {column: pd.to_numeric(source[column], errors="coerce")
+                for column in SALARY_COLUMNS if column in source}
+    if "salary_from" in salaries and "salary_to" in salaries:
+        salaries["salary_to"] = salaries["salary_to"].fillna(salaries["salary_from"])
+    result = pd.DataFrame(index=source.index)
+    for column in columns:
+        if column in salaries:
+            result[column] = salaries[column].fillna(0).astype("int64")
+        else:
+            result[column] = source[column].where(source[column].notna(), "").astype(str)
+    return result
+
+
+def frame_to_vacancies(frame: pd.DataFrame) -> list[Vacancy]:
+    """Создает объекты Vacancy из строк таблицы без промежуточных словарей"""
+    frame = normalize_vacancy_frame(frame).astype(object)
+    return [Vacancy(*row) for row in frame.itertuples(index=False, name=None)]
+
+
+class FsyncPolicy:
+    """
+    Политика сброса записанных данных на диск (fsync):
+    always - после каждой записи; batched - при очередной записи, если с последнего сброса прошло batch_size записей
+    или interval секунд; never - сброс на диск выполняет операционная система.
+    Один объект политики можно передать нескольким файловым менеджерам
+    """
+
+    __slots__ = ("__mode", "__batch_size", "__interval", "__pending", "__last_sync", "__lock")
+
+    ALWAYS = "always"
+    BATCHED = "batched"
+    NEVER = "never"
+    MODES = (ALWAYS, BATCHED, NEVER)
+
+    def __init__(self, mode: str = BATCHED, batch_size: int = 10, interval: float = 1.0) -> None:
+        """Конструктор политики сброса данных на диск"""
+        if mode not in self.MODES:
+            raise ValueError(f"Неизвестная политика fsync: {mode}, допустимые значения: {', '.join(self.MODES)}")
+        self.__mode = mode
+        self.__batch_size = max(1, batch_size)
+        self.__interval = interval
+        self.__pending = 0
+        self.__last_sync = time.monotonic()
+        self.__lock = Lock()
+
+    @property
+    def mode(self) -> str:
+        """Возвращает название политики"""
+        return self.__mode
+
+    def should_sync(self) -> bool:
+        """Учитывает очередную запись и возвращает, нужно ли сбросить ее на диск"""
+        if self.__mode != self.BATCHED:
+            return self.__mode == self.ALWAYS
+        with self.__lock:
+            self.__pending += 1
+            now = time.monotonic()
+            if self.__pending < self.__batch_size and now - self.__last_sync < self.__interval:
+                return False
+            self.__pending = 0
+            self.__last_sync = now
+            return True
+
 
 class FileManager(ABC, LoggingConfigClassMixin):
     """Абстрактный класс для чтения, записи и удаления данных о вакансиях в файлах"""
 
-    def __init__(self) -> None:
-        """Конструктор абстрактного класса"""
+    LOCK_SUFFIX = ".lock"
+    COLUMNS = VACANCY_COLUMNS
+
+    def __init__(self, fsync: FsyncPolicy | str = FsyncPolicy.BATCHED) -> None:
+        """
+        Конструктор абстрактного класса
+        :fsync: политика сброса данных на диск (объект FsyncPolicy или ее название)
+        """
         super().__init__()
         self.logger = self.configure()
+        self.fsync_policy = fsync if isinstance(fsync, FsyncPolicy) else FsyncPolicy(fsync)
+
+    @contextmanager
+    def _atomic_write(self, filename: str) -> Iterator[str]:
+        """
+        Возвращает имя временного файла рядом с filename (с тем же расширением, по которому pandas выбирает формат).
+        После успешной записи временный файл сбрасывается на диск согласно политике fsync и атомарно заменяет
+        filename, при ошибке временный файл удаляется
+        """
+        tmp_filename = f"{filename}.{os.getpid()}.{get_ident()}.tmp{os.path.splitext(filename)[1]}"
+        try:
+            yield tmp_filename
+            sync = self.fsync_policy.should_sync()
+            if sync:
+                self._fsync(tmp_filename)
+            os.replace(tmp_filename, filename)
+            if sync:
+                with suppress(OSError):
+                    self._fsync(os.path.dirname(os.path.abspath(filename)))
+        except BaseException:
+            with suppress(OSError):
+                os.remove(tmp_filename)
+            raise
+
+    @staticmethod
+    def _fsync(path: str) -> None:
+        """Сбрасывает на диск содержимое файла или каталога"""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @property
+    @abstractmethod
+    def filename(self) -> str:
+        """Возвращает путь к файлу с вакансиями"""
+        pass
+
+    def _locked(self) -> FileLock:
+        """
+        Возвращает межпроцессную блокировку файла (файл с суффиксом .lock рядом с ним),
+        которая удерживается на время чтения, изменения и записи файла
+        """
+        return FileLock.for_path(f"{self.filename}{self.LOCK_SUFFIX}")
 
     @abstractmethod
     def read_vacancies(self) -> list[Vacancy]:
@@ -28,31 +162,115 @@ class FileManager(ABC, LoggingConfigClassMixin):
         """Сохраняет данные о вакансиях в файл"""
         pass
 
+    def read_dataframe(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """
+        Возвращает данные о вакансиях в виде таблицы pandas с указанными столбцами (по умолчанию со всеми).
+        Зарплаты в таблице - целые числа, остальные столбцы - строки
+        """
+        records = [self._vacancy_to_dict(vacancy) for vacancy in self.read_vacancies()]
+        return normalize_vacancy_frame(pd.DataFrame(records, columns=list(self.COLUMNS)), columns)
+
+    def _frame_to_vacancies(self, frame: pd.DataFrame) -> list[Vacancy]:
+        """Преобразует строки таблицы в список объектов класса Vacancy"""
+        result = frame_to_vacancies(frame)
+        self.logger.info("Строки таблицы преобразованы в объекты класса Vacancy")
+        return result
+
+    def _empty_frame(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """Возвращает пустую таблицу с указанными столбцами"""
+        return normalize_vacancy_frame(pd.DataFrame(columns=list(self.COLUMNS)), columns)
+
+    def has_vacancy(self, vac_id: str) -> bool:
+        """Проверяет, есть ли в файле вакансия с указанным id"""
+        return self.get_vacancy(vac_id) is not None
+
+    def get_vacancy(self, vac_id: str) -> Optional[Vacancy]:
+        """Возвращает вакансию с указанным id или None, если ее нет в файле"""
+        return next((vac for vac in self.read_vacancies() if vac.vac_id == vac_id), None)
+
     def add_vacancies(self, new_vacancies: list[Vacancy]) -> None:
         """Дозаписывает данные о вакансиях в файл"""
-        data = self.read_vacancies()
-        existing_ids = set(vac.vac_id for vac in data)
-        filtered_new_vacancies = [vac for vac in new_vacancies if vac.vac_id not in existing_ids]
-        if filtered_new_vacancies:
-            data.extend(filtered_new_vacancies)
-            self.save_vacancies(data)
-            self.logger.info(f"Добавлено {len(filtered_new_vacancies)} новых вакансий")
-        else:
-            self.logger.info("Новых вакансий для добавления нет")
+        with self._locked():
+            data = self.read_vacancies()
+            existing_ids = set(vac.vac_id for vac in data)
+            filtered_new_vacancies = [vac for vac in new_vacancies if vac.vac_id not in existing_ids]
+            if filtered_new_vacancies:
+                data.extend(filtered_new_vacancies)
+                self.save_vacancies(data)
+                self.logger.info(f"Добавлено {len(filtered_new_vacancies)} новых вакансий")
+            else:
+                self.logger.info("Новых вакансий для добавления нет")
 
     def remove_vacancies(self, vacancy: Vacancy) -> None:
         """Удаляет данные о вакансии из файла"""
-        data = self.read_vacancies()
-        if not data:
-            self.logger.info("Список вакансий пуст")
-            return
-        updated_data = [v for v in data if v.vac_id != vacancy.vac_id]
+        with self._locked():
+            data = self.read_vacancies()
+            if not data:
+                self.logger.info("Список вакансий пуст")
+                return
+            updated_data = [v for v in data if v.vac_id != vacancy.vac_id]
 
-        if len(updated_data) < len(data):
-            self.save_vacancies(updated_data)
-            self.logger.info(f"Вакансия {vacancy.name} успешно удалена")
-        else:
-            self.logger.info(f"Вакансия {vacancy.name} не найдена")
+            if len(updated_data) < len(data):
+                self.save_vacancies(updated_data)
+                self.logger.info(f"Вакансия {vacancy.name} успешно удалена")
+            else:
+                self.logger.info(f"Вакансия {vacancy.name} не найдена")
+
+    def remove_vacancies_batch(self,
+                               vac_ids: Optional[Iterable[str]] = None,
+                               predicate: Optional[Callable[[Vacancy], bool]] = None) -> tuple[int, int]:
+        """
+        Удаляет вакансии с указанными id и вакансии, удовлетворяющие условию, перезаписывая файл не более одного раза.
+        Возвращает количество удаленных вакансий и количество переданных id, которых нет в файле
+        """
+        ids = set(vac_ids or ())
+        with self._locked():
+            data = self.read_vacancies()
+            updated_data = [vac for vac in data if not self._is_removed(vac, ids, predicate)]
+            removed = len(data) - len(updated_data)
+            missing = len(ids - {vac.vac_id for vac in data})
+            if removed:
+                self.save_vacancies(updated_data)
+        self._log_removed(removed, missing)
+        return removed, missing
+
+    def update_vacancies(self,
+                         new_vacancies: Iterable[Vacancy] = (),
+                         removed_ids: Iterable[str] = ()) -> tuple[int, int]:
+        """
+        Удаляет вакансии с указанными id и добавляет новые вакансии за одно чтение и одну запись файла.
+        Вакансия, id которой есть среди удаляемых, заменяется новой. Возвращает количество добавленных
+        и удаленных вакансий
+        """
+        ids = set(removed_ids)
+        with self._locked():
+            data = self.read_vacancies()
+            updated_data = [vac for vac in data if vac.vac_id not in ids]
+            existing_ids = {vac.vac_id for vac in updated_data}
+            added = 0
+            for vacancy in new_vacancies:
+                if vacancy.vac_id not in existing_ids:
+                    existing_ids.add(vacancy.vac_id)
+                    updated_data.append(vacancy)
+                    added += 1
+            removed = len(data) - (len(updated_data) - added)
+            if added or removed:
+                self.save_vacancies(updated_data)
+        self._log_updated(added, removed)
+        return added, removed
+
+    @staticmethod
+    def _is_removed(vacancy: Vacancy, ids: set[str], predicate: Optional[Callable[[Vacancy], bool]]) -> bool:
+        """Проверяет, подлежит ли вакансия удалению по id или по условию"""
+        return vacancy.vac_id in ids or (predicate is not None and predicate(vacancy))
+
+    def _log_removed(self, removed: int, missing: int) -> None:
+        """Записывает в лог результат удаления вакансий"""
+        self.logger.info(f"Удалено вакансий: {removed}, не найдено: {missing}")
+
+    def _log_updated(self, added: int, removed: int) -> None:
+        """Записывает в лог результат изменения файла"""
+        self.logger.info(f"Добавлено вакансий: {added}, удалено: {removed}")
 
     def _vacancy_to_dict(self, vacancy: Vacancy) -> dict[str, Any]:
         """Преобразует объект класса Vacancy в словарь"""
@@ -89,12 +307,17 @@ class FileManager(ABC, LoggingConfigClassMixin):
 class JsonVacanciesFileManager(FileManager):
     """Класс для работы с вакансиями в JSON-файле"""
 
-    def __init__(self, filename: Optional[str]) -> None:
+    def __init__(self, filename: Optional[str], fsync: FsyncPolicy | str = FsyncPolicy.BATCHED) -> None:
         """Конструктор для инициализации объектов класса"""
-        super().__init__()
+        super().__init__(fsync)
         self.__filename = os.path.join(DATA_DIR, "vacancies.json") if not filename else filename
         self.__create_file_if_not_exists()
 
+    @property
+    def filename(self) -> str:
+        """Возвращает путь к файлу с вакансиями"""
+        return self.__filename
+
     def __create_file_if_not_exists(self) -> None:
         """Создаёт JSON-файл, если он не существует"""
         directory = os.path.dirname(self.__filename)
@@ -119,11 +342,21 @@ class JsonVacanciesFileManager(FileManager):
             self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
             return []
 
+    def read_dataframe(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """Возвращает данные о вакансиях из JSON-файла в виде таблицы pandas"""
+        try:
+            with open(self.__filename, encoding="utf-8") as f:
+                return normalize_vacancy_frame(pd.DataFrame(json.load(f), columns=list(self.COLUMNS)), columns)
+        except Exception as err:
+            self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
+            return self._empty_frame(columns)
+
     def save_vacancies(self, vacancies: list[Vacancy]) -> None:
         """Сохраняет данные о вакансиях в JSON-файл"""
         try:
             self.logger.info(f"Файл {self.__filename} открыт для редактирования")
-            with open(self.__filename, "w", encoding="utf-8") as f:
+            with (self._locked(), self._atomic_write(self.__filename) as tmp_filename,
+                  open(tmp_filename, "w", encoding="utf-8") as f):
                 json.dump(self._vacancies_to_dicts(vacancies), f, ensure_ascii=False, indent=2)
             self.logger.info(f"Данные о вакансиях сохранены в файл {self.__filename}")
 
@@ -134,12 +367,17 @@ class JsonVacanciesFileManager(FileManager):
 class CSVVacanciesFileManager(FileManager):
     """Класс для работы с вакансиями в CSV-файле"""
 
-    def __init__(self, filename: Optional[str]) -> None:
+    def __init__(self, filename: Optional[str], fsync: FsyncPolicy | str = FsyncPolicy.BATCHED) -> None:
         """Конструктор для инициализации объектов класса"""
-        super().__init__()
+        super().__init__(fsync)
         self.__filename = os.path.join(DATA_DIR, "vacancies.csv") if not filename else filename
         self.__create_file_if_not_exists()
 
+    @property
+    def filename(self) -> str:
+        """Возвращает путь к файлу с вакансиями"""
+        return self.__filename
+
     def __create_file_if_not_exists(self) -> None:
         """Создаёт CSV-файл, если он не существует"""
         if not os.path.exists(self.__filename):
@@ -153,13 +391,23 @@ class CSVVacanciesFileManager(FileManager):
             pd.DataFrame(columns=columns).to_csv(self.__filename, index=False, encoding="utf-8")
             self.logger.info(f"Создан файл {self.__filename}")
 
+    def read_dataframe(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """Возвращает данные о вакансиях из CSV-файла в виде таблицы pandas, разбирая только указанные столбцы"""
+        try:
+            data = pd.read_csv(self.__filename, encoding="utf-8", usecols=columns,
+                               dtype={column: str for column in self.COLUMNS if column not in SALARY_COLUMNS})
+            return normalize_vacancy_frame(data, columns)
+        except Exception as err:
+            self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
+            return self._empty_frame(columns)
+
     def read_vacancies(self) -> list[Vacancy]:
         """Возвращает данные о вакансиях из CSV-файла"""
         try:
             self.logger.info(f"Файл {self.__filename} открыт для чтения")
-            data = pd.read_csv(self.__filename, encoding="utf-8")
-            records = [{str(key): value for key, value in row.items()} for row in data.to_dict(orient="records")]
-            return self._dicts_to_vacancies(records)
+            data = pd.read_csv(self.__filename, encoding="utf-8",
+                               dtype={column: str for column in self.COLUMNS if column not in SALARY_COLUMNS})
+            return self._frame_to_vacancies(data)
 
         except FileNotFoundError:
             self.logger.error(f"Файл {self.__filename} не найден")
@@ -177,7 +425,8 @@ class CSVVacanciesFileManager(FileManager):
             self.logger.info(f"Файл {self.__filename} открыт для редактирования")
             data = self._vacancies_to_dicts(vacancies)
             df = pd.DataFrame(data)
-            df.to_csv(self.__filename, index=False, encoding="utf-8")
+            with self._locked(), self._atomic_write(self.__filename) as tmp_filename:
+                df.to_csv(tmp_filename, index=False, encoding="utf-8")
             self.logger.info(f"Данные о вакансиях сохранены в файл {self.__filename}")
 
         except Exception as err:
@@ -187,12 +436,17 @@ class CSVVacanciesFileManager(FileManager):
 class XLSXVacanciesFileManager(FileManager):
     """Класс для работы с вакансиями в XLSX-файле"""
 
-    def __init__(self, filename: Optional[str]) -> None:
+    def __init__(self, filename: Optional[str], fsync: FsyncPolicy | str = FsyncPolicy.BATCHED) -> None:
         """Конструктор для инициализации объектов класса"""
-        super().__init__()
+        super().__init__(fsync)
         self.__filename = os.path.join(DATA_DIR, "vacancies.xlsx") if not filename else filename
         self.__create_file_if_not_exists()
 
+    @property
+    def filename(self) -> str:
+        """Возвращает путь к файлу с вакансиями"""
+        return self.__filename
+
     def __create_file_if_not_exists(self) -> None:
         """Создаёт XLSX-файл, если он не существует"""
         if not os.path.exists(self.__filename):
@@ -206,13 +460,23 @@ class XLSXVacanciesFileManager(FileManager):
             pd.DataFrame(columns=columns).to_excel(self.__filename, index=False)
             self.logger.info(f"Создан файл {self.__filename}")
 
+    def read_dataframe(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """Возвращает данные о вакансиях из XLSX-файла в виде таблицы pandas, разбирая только указанные столбцы"""
+        try:
+            data = pd.read_excel(self.__filename, usecols=columns,
+                                 dtype={column: str for column in self.COLUMNS if column not in SALARY_COLUMNS})
+            return normalize_vacancy_frame(data, columns)
+        except Exception as err:
+            self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
+            return self._empty_frame(columns)
+
     def read_vacancies(self) -> list[Vacancy]:
         """Возвращает данные о вакансиях из XLSX-файла"""
         try:
             self.logger.info(f"Файл {self.__filename} открыт для чтения")
-            data = pd.read_excel(self.__filename)
-            records = [{str(key): value for key, value in row.items()} for row in data.to_dict(orient="records")]
-            return self._dicts_to_vacancies(records)
+            data = pd.read_excel(self.__filename,
+                                 dtype={column: str for column in self.COLUMNS if column not in SALARY_COLUMNS})
+            return self._frame_to_vacancies(data)
 
         except FileNotFoundError:
             self.logger.error(f"Файл {self.__filename} не найден")
@@ -230,8 +494,679 @@ class XLSXVacanciesFileManager(FileManager):
             self.logger.info(f"Файл {self.__filename} открыт для редактирования")
             data = self._vacancies_to_dicts(vacancies)
             df = pd.DataFrame(data)
-            df.to_excel(self.__filename, index=False, engine="openpyxl")
+            with self._locked(), self._atomic_write(self.__filename) as tmp_filename:
+                df.to_excel(tmp_filename, index=False, engine="openpyxl")
+            self.logger.info(f"Данные о вакансиях сохранены в файл {self.__filename}")
+
+        except Exception as err:
+            self.logger.error(f"Ошибка записи файла {self.__filename}: {err}")
+
+
+class ParquetVacanciesFileManager(FileManager):
+    """
+    Класс для работы с вакансиями в файле формата Parquet: столбцы с зарплатами хранятся как целые числа,
+    данные сжимаются, а метод read_dataframe читает из файла только нужные столбцы
+    :compression: алгоритм сжатия (zstd, snappy, gzip, brotli, lz4 или None)
+    """
+
+    DTYPES = {column: "Int64" if column in SALARY_COLUMNS else "string" for column in VACANCY_COLUMNS}
+
+    def __init__(self,
+                 filename: Optional[str],
+                 compression: Optional[ParquetCompression] = "zstd",
+                 fsync: FsyncPolicy | str = FsyncPolicy.BATCHED) -> None:
+        """Конструктор для инициализации объектов класса"""
+        super().__init__(fsync)
+        self.__filename = os.path.join(DATA_DIR, "vacancies.parquet") if not filename else filename
+        self.__compression = compression
+        self.__create_file_if_not_exists()
+
+    @property
+    def filename(self) -> str:
+        """Возвращает путь к файлу с вакансиями"""
+        return self.__filename
+
+    def __create_file_if_not_exists(self) -> None:
+        """Создаёт Parquet-файл со схемой столбцов, если он не существует"""
+        if not os.path.exists(self.__filename):
+            directory = os.path.dirname(self.__filename)
+            if directory:
+                os.makedirs(os.path.dirname(self.__filename) or ".", exist_ok=True)
+            self.__write_frame(self.__to_frame([]))
+            self.logger.info(f"Создан файл {self.__filename}")
+
+    def __to_frame(self, vacancies: list[Vacancy]) -> pd.DataFrame:
+        """Преобразует список объектов Vacancy в таблицу с типизированными столбцами"""
+        return pd.DataFrame(self._vacancies_to_dicts(vacancies), columns=list(self.COLUMNS)).astype(self.DTYPES)
+
+    def __write_frame(self, df: pd.DataFrame) -> None:
+        """Атомарно записывает таблицу в Parquet-файл"""
+        with self._locked(), self._atomic_write(self.__filename) as tmp_filename:
+            df.to_parquet(tmp_filename, engine="pyarrow", compression=self.__compression, index=False)
+
+    def read_dataframe(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """Возвращает данные о вакансиях в виде таблицы pandas, читая из файла только указанные столбцы"""
+        try:
+            data = pd.read_parquet(self.__filename, engine="pyarrow", columns=columns)
+            return normalize_vacancy_frame(data, columns)
+        except Exception as err:
+            self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
+            return self._empty_frame(columns)
+
+    def read_vacancies(self) -> list[Vacancy]:
+        """Возвращает данные о вакансиях из Parquet-файла"""
+        try:
+            self.logger.info(f"Файл {self.__filename} открыт для чтения")
+            return self._frame_to_vacancies(pd.read_parquet(self.__filename, engine="pyarrow"))
+
+        except FileNotFoundError:
+            self.logger.error(f"Файл {self.__filename} не найден")
+            return []
+        except Exception as err:
+            self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
+            return []
+
+    def save_vacancies(self, vacancies: list[Vacancy]) -> None:
+        """Сохраняет данные о вакансиях в Parquet-файл"""
+        try:
+            self.logger.info(f"Файл {self.__filename} открыт для редактирования")
+            self.__write_frame(self.__to_frame(vacancies))
             self.logger.info(f"Данные о вакансиях сохранены в файл {self.__filename}")
 
         except Exception as err:
             self.logger.error(f"Ошибка записи файла {self.__filename}: {err}")
+
+
+class JsonLinesVacanciesFileManager(FileManager):
+    """
+    Класс для работы с вакансиями в файле формата JSON Lines (одна вакансия на строку).
+    Новые вакансии дозаписываются в конец файла, удаление записывает в конец файла отметку об удалении,
+    а сжатие файла (compact) переписывает его без удаленных вакансий.
+    Рядом с файлом хранится индекс (файл с суффиксом .idx): смещения строк неудаленных вакансий по их id,
+    поэтому проверка наличия, чтение, добавление и удаление вакансии не требуют чтения всего файла
+    :compact_ratio: доля ненужных строк файла (удаленных вакансий и отметок об их удалении), при превышении
+    которой файл сжимается автоматически
+    """
+
+    DELETED_KEY = "_deleted"
+    INDEX_SUFFIX = ".idx"
+    INDEX_MIN_REWRITE_LINES = 1000
+
+    def __init__(self,
+                 filename: Optional[str],
+                 compact_ratio: float = 0.5,
+                 fsync: FsyncPolicy | str = FsyncPolicy.BATCHED) -> None:
+        """Конструктор для инициализации объектов класса"""
+        super().__init__(fsync)
+        self.__filename = os.path.join(DATA_DIR, "vacancies.jsonl") if not filename else filename
+        self.__index_filename = f"{self.__filename}{self.INDEX_SUFFIX}"
+        self.__compact_ratio = compact_ratio
+        self.__offsets: dict[str, int] = {}
+        self.__lines = 0
+        self.__tombstones = 0
+        self.__index_signature: Optional[tuple[int, int]] = None
+        self.__index_lines = 0
+        self.__create_file_if_not_exists()
+
+    @property
+    def filename(self) -> str:
+        """Возвращает путь к файлу с вакансиями"""
+        return self.__filename
+
+    def __create_file_if_not_exists(self) -> None:
+        """Создаёт JSONL-файл, если он не существует"""
+        if not os.path.exists(self.__filename):
+            directory = os.path.dirname(self.__filename)
+            if directory:
+                os.makedirs(os.path.dirname(self.__filename) or ".", exist_ok=True)
+            open(self.__filename, "w", encoding="utf-8").close()
+            self.logger.info(f"Создан файл {self.__filename}")
+
+    def __scan(self, f: BinaryIO, start: int = 0) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Возвращает смещения строк и записи открытого файла по одной, начиная с указанного смещения"""
+        f.seek(start)
+        offset = start
+        for line in f:
+            line_offset, offset = offset, offset + len(line)
+            if not line.strip():
+                continue
+            try:
+                yield line_offset, json.loads(line)
+            except json.JSONDecodeError as err:
+                self.logger.error(f"Ошибка чтения строки со смещением {line_offset} "
+                                  f"файла {self.__filename}: {err}")
+
+    def __signature(self) -> tuple[int, int]:
+        """Возвращает размер и время изменения файла для проверки актуальности индекса"""
+        stat = os.stat(self.__filename)
+        return stat.st_size, stat.st_mtime_ns
+
+    def __apply(self, vac_id: str, offset: int) -> None:
+        """Учитывает в индексе строку файла: вакансию (offset >= 0) или отметку об удалении (offset < 0)"""
+        self.__lines += 1
+        if offset < 0:
+            self.__tombstones += 1
+            self.__offsets.pop(vac_id, None)
+        else:
+            self.__offsets[vac_id] = offset
+
+    def __entry(self, offset: int, record: dict[str, Any]) -> list:
+        """Возвращает запись индекса для строки файла"""
+        return [str(record.get("vac_id")), -1 if record.get(self.DELETED_KEY) else offset]
+
+    def __checkpoint(self) -> str:
+        """Возвращает строку индекса с размером и временем изменения файла, которым он соответствует"""
+        size, mtime_ns = self.__index_signature = self.__signature()
+        checkpoint = {"size": size, "mtime_ns": mtime_ns, "lines": self.__lines, "tombstones": self.__tombstones}
+        return json.dumps(checkpoint) + "\n"
+
+    def __load_index(self) -> Optional[int]:
+        """
+        Загружает индекс из файла. Записи индекса учитываются только до последней отметки о размере файла.
+        Возвращает размер файла, которому соответствует индекс, или None, если индекс отсутствует или поврежден
+        """
+        self.__offsets, self.__lines, self.__tombstones = {}, 0, 0
+        try:
+            with open(self.__index_filename, encoding="utf-8") as f:
+                items = [json.loads(line) for line in f]
+            last = max((position for position, item in enumerate(items) if isinstance(item, dict)), default=None)
+            if last is None:
+                return None
+            offsets: dict[str, int] = {}
+            for item in items[:last]:
+                if isinstance(item, dict):
+                    continue
+                if item[1] < 0:
+                    offsets.pop(item[0], None)
+                else:
+                    offsets[item[0]] = item[1]
+            checkpoint = items[last]
+            lines, tombstones = checkpoint["lines"], checkpoint["tombstones"]
+            covered = (checkpoint["size"], checkpoint["mtime_ns"])
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            return None
+        self.__offsets, self.__lines, self.__tombstones = offsets, lines, tombstones
+        self.__index_lines = len(items)
+        size, mtime_ns = self.__signature()
+        if covered[0] > size or (covered[0] == size and covered[1] != mtime_ns):
+            return None
+        if covered[0] and covered[0] < size:
+            with open(self.__filename, "rb") as data_file:
+                data_file.seek(covered[0] - 1)
+                if data_file.read(1) != b"\n":
+                    return None
+        self.__index_signature = covered
+        return int(covered[0])
+
+    def __write_index(self) -> None:
+        """Переписывает файл индекса по текущему состоянию индекса"""
+        tmp_filename = f"{self.__index_filename}.{os.getpid()}.{get_ident()}.tmp"
+        with open(tmp_filename, "w", encoding="utf-8") as f:
+            f.write("".join(json.dumps([vac_id, offset]) + "\n" for vac_id, offset in self.__offsets.items()))
+            f.write(self.__checkpoint())
+        os.replace(tmp_filename, self.__index_filename)
+        self.__index_lines = len(self.__offsets) + 1
+
+    def __append_index(self, entries: list[list]) -> None:
+        """
+        Дозаписывает в файл индекса записи о новых строках файла. Если строк в файле индекса (записей
+        и отметок о размере файла) стало больше чем вдвое против неудаленных вакансий, файл индекса
+        переписывается, чтобы его загрузка не замедлялась
+        """
+        index_lines = self.__index_lines + len(entries) + 1
+        if index_lines > max(2 * len(self.__offsets), self.INDEX_MIN_REWRITE_LINES):
+            self.__write_index()
+            return
+        with open(self.__index_filename, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(entry) + "\n" for entry in entries) + self.__checkpoint())
+        self.__index_lines = index_lines
+
+    def __index(self) -> dict[str, int]:
+        """
+        Возвращает смещения строк неудаленных вакансий по их id. Индекс хранится в памяти и в файле рядом с данными;
+        если файл с данными был дозаписан без обновления индекса, в индекс добавляются только новые строки,
+        при других изменениях индекс строится заново
+        """
+        if self.__index_signature is not None and self.__index_signature == self.__signature():
+            return self.__offsets
+        with self._locked():
+            covered = self.__load_index()
+            if covered is None:
+                self.__offsets, self.__lines, self.__tombstones = {}, 0, 0
+            elif self.__index_signature == self.__signature():
+                return self.__offsets
+            with open(self.__filename, "rb") as f:
+                entries = [self.__entry(offset, record) for offset, record in self.__scan(f, covered or 0)]
+            for vac_id, offset in entries:
+                self.__apply(vac_id, offset)
+            if covered is None:
+                self.__write_index()
+                self.logger.info(f"Построен индекс файла {self.__filename}")
+            else:
+                self.__append_index(entries)
+        return self.__offsets
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Возвращает данные о неудаленных вакансиях в виде словарей, читая файл построчно"""
+        with self._locked():
+            live_offsets = set(self.__index().values())
+            f = open(self.__filename, "rb")
+        with f:
+            for offset, record in self.__scan(f):
+                if offset in live_offsets:
+                    yield record
+
+    def iter_vacancies(self) -> Iterator[Vacancy]:
+        """Возвращает объекты Vacancy по одному, читая файл построчно"""
+        for record in self.iter_records():
+            yield self._dict_to_vacancy(record)
+
+    def read_vacancies(self) -> list[Vacancy]:
+        """Возвращает данные о вакансиях из JSONL-файла"""
+        try:
+            self.logger.info(f"Файл {self.__filename} открыт для чтения")
+            return list(self.iter_vacancies())
+        except Exception as err:
+            self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
+            return []
+
+    def read_dataframe(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """Возвращает данные о неудаленных вакансиях из JSONL-файла в виде таблицы pandas"""
+        try:
+            data = pd.DataFrame(list(self.iter_records()), columns=list(self.COLUMNS))
+            return normalize_vacancy_frame(data, columns)
+        except Exception as err:
+            self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
+            return self._empty_frame(columns)
+
+    def has_vacancy(self, vac_id: str) -> bool:
+        """Проверяет по индексу, есть ли в файле вакансия с указанным id"""
+        return vac_id in self.__index()
+
+    def get_vacancy(self, vac_id: str) -> Optional[Vacancy]:
+        """Читает из файла только строку с вакансией, найденную по индексу"""
+        with self._locked():
+            offset = self.__index().get(vac_id)
+            if offset is None:
+                return None
+            with open(self.__filename, "rb") as f:
+                f.seek(offset)
+                line = f.readline()
+        return self._dict_to_vacancy(json.loads(line))
+
+    def __rewrite(self, records: Iterable[dict[str, Any]]) -> None:
+        """Атомарно заменяет содержимое файла записями, строит по ним индекс и сохраняет его"""
+        self.__index_signature = None
+        self.__offsets, self.__lines, self.__tombstones = {}, 0, 0
+        with self._atomic_write(self.__filename) as tmp_filename, open(tmp_filename, "wb") as f:
+            for record in records:
+                self.__apply(str(record.get("vac_id")), f.tell())
+                f.write((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+        self.__write_index()
+
+    def save_vacancies(self, vacancies: list[Vacancy]) -> None:
+        """Сохраняет данные о вакансиях в JSONL-файл, заменяя его содержимое"""
+        try:
+            self.logger.info(f"Файл {self.__filename} открыт для редактирования")
+            with self._locked():
+                self.__rewrite(self._vacancy_to_dict(vacancy) for vacancy in vacancies)
+            self.logger.info(f"Данные о вакансиях сохранены в файл {self.__filename}")
+
+        except Exception as err:
+            self.logger.error(f"Ошибка записи файла {self.__filename}: {err}")
+
+    def __append(self, records: list[dict[str, Any]]) -> None:
+        """Дозаписывает записи в конец файла и в индекс"""
+        self.__index()
+        entries = []
+        with open(self.__filename, "a+b") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            for record in records:
+                entries.append(self.__entry(f.tell(), record))
+                f.write((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+            if self.fsync_policy.should_sync():
+                f.flush()
+                os.fsync(f.fileno())
+        for vac_id, offset in entries:
+            self.__apply(vac_id, offset)
+        self.__append_index(entries)
+
+    def add_vacancies(self, new_vacancies: list[Vacancy]) -> None:
+        """Дозаписывает в конец файла вакансии, которых в нем еще нет"""
+        with self._locked():
+            records = self.__new_records(new_vacancies, self.__index())
+            if records:
+                self.__append(records)
+        if records:
+            self.logger.info(f"Добавлено {len(records)} новых вакансий")
+        else:
+            self.logger.info("Новых вакансий для добавления нет")
+
+    def __new_records(self, new_vacancies: Iterable[Vacancy], existing_ids: Iterable[str]) -> list[dict[str, Any]]:
+        """Возвращает записи для вакансий, id которых нет среди существующих, без повторов"""
+        skipped_ids = set(existing_ids)
+        records = []
+        for vacancy in new_vacancies:
+            if vacancy.vac_id not in skipped_ids:
+                skipped_ids.add(vacancy.vac_id)
+                records.append(self._vacancy_to_dict(vacancy))
+        return records
+
+    def remove_vacancies(self, vacancy: Vacancy) -> None:
+        """Записывает в конец файла отметку об удалении вакансии"""
+        with self._locked():
+            if vacancy.vac_id not in self.__index():
+                self.logger.info(f"Вакансия {vacancy.name} не найдена")
+                return
+            self.__append([{"vac_id": vacancy.vac_id, self.DELETED_KEY: True}])
+            self.logger.info(f"Вакансия {vacancy.name} успешно удалена")
+            self.__compact_if_needed()
+
+    def __compact_if_needed(self) -> None:
+        """
+        Сжимает файл, если доля ненужных строк превысила заданную. Каждой отметке об удалении
+        предшествует строка удаленной вакансии, поэтому ненужных строк вдвое больше, чем отметок
+        """
+        if 2 * self.__tombstones > self.__lines * self.__compact_ratio:
+            self.compact()
+
+    def remove_vacancies_batch(self,
+                               vac_ids: Optional[Iterable[str]] = None,
+                               predicate: Optional[Callable[[Vacancy], bool]] = None) -> tuple[int, int]:
+        """
+        Записывает в конец файла отметки об удалении вакансий с указанными id и вакансий, удовлетворяющих условию,
+        одной дозаписью. Возвращает количество удаленных вакансий и количество переданных id, которых нет в файле
+        """
+        ids = dict.fromkeys(vac_ids or ())
+        with self._locked():
+            offsets = self.__index()
+            removed_ids = dict.fromkeys(vac_id for vac_id in ids if vac_id in offsets)
+            missing = len(ids) - len(removed_ids)
+            if predicate is not None:
+                removed_ids.update(dict.fromkeys(vac.vac_id for vac in self.iter_vacancies() if predicate(vac)))
+            if removed_ids:
+                self.__append([{"vac_id": vac_id, self.DELETED_KEY: True} for vac_id in removed_ids])
+                self.__compact_if_needed()
+        self._log_removed(len(removed_ids), missing)
+        return len(removed_ids), missing
+
+    def update_vacancies(self,
+                         new_vacancies: Iterable[Vacancy] = (),
+                         removed_ids: Iterable[str] = ()) -> tuple[int, int]:
+        """
+        Записывает в конец файла отметки об удалении вакансий с указанными id и новые вакансии одной дозаписью.
+        Вакансия, id которой есть среди удаляемых, заменяется новой. Возвращает количество добавленных
+        и удаленных вакансий
+        """
+        with self._locked():
+            offsets = self.__index()
+            tombstones = [{"vac_id": vac_id, self.DELETED_KEY: True}
+                          for vac_id in dict.fromkeys(removed_ids) if vac_id in offsets]
+            removed = {record["vac_id"] for record in tombstones}
+            records = self.__new_records(new_vacancies, (vac_id for vac_id in offsets if vac_id not in removed))
+            if tombstones or records:
+                self.__append(tombstones + records)
+                self.__compact_if_needed()
+        self._log_updated(len(records), len(tombstones))
+        return len(records), len(tombstones)
+
+    def compact(self) -> None:
+        """Переписывает файл без удаленных вакансий и отметок об удалении"""
+        try:
+            with self._locked(), open(self.__filename, "rb") as f:
+                live_offsets = set(self.__index().values())
+                self.__rewrite(record for offset, record in self.__scan(f) if offset in live_offsets)
+            self.logger.info(f"Файл {self.__filename} сжат")
+        except Exception as err:
+            self.logger.error(f"Ошибка сжатия файла {self.__filename}: {err}")
+
+
+class SQLiteVacanciesFileManager(FileManager):
+    """
+    Класс для работы с вакансиями в базе данных SQLite: первичный ключ по vac_id, индексы по зарплате,
+    региону и компании, полнотекстовый индекс FTS5 по названию и требованиям вакансии
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS vacancies (
+            vac_id TEXT PRIMARY KEY,
+            name TEXT NOT NULL DEFAULT '',
+            url TEXT NOT NULL DEFAULT '',
+            salary_from INTEGER NOT NULL DEFAULT 0,
+            salary_to INTEGER NOT NULL DEFAULT 0,
+            employer_name TEXT NOT NULL DEFAULT '',
+            employer_url TEXT NOT NULL DEFAULT '',
+            requirements TEXT NOT NULL DEFAULT '',
+            area TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS idx_vacancies_salary_from ON vacancies (salary_from);
+        CREATE INDEX IF NOT EXISTS idx_vacancies_salary_to ON vacancies (salary_to);
+        CREATE INDEX IF NOT EXISTS idx_vacancies_area ON vacancies (area);
+        CREATE INDEX IF NOT EXISTS idx_vacancies_employer_name ON vacancies (employer_name);
+        CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5 (
+            name, requirements, content='vacancies', content_rowid='rowid', tokenize='unicode61'
+        );
+        CREATE TRIGGER IF NOT EXISTS vacancies_ai AFTER INSERT ON vacancies BEGIN
+            INSERT INTO vacancies_fts (rowid, name, requirements) VALUES (new.rowid, new.name, new.requirements);
+        END;
+        CREATE TRIGGER IF NOT EXISTS vacancies_ad AFTER DELETE ON vacancies BEGIN
+            INSERT INTO vacancies_fts (vacancies_fts, rowid, name, requirements)
+            VALUES ('delete', old.rowid, old.name, old.requirements);
+        END;
+        CREATE TRIGGER IF NOT EXISTS vacancies_au AFTER UPDATE ON vacancies BEGIN
+            INSERT INTO vacancies_fts (vacancies_fts, rowid, name, requirements)
+            VALUES ('delete', old.rowid, old.name, old.requirements);
+            INSERT INTO vacancies_fts (rowid, name, requirements) VALUES (new.rowid, new.name, new.requirements);
+        END;
+    """
+
+    def __init__(self, filename: Optional[str], fsync: FsyncPolicy | str = FsyncPolicy.BATCHED) -> None:
+        """Конструктор для инициализации объектов класса"""
+        super().__init__(fsync)
+        self.__filename = os.path.join(DATA_DIR, "vacancies.db") if not filename else filename
+        self.__create_file_if_not_exists()
+
+    @property
+    def filename(self) -> str:
+        """Возвращает путь к файлу с вакансиями"""
+        return self.__filename
+
+    SYNCHRONOUS = {FsyncPolicy.ALWAYS: "FULL", FsyncPolicy.BATCHED: "NORMAL", FsyncPolicy.NEVER: "OFF"}
+
+    def __connect(self) -> sqlite3.Connection:
+        """Открывает соединение с базой данных с режимом синхронизации, соответствующим политике fsync"""
+        connection = sqlite3.connect(self.__filename)
+        connection.row_factory = sqlite3.Row
+        connection.execute(f"PRAGMA synchronous = {self.SYNCHRONOUS[self.fsync_policy.mode]}")
+        return connection
+
+    def __create_file_if_not_exists(self) -> None:
+        """Создаёт файл базы данных и таблицы, если они не существуют"""
+        directory = os.path.dirname(self.__filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        is_new = not os.path.exists(self.__filename)
+        with closing(self.__connect()) as connection, connection:
+            connection.executescript(self.SCHEMA)
+        if is_new:
+            self.logger.info(f"Создан файл {self.__filename}")
+
+    def __rows_to_vacancies(self, rows: list[sqlite3.Row]) -> list[Vacancy]:
+        """Преобразует строки таблицы в список объектов Vacancy"""
+        return self._dicts_to_vacancies([dict(row) for row in rows])
+
+    def __vacancy_to_row(self, vacancy: Vacancy) -> tuple:
+        """Преобразует объект Vacancy в строку таблицы"""
+        vacancy_dict = self._vacancy_to_dict(vacancy)
+        return tuple(vacancy_dict[column] for column in self.COLUMNS)
+
+    def read_vacancies(self) -> list[Vacancy]:
+        """Возвращает данные о вакансиях из базы данных"""
+        try:
+            self.logger.info(f"Файл {self.__filename} открыт для чтения")
+            with closing(self.__connect()) as connection:
+                rows = connection.execute(f"SELECT {', '.join(self.COLUMNS)} FROM vacancies ORDER BY rowid").fetchall()
+            return self.__rows_to_vacancies(rows)
+        except sqlite3.Error as err:
+            self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
+            return []
+
+    def read_dataframe(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """Возвращает данные о вакансиях из базы данных в виде таблицы pandas, выбирая только указанные столбцы"""
+        selected = [column for column in (columns or self.COLUMNS) if column in self.COLUMNS]
+        try:
+            with closing(self.__connect()) as connection:
+                data = pd.read_sql_query(f"SELECT {', '.join(selected)} FROM vacancies ORDER BY rowid", connection)
+            return normalize_vacancy_frame(data, columns)
+        except (sqlite3.Error, pd.errors.DatabaseError) as err:
+            self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
+            return self._empty_frame(columns)
+
+    def save_vacancies(self, vacancies: list[Vacancy]) -> None:
+        """Сохраняет данные о вакансиях в базу данных, заменяя ее содержимое"""
+        try:
+            self.logger.info(f"Файл {self.__filename} открыт для редактирования")
+            with closing(self.__connect()) as connection, connection:
+                connection.execute("DELETE FROM vacancies")
+                connection.executemany(self.__upsert_sql(), [self.__vacancy_to_row(vac) for vac in vacancies])
+            self.logger.info(f"Данные о вакансиях сохранены в файл {self.__filename}")
+        except sqlite3.Error as err:
+            self.logger.error(f"Ошибка записи файла {self.__filename}: {err}")
+
+    def has_vacancy(self, vac_id: str) -> bool:
+        """Проверяет по первичному ключу, есть ли в базе данных вакансия с указанным id"""
+        try:
+            with closing(self.__connect()) as connection:
+                return connection.execute("SELECT 1 FROM vacancies WHERE vac_id = ?", (vac_id,)).fetchone() is not None
+        except sqlite3.Error as err:
+            self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
+            return False
+
+    def get_vacancy(self, vac_id: str) -> Optional[Vacancy]:
+        """Возвращает вакансию, найденную по первичному ключу, или None"""
+        try:
+            with closing(self.__connect()) as connection:
+                row = connection.execute(f"SELECT {', '.join(self.COLUMNS)} FROM vacancies WHERE vac_id = ?",
+                                         (vac_id,)).fetchone()
+        except sqlite3.Error as err:
+            self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
+            return None
+        return None if row is None else self._dict_to_vacancy(dict(row))
+
+    def __upsert_sql(self) -> str:
+        """Возвращает SQL-запрос для добавления или обновления вакансии по vac_id"""
+        updates = ", ".join(f"{column} = excluded.{column}" for column in self.COLUMNS[1:])
+        return (f"INSERT INTO vacancies ({', '.join(self.COLUMNS)}) VALUES ({', '.join('?' * len(self.COLUMNS))}) "
+                f"ON CONFLICT (vac_id) DO UPDATE SET {updates}")
+
+    def add_vacancies(self, new_vacancies: list[Vacancy]) -> None:
+        """Добавляет новые вакансии и обновляет данные уже сохраненных вакансий"""
+        try:
+            with closing(self.__connect()) as connection, connection:
+                connection.executemany(self.__upsert_sql(), [self.__vacancy_to_row(vac) for vac in new_vacancies])
+            self.logger.info(f"Добавлено или обновлено {len(new_vacancies)} вакансий")
+        except sqlite3.Error as err:
+            self.logger.error(f"Ошибка записи файла {self.__filename}: {err}")
+
+    def remove_vacancies(self, vacancy: Vacancy) -> None:
+        """Удаляет данные о вакансии из базы данных"""
+        try:
+            with closing(self.__connect()) as connection, connection:
+                removed = connection.execute("DELETE FROM vacancies WHERE vac_id = ?", (vacancy.vac_id,)).rowcount
+        except sqlite3.Error as err:
+            self.logger.error(f"Ошибка записи файла {self.__filename}: {err}")
+            return
+        if removed:
+            self.logger.info(f"Вакансия {vacancy.name} успешно удалена")
+        else:
+            self.logger.info(f"Вакансия {vacancy.name} не найдена")
+
+    def remove_vacancies_batch(self,
+                               vac_ids: Optional[Iterable[str]] = None,
+                               predicate: Optional[Callable[[Vacancy], bool]] = None) -> tuple[int, int]:
+        """
+        Удаляет вакансии с указанными id и вакансии, удовлетворяющие условию, в одной транзакции.
+        Возвращает количество удаленных вакансий и количество переданных id, которых нет в базе данных
+        """
+        ids = list(dict.fromkeys(vac_ids or ()))
+        try:
+            with closing(self.__connect()) as connection, connection:
+                removed = connection.executemany("DELETE FROM vacancies WHERE vac_id = ?",
+                                                 [(vac_id,) for vac_id in ids]).rowcount if ids else 0
+                missing = len(ids) - removed
+                if predicate is not None:
+                    rows = connection.execute(f"SELECT {', '.join(self.COLUMNS)} FROM vacancies").fetchall()
+                    matched = [(vac.vac_id,) for vac in self.__rows_to_vacancies(rows) if predicate(vac)]
+                    if matched:
+                        removed += connection.executemany("DELETE FROM vacancies WHERE vac_id = ?", matched).rowcount
+        except sqlite3.Error as err:
+            self.logger.error(f"Ошибка записи файла {self.__filename}: {err}")
+            return 0, 0
+        self._log_removed(removed, missing)
+        return removed, missing
+
+    def update_vacancies(self,
+                         new_vacancies: Iterable[Vacancy] = (),
+                         removed_ids: Iterable[str] = ()) -> tuple[int, int]:
+        """
+        Удаляет вакансии с указанными id и добавляет или обновляет новые вакансии в одной транзакции.
+        Возвращает количество добавленных или обновленных вакансий и количество удаленных вакансий
+        """
+        ids = [(vac_id,) for vac_id in dict.fromkeys(removed_ids)]
+        rows = [self.__vacancy_to_row(vac) for vac in {vac.vac_id: vac for vac in new_vacancies}.values()]
+        try:
+            with closing(self.__connect()) as connection, connection:
+                removed = connection.executemany("DELETE FROM vacancies WHERE vac_id = ?", ids).rowcount if ids else 0
+                if rows:
+                    connection.executemany(self.__upsert_sql(), rows)
+        except sqlite3.Error as err:
+            self.logger.error(f"Ошибка записи файла {self.__filename}: {err}")
+            return 0, 0
+        self._log_updated(len(rows), removed)
+        return len(rows), removed
+
+    @staticmethod
+    def _fts_query(filter_words: list[str]) -> str:
+        """Формирует запрос FTS5, находящий вакансии хотя бы с одним из ключевых слов"""
+        return " OR ".join('"' + word.replace('"', '""') + '"' for word in filter_words if word.strip())
+
+    def find_vacancies(self,
+                       filter_words: Optional[list[str]] = None,
+                       min_salary: Optional[int] = None,
+                       max_salary: Optional[int] = None,
+                       sort: bool = True) -> list[Vacancy]:
+        """
+        Фильтрует вакансии средствами базы данных
+        :filter_words: ключевые слова, хотя бы одно из которых должно быть в названии или требованиях
+        :min_salary: нижняя граница для нижнего порога заработной платы
+        :max_salary: верхняя граница для верхнего порога заработной платы
+        :sort: сортировать ли вакансии по убыванию заработной платы
+        """
+        conditions = []
+        params: list[Any] = []
+        fts_query = self._fts_query(filter_words or [])
+        if fts_query:
+            conditions.append("rowid IN (SELECT rowid FROM vacancies_fts WHERE vacancies_fts MATCH ?)")
+            params.append(fts_query)
+        if min_salary is not None:
+            conditions.append("salary_from >= ?")
+            params.append(min_salary)
+        if max_salary is not None:
+            conditions.append("salary_to <= ?")
+            params.append(max_salary)
+        sql = f"SELECT {', '.join(self.COLUMNS)} FROM vacancies"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY salary_from DESC, salary_to DESC, rowid" if sort else " ORDER BY rowid"
+        try:
+            with closing(self.__connect()) as connection:
+                rows = connection.execute(sql, params).fetchall()
+        except sqlite3.Error as err:
+            self.logger.error(f"Ошибка чтения файла {self.__filename}: {err}")
+            return []
+        self.logger.info(f"Из базы данных получено {len(rows)} вакансий")
+        return self.__rows_to_vacancies(rows)
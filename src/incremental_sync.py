@@ -0,0 +1,163 @@
+import json
+import os
+from datetime import datetime
+from typing import Optional
+
+from config import DATA_DIR
+from src.api_classes import HeadHunterVacanciesSource
+from src.class_vacancy import Vacancy
+from src.file_manager import FileManager, JsonVacanciesFileManager
+from src.logging_config import LoggingConfigClassMixin
+
+
+class IncrementalVacancyCollector(LoggingConfigClassMixin):
+    """
+    Класс для инкрементального получения вакансий: для каждого запроса запоминается дата публикации
+    самой новой полученной вакансии, и при следующем запуске запрашиваются только более новые вакансии.
+    Если новых вакансий больше глубины выдачи API, они запрашиваются несколькими интервалами от новых
+    к старым (параметр date_to). Отметка сдвигается, только если все вакансии после нее получены:
+    иначе вакансии между старой отметкой и самой старой полученной вакансией были бы пропущены
+    """
+
+    DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+    def __init__(self,
+                 source: Optional[HeadHunterVacanciesSource] = None,
+                 file_manager: Optional[FileManager] = None,
+                 state_file: Optional[str] = None,
+                 max_windows: int = 10) -> None:
+        """
+        Конструктор для инкрементального получения вакансий
+        :source: источник вакансий
+        :file_manager: файловый менеджер, в который дозаписываются новые вакансии
+        :state_file: JSON-файл с датами публикации последних полученных вакансий по запросам
+        :max_windows: максимальное количество интервалов, которыми запрашиваются новые вакансии за один запуск
+        """
+        self.__source = source or HeadHunterVacanciesSource()
+        self.__file_manager = file_manager or JsonVacanciesFileManager(os.path.join(DATA_DIR, "vacancies.json"))
+        self.__state_file = state_file or os.path.join(DATA_DIR, "sync_state.json")
+        self.__max_windows = max(1, max_windows)
+        super().__init__()
+        self.logger = self.configure()
+
+    @staticmethod
+    def _normalize(search_query: str) -> str:
+        """Приводит поисковый запрос к единому виду для использования в качестве ключа"""
+        return " ".join(search_query.lower().split())
+
+    def _read_state(self) -> dict[str, str]:
+        """Возвращает даты публикации последних полученных вакансий по запросам"""
+        try:
+            with open(self.__state_file, encoding="utf-8") as f:
+                state: dict[str, str] = json.load(f)
+            return state
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as err:
+            self.logger.error(f"Ошибка чтения файла {self.__state_file}: {err}")
+            return {}
+
+    def _save_state(self, state: dict[str, str]) -> None:
+        """Сохраняет даты публикации последних полученных вакансий по запросам"""
+        try:
+            os.makedirs(os.path.dirname(self.__state_file) or ".", exist_ok=True)
+            with open(self.__state_file, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+        except Exception as err:
+            self.logger.error(f"Ошибка записи файла {self.__state_file}: {err}")
+
+    def get_watermark(self, search_query: str) -> Optional[str]:
+        """Возвращает дату публикации самой новой полученной по запросу вакансии"""
+        return self._read_state().get(self._normalize(search_query))
+
+    def reset(self, search_query: str) -> None:
+        """Сбрасывает дату публикации для запроса, чтобы следующий запуск получил все вакансии"""
+        state = self._read_state()
+        if state.pop(self._normalize(search_query), None) is not None:
+            self._save_state(state)
+
+    @classmethod
+    def _latest_published_at(cls, vacancies_data: list[dict], watermark: Optional[str]) -> Optional[str]:
+        """Возвращает наибольшую дату публикации среди полученных вакансий и предыдущей отметки"""
+        latest = watermark
+        latest_dt = cls.__parse_date(watermark)
+        for vac in vacancies_data:
+            published_at = vac.get("published_at")
+            published_dt = cls.__parse_date(published_at)
+            if published_dt and (latest_dt is None or published_dt > latest_dt):
+                latest, latest_dt = published_at, published_dt
+        return latest
+
+    @classmethod
+    def _oldest_published_at(cls, vacancies_data: list[dict]) -> Optional[str]:
+        """Возвращает наименьшую дату публикации среди полученных вакансий"""
+        oldest, oldest_dt = None, None
+        for vac in vacancies_data:
+            published_at = vac.get("published_at")
+            published_dt = cls.__parse_date(published_at)
+            if published_dt and (oldest_dt is None or published_dt < oldest_dt):
+                oldest, oldest_dt = published_at, published_dt
+        return oldest
+
+    @classmethod
+    def __parse_date(cls, value: Optional[str]) -> Optional[datetime]:
+        """Преобразует дату публикации из формата API в объект datetime"""
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, cls.DATE_FORMAT)
+        except ValueError:
+            return None
+
+    def sync(self, search_query: str) -> list[Vacancy]:
+        """Получает вакансии, опубликованные после предыдущего запуска, и дозаписывает их в файл"""
+        state = self._read_state()
+        key = self._normalize(search_query)
+        watermark = state.get(key)
+        self.logger.info(f"Получение вакансий по запросу '{search_query}' начиная с {watermark or 'начала'}")
+
+        vacancies_data, complete = self.__fetch_since(search_query, watermark)
+        vacancies = self.__source.format_vacancies(self.__source._filter_by_currency(vacancies_data))
+        if vacancies:
+            self.__file_manager.add_vacancies(vacancies)
+
+        if not complete:
+            self.logger.warning(f"Вакансии по запросу '{search_query}' получены не полностью, "
+                                f"отметка {watermark or 'начала'} не изменена")
+            return vacancies
+        latest = self._latest_published_at(vacancies_data, watermark)
+        if latest and latest != watermark:
+            state[key] = latest
+            self._save_state(state)
+        return vacancies
+
+    def __fetch_since(self, search_query: str, watermark: Optional[str]) -> tuple[list[dict], bool]:
+        """
+        Получает вакансии, опубликованные после отметки, интервалами от новых к старым. Возвращает данные
+        о вакансиях без повторов и признак того, что получены все вакансии после отметки
+        """
+        collected: dict[str, dict] = {}
+        date_to: Optional[str] = None
+        for _ in range(self.__max_windows):
+            extra_params = {"order_by": "publication_time"}
+            if watermark:
+                extra_params["date_from"] = watermark
+            if date_to:
+                extra_params["date_to"] = date_to
+            vacancies_data, found, failed_pages = self.__source.fetch_vacancies_data(search_query, extra_params)
+            new_data = [vac for vac in vacancies_data if str(vac.get("id") or "") not in collected]
+            for vac in new_data:
+                collected[str(vac.get("id") or "")] = vac
+            if failed_pages:
+                self.logger.error(f"Не удалось получить {failed_pages} страниц по запросу '{search_query}'")
+                break
+            if len(vacancies_data) >= found:
+                return list(collected.values()), True
+            oldest = self._oldest_published_at(vacancies_data)
+            if not new_data or oldest is None or oldest == date_to:
+                self.logger.warning(f"Вакансии по запросу '{search_query}' до {oldest} не помещаются в глубину выдачи")
+                break
+            self.logger.info(f"Найдено {found} вакансий, получено {len(vacancies_data)}, "
+                             f"запрашиваются вакансии до {oldest}")
+            date_to = oldest
+        return list(collected.values()), False
@@ -0,0 +1,91 @@
+import re
+from itertools import count
+from typing import Iterable, Iterator, Literal
+
+from src.class_vacancy import Vacancy
+
+KeywordMatch = Literal["any", "all"]
+
+
+class KeywordIndex:
+    """
+    Инвертированный индекс вакансий по словам названия и требований: для каждого слова (в нижнем регистре)
+    хранится множество номеров вакансий, в тексте которых оно встречается. Запрос по ключевым словам
+    выполняется объединением (любое слово) или пересечением (все слова) этих множеств без просмотра текстов.
+    Ключевые слова, которые не являются одним словом (фразы, регулярные выражения), проверяются по текстам
+    вакансий, как и раньше.
+    Вакансии нумеруются в порядке добавления, результаты запроса возвращаются в этом порядке
+    """
+
+    TOKEN_PATTERN = re.compile(r"\w+")
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()) -> None:
+        """Конструктор индекса, индексирует переданные вакансии"""
+        self.__postings: dict[str, set[int]] = {}
+        self.__vacancies: dict[int, Vacancy] = {}
+        self.__positions: dict[str, set[int]] = {}
+        self.__counter = count()
+        self.add(vacancies)
+
+    def __len__(self) -> int:
+        """Возвращает количество проиндексированных вакансий"""
+        return len(self.__vacancies)
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        """Возвращает проиндексированные вакансии в порядке добавления"""
+        return iter(self.__vacancies.values())
+
+    @staticmethod
+    def text(vacancy: Vacancy) -> str:
+        """Возвращает текст вакансии, по которому выполняется поиск"""
+        return f"{vacancy.name} {vacancy.requirements}"
+
+    @classmethod
+    def tokenize(cls, text: str) -> set[str]:
+        """Разбивает текст на слова в нижнем регистре"""
+        return set(cls.TOKEN_PATTERN.findall(text.lower()))
+
+    def add(self, vacancies: Iterable[Vacancy]) -> None:
+        """Добавляет вакансии в индекс"""
+        for vacancy in vacancies:
+            position = next(self.__counter)
+            self.__vacancies[position] = vacancy
+            self.__positions.setdefault(vacancy.vac_id, set()).add(position)
+            for token in self.tokenize(self.text(vacancy)):
+                self.__postings.setdefault(token, set()).add(position)
+
+    def remove(self, vac_ids: Iterable[str]) -> int:
+        """Удаляет вакансии с указанными id из индекса. Возвращает количество удаленных вакансий"""
+        removed = 0
+        for vac_id in vac_ids:
+            for position in self.__positions.pop(vac_id, ()):
+                vacancy = self.__vacancies.pop(position)
+                for token in self.tokenize(self.text(vacancy)):
+                    posting = self.__postings[token]
+                    posting.discard(position)
+                    if not posting:
+                        del self.__postings[token]
+                removed += 1
+        return removed
+
+    def search(self, filter_words: list[str], match: KeywordMatch = "any") -> list[Vacancy]:
+        """
+        Возвращает вакансии, в названии или требованиях которых встречается любое (match="any")
+        или каждое (match="all") из ключевых слов. Пустой список ключевых слов не ограничивает результат
+        """
+        if not filter_words:
+            return list(self.__vacancies.values())
+        postings = sorted((self.__posting(word) for word in filter_words), key=len)
+        if match == "all":
+            found = set(postings[0]).intersection(*postings[1:])
+        else:
+            found = set().union(*postings)
+        return [self.__vacancies[position] for position in sorted(found)]
+
+    def __posting(self, word: str) -> set[int]:
+        """Возвращает номера вакансий, содержащих ключевое слово"""
+        token = word.lower()
+        if self.TOKEN_PATTERN.fullmatch(token):
+            return self.__postings.get(token, set())
+        pattern = re.compile(r"\b(?:" + word + r")\b", re.IGNORECASE)
+        return {position for position, vacancy in self.__vacancies.items() if pattern.search(self.text(vacancy))}
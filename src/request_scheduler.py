@@ -0,0 +1,113 @@
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Optional
+
+from src.logging_config import LoggingConfigClassMixin
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class RequestScheduler(LoggingConfigClassMixin):
+    """
+    Планировщик запросов к API с ограничением частоты (token bucket) и экспоненциальной задержкой повторов
+    :requests_per_second: допустимое количество запросов в секунду для всех источников, использующих планировщик
+    :burst: максимальное количество запросов, которое можно выполнить подряд без ожидания
+    :max_retries: количество повторов запроса при ответах 429 и 5xx
+    :base_delay: базовая задержка перед повтором в секундах
+    :max_delay: максимальная задержка перед повтором в секундах
+    """
+
+    __shared_scheduler: Optional["RequestScheduler"] = None
+    __shared_scheduler_lock = Lock()
+
+    def __init__(self,
+                 requests_per_second: float = 10,
+                 burst: Optional[int] = None,
+                 max_retries: int = 4,
+                 base_delay: float = 0.5,
+                 max_delay: float = 30) -> None:
+        """Конструктор для планировщика запросов"""
+        self.__rate = max(requests_per_second, 1e-6)
+        self.__capacity = float(burst if burst is not None else max(1, int(self.__rate)))
+        self.__tokens = self.__capacity
+        self.__updated_at = time.monotonic()
+        self.__paused_until = 0.0
+        self.__lock = Lock()
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        super().__init__()
+        self.logger = self.configure()
+
+    @classmethod
+    def shared(cls) -> "RequestScheduler":
+        """Возвращает общий для всех источников планировщик запросов"""
+        with cls.__shared_scheduler_lock:
+            if cls.__shared_scheduler is None:
+                cls.__shared_scheduler = cls()
+            return cls.__shared_scheduler
+
+    def _reserve(self) -> float:
+        """Резервирует место для запроса и возвращает время ожидания до его выполнения в секундах"""
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated_at) * self.__rate)
+            self.__updated_at = now
+            self.__tokens -= 1
+            wait = max(0.0, -self.__tokens / self.__rate)
+            return max(wait, self.__paused_until - now)
+
+    def acquire(self) -> None:
+        """Ожидает возможности выполнить запрос"""
+        self.wait(self._reserve())
+
+    async def acquire_async(self) -> None:
+        """Асинхронно ожидает возможности выполнить запрос"""
+        await self.wait_async(self._reserve())
+
+    @staticmethod
+    def wait(delay: float) -> None:
+        """Приостанавливает выполнение на заданное время"""
+        if delay > 0:
+            time.sleep(delay)
+
+    @staticmethod
+    async def wait_async(delay: float) -> None:
+        """Асинхронно приостанавливает выполнение на заданное время"""
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def should_retry(status_code: int) -> bool:
+        """Проверяет, нужно ли повторить запрос с заданным статус-кодом ответа"""
+        return status_code in RETRY_STATUS_CODES
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Возвращает задержку перед повтором: по заголовку Retry-After или экспоненциальную со случайным разбросом"""
+        delay = self._parse_retry_after(retry_after)
+        if delay is not None:
+            return min(delay, self.max_delay)
+        cap = min(self.max_delay, self.base_delay * 2.0 ** attempt)
+        return cap / 2 + random.uniform(0, cap / 2)
+
+    def penalize(self, delay: float) -> None:
+        """Приостанавливает выдачу запросов всем источникам после ответа о превышении лимита"""
+        with self.__lock:
+            self.__paused_until = max(self.__paused_until, time.monotonic() + delay)
+        self.logger.warning(f"Превышен лимит запросов к API, запросы приостановлены на {delay:.1f} с")
+
+    @staticmethod
+    def _parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+        """Преобразует значение заголовка Retry-After в секунды"""
+        if not retry_after:
+            return None
+        retry_after = retry_after.strip()
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
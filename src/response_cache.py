@@ -0,0 +1,127 @@
+import hashlib
+import json
+import os
+import time
+from threading import Lock, get_ident
+from typing import Any, Mapping, Optional
+
+from config import CACHE_DIR
+from src.logging_config import LoggingConfigClassMixin
+
+
+class ResponseCache(LoggingConfigClassMixin):
+    """
+    Дисковый кэш ответов API с ограниченным временем жизни и вытеснением давно не используемых записей
+    :cache_dir: каталог для хранения записей кэша
+    :ttl: время жизни записи в секундах, после которого она проверяется повторно
+    :max_entries: максимальное количество записей в кэше
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: float = 600, max_entries: int = 500) -> None:
+        """Конструктор для кэша ответов API"""
+        self.__cache_dir = cache_dir or CACHE_DIR
+        self.__ttl = ttl
+        self.__max_entries = max(1, max_entries)
+        self.__lock = Lock()
+        os.makedirs(self.__cache_dir, exist_ok=True)
+        super().__init__()
+        self.logger = self.configure()
+
+    @staticmethod
+    def make_key(params: Mapping[str, Any]) -> str:
+        """
+        Формирует ключ записи по всем параметрам запроса: ответы на запросы, отличающиеся любым параметром
+        (например, date_from или order_by), хранятся в разных записях
+        """
+        raw_key = json.dumps(dict(params), ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    def __path(self, params: Mapping[str, Any]) -> str:
+        """Возвращает путь к файлу записи"""
+        return os.path.join(self.__cache_dir, f"{self.make_key(params)}.json")
+
+    def get(self, params: Mapping[str, Any]) -> Optional[dict[str, Any]]:
+        """Возвращает запись кэша (в том числе устаревшую) или None"""
+        path = self.__path(params)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry: dict[str, Any] = json.load(f)
+            os.utime(path)
+            return entry
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError) as err:
+            self.logger.error(f"Ошибка чтения записи кэша {path}: {err}")
+            return None
+
+    def is_fresh(self, entry: Mapping[str, Any]) -> bool:
+        """Проверяет, не истекло ли время жизни записи"""
+        return time.time() - float(entry.get("stored_at", 0)) < self.__ttl
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Mapping[str, Any]]) -> dict[str, str]:
+        """Возвращает заголовки для условного запроса по сохраненным ETag и Last-Modified"""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def set(self, params: Mapping[str, Any], data: Any, response_headers: Optional[Mapping[str, str]] = None) -> None:
+        """Сохраняет ответ API в кэш и вытесняет лишние записи"""
+        response_headers = response_headers or {}
+        entry = {"stored_at": time.time(),
+                 "etag": response_headers.get("ETag"),
+                 "last_modified": response_headers.get("Last-Modified"),
+                 "data": data}
+        self.__write(self.__path(params), entry)
+        self.__evict()
+
+    def refresh(self, params: Mapping[str, Any], entry: dict[str, Any]) -> None:
+        """Продлевает время жизни записи после ответа 304 Not Modified"""
+        entry["stored_at"] = time.time()
+        self.__write(self.__path(params), entry)
+
+    def clear(self) -> None:
+        """Удаляет все записи кэша"""
+        with self.__lock:
+            for name in os.listdir(self.__cache_dir):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.__cache_dir, name))
+        self.logger.info("Кэш ответов API очищен")
+
+    def __len__(self) -> int:
+        """Возвращает количество записей в кэше"""
+        return len([name for name in os.listdir(self.__cache_dir) if name.endswith(".json")])
+
+    def __write(self, path: str, entry: Mapping[str, Any]) -> None:
+        """Записывает запись кэша через временный файл"""
+        tmp_path = f"{path}.{os.getpid()}.{get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as err:
+            self.logger.error(f"Ошибка записи кэша {path}: {err}")
+
+    def __evict(self) -> None:
+        """Удаляет давно не использованные записи сверх максимального количества"""
+        with self.__lock:
+            entries = []
+            for name in os.listdir(self.__cache_dir):
+                if name.endswith(".json"):
+                    path = os.path.join(self.__cache_dir, name)
+                    try:
+                        entries.append((os.path.getmtime(path), path))
+                    except OSError:
+                        continue
+            if len(entries) <= self.__max_entries:
+                return
+            entries.sort()
+            for _, path in entries[:len(entries) - self.__max_entries]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+            self.logger.info(f"Из кэша вытеснено {len(entries) - self.__max_entries} записей")
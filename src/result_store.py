@@ -0,0 +1,112 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from src.class_vacancy import Vacancy
+from src.logging_config import LoggingConfigClassMixin
+from src.vacancy_manager import VacancyManager
+
+
+class QueryResultStore(LoggingConfigClassMixin):
+    """
+    Хранилище результатов поисковых запросов в памяти процесса. Результат хранится вместе с менеджером
+    вакансий, поэтому индексы, построенные при первом уточнении запроса, используются при следующих уточнениях
+    :ttl: время жизни результата в секундах
+    :max_vacancies: максимальное суммарное количество хранимых вакансий, сверх которого
+    вытесняются давно не использованные результаты
+    """
+
+    __shared_store: Optional["QueryResultStore"] = None
+    __shared_store_lock = Lock()
+
+    def __init__(self, ttl: float = 900, max_vacancies: int = 100_000) -> None:
+        """Конструктор для хранилища результатов запросов"""
+        self.__ttl = ttl
+        self.__max_vacancies = max(0, max_vacancies)
+        self.__results: OrderedDict[str, tuple[float, int, VacancyManager]] = OrderedDict()
+        self.__size = 0
+        self.__lock = Lock()
+        super().__init__()
+        self.logger = self.configure()
+
+    @classmethod
+    def shared(cls) -> "QueryResultStore":
+        """Возвращает общее для процесса хранилище результатов"""
+        with cls.__shared_store_lock:
+            if cls.__shared_store is None:
+                cls.__shared_store = cls()
+            return cls.__shared_store
+
+    @staticmethod
+    def _normalize(search_query: str) -> str:
+        """Приводит поисковый запрос к единому виду для использования в качестве ключа"""
+        return " ".join(search_query.lower().split())
+
+    def __len__(self) -> int:
+        """Возвращает количество сохраненных результатов"""
+        return len(self.__results)
+
+    @property
+    def size(self) -> int:
+        """Возвращает суммарное количество хранимых вакансий"""
+        return self.__size
+
+    def get(self, search_query: str) -> Optional[list[Vacancy]]:
+        """Возвращает сохраненный результат запроса или None, если его нет или он устарел"""
+        manager = self.get_manager(search_query)
+        return None if manager is None else list(manager.vacancies)
+
+    def get_manager(self, search_query: str) -> Optional[VacancyManager]:
+        """
+        Возвращает менеджер вакансий сохраненного результата запроса или None, если результата нет
+        или он устарел. Менеджер общий для всех, кто запрашивает этот результат, поэтому вакансии
+        в нем не изменяются, а только отбираются
+        """
+        key = self._normalize(search_query)
+        with self.__lock:
+            result = self.__results.get(key)
+            if result is None:
+                return None
+            stored_at, _, manager = result
+            if time.monotonic() - stored_at >= self.__ttl:
+                self.__pop(key)
+                return None
+            self.__results.move_to_end(key)
+        self.logger.info(f"Результат запроса '{search_query}' получен из памяти")
+        return manager
+
+    def put(self, search_query: str, vacancies: list[Vacancy]) -> Optional[VacancyManager]:
+        """
+        Сохраняет результат запроса и вытесняет давно не использованные результаты.
+        Возвращает менеджер вакансий сохраненного результата или None, если результат не сохранен
+        """
+        key = self._normalize(search_query)
+        if len(vacancies) > self.__max_vacancies:
+            self.logger.info(f"Результат запроса '{search_query}' слишком велик для хранения в памяти")
+            return None
+        manager = VacancyManager(vacancies)
+        with self.__lock:
+            self.__pop(key)
+            self.__results[key] = (time.monotonic(), len(vacancies), manager)
+            self.__size += len(vacancies)
+            while self.__size > self.__max_vacancies:
+                self.__pop(next(iter(self.__results)))
+        return manager
+
+    def invalidate(self, search_query: str) -> None:
+        """Удаляет результат запроса из хранилища"""
+        with self.__lock:
+            self.__pop(self._normalize(search_query))
+
+    def clear(self) -> None:
+        """Удаляет все результаты из хранилища"""
+        with self.__lock:
+            self.__results.clear()
+            self.__size = 0
+
+    def __pop(self, key: str) -> None:
+        """Удаляет результат по ключу с учетом размера хранилища"""
+        result = self.__results.pop(key, None)
+        if result is not None:
+            self.__size -= result[1]
@@ -0,0 +1,106 @@
+from bisect import bisect_left
+from heapq import merge
+from itertools import count
+from typing import Iterable, Iterator
+
+from src.class_vacancy import Vacancy
+
+SalaryKey = tuple[int, int, int]
+
+
+class SalaryIndex:
+    """
+    Индекс вакансий по заработной плате: вакансии хранятся упорядоченными по убыванию нижней, затем верхней
+    границы зарплаты (вакансии с равными зарплатами - в порядке добавления). Выборка по диапазону зарплат
+    находит двоичным поиском вакансии, нижняя граница зарплаты которых попадает в диапазон, и отбрасывает
+    среди них вакансии с верхней границей выше диапазона, то есть выполняется за O(log N + m), где m - число
+    вакансий с нижней границей в диапазоне. Вакансии возвращаются уже отсортированными по убыванию.
+    Вакансии, у которых верхняя граница меньше нижней, дополнительно хранятся в отдельном списке,
+    так как они могут попасть в диапазон, не попадая в него нижней границей
+    """
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()) -> None:
+        """Конструктор индекса, индексирует переданные вакансии"""
+        self.__keys: list[SalaryKey] = []
+        self.__vacancies: list[Vacancy] = []
+        self.__inverted_keys: list[SalaryKey] = []
+        self.__inverted: list[Vacancy] = []
+        self.__positions: dict[str, list[SalaryKey]] = {}
+        self.__counter = count()
+        self.__bulk_load(vacancies)
+
+    def __len__(self) -> int:
+        """Возвращает количество проиндексированных вакансий"""
+        return len(self.__vacancies)
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        """Возвращает вакансии в порядке убывания заработной платы"""
+        return iter(self.__vacancies)
+
+    def __key(self, vacancy: Vacancy) -> SalaryKey:
+        """Возвращает ключ упорядочивания вакансии и запоминает его для удаления по id"""
+        salary_from, salary_to = vacancy.sort_key
+        key = (-salary_from, -salary_to, next(self.__counter))
+        self.__positions.setdefault(vacancy.vac_id, []).append(key)
+        return key
+
+    def __bulk_load(self, vacancies: Iterable[Vacancy]) -> None:
+        """Индексирует вакансии одной сортировкой"""
+        entries = sorted(((self.__key(vacancy), vacancy) for vacancy in vacancies), key=lambda entry: entry[0])
+        self.__keys = [key for key, _ in entries]
+        self.__vacancies = [vacancy for _, vacancy in entries]
+        inverted = [(key, vacancy) for key, vacancy in entries if key[1] > key[0]]
+        self.__inverted_keys = [key for key, _ in inverted]
+        self.__inverted = [vacancy for _, vacancy in inverted]
+
+    def add(self, vacancies: Iterable[Vacancy]) -> None:
+        """Добавляет вакансии в индекс"""
+        for vacancy in vacancies:
+            key = self.__key(vacancy)
+            self.__insert(self.__keys, self.__vacancies, key, vacancy)
+            if key[1] > key[0]:
+                self.__insert(self.__inverted_keys, self.__inverted, key, vacancy)
+
+    def remove(self, vac_ids: Iterable[str]) -> int:
+        """Удаляет вакансии с указанными id из индекса. Возвращает количество удаленных вакансий"""
+        removed = 0
+        for vac_id in vac_ids:
+            for key in self.__positions.pop(vac_id, ()):
+                self.__delete(self.__keys, self.__vacancies, key)
+                if key[1] > key[0]:
+                    self.__delete(self.__inverted_keys, self.__inverted, key)
+                removed += 1
+        return removed
+
+    @staticmethod
+    def __insert(keys: list[SalaryKey], vacancies: list[Vacancy], key: SalaryKey, vacancy: Vacancy) -> None:
+        """Вставляет вакансию в упорядоченные списки"""
+        index = bisect_left(keys, key)
+        keys.insert(index, key)
+        vacancies.insert(index, vacancy)
+
+    @staticmethod
+    def __delete(keys: list[SalaryKey], vacancies: list[Vacancy], key: SalaryKey) -> None:
+        """Удаляет вакансию из упорядоченных списков"""
+        index = bisect_left(keys, key)
+        del keys[index]
+        del vacancies[index]
+
+    def range(self, min_salary: int, max_salary: int) -> list[Vacancy]:
+        """
+        Возвращает вакансии с нижней границей зарплаты не меньше min_salary и верхней границей не больше
+        max_salary в порядке убывания заработной платы. Просматриваются все вакансии, нижняя граница
+        зарплаты которых попадает в диапазон
+        """
+        if min_salary > max_salary and not self.__inverted:
+            return []
+        start = bisect_left(self.__keys, (-max_salary,))
+        stop = bisect_left(self.__keys, (-min_salary + 1,))
+        found = [(key, vacancy) for key, vacancy in zip(self.__keys[start:stop], self.__vacancies[start:stop])
+                 if -key[1] <= max_salary]
+        above = bisect_left(self.__inverted_keys, (-max_salary,))
+        extra = [(key, vacancy) for key, vacancy in zip(self.__inverted_keys[:above], self.__inverted[:above])
+                 if -key[0] >= min_salary and -key[1] <= max_salary]
+        if not extra:
+            return [vacancy for _, vacancy in found]
+        return [vacancy for _, vacancy in merge(found, extra, key=lambda entry: entry[0])]
@@ -1,72 +1,130 @@
+import asyncio
 import os.path
-from typing import Any
+from typing import Any, Optional
 
 from config import DATA_DIR
 from src.api_classes import HeadHunterVacanciesSource
+from src.async_api_classes import AsyncHeadHunterVacanciesSource
 from src.class_vacancy import Vacancy
 from src.file_manager import JsonVacanciesFileManager
 from src.logging_config import LoggingConfigClassMixin
+from src.result_store import QueryResultStore
 from src.vacancy_manager import VacancyManager
 
 
 class VacancyInteraction(LoggingConfigClassMixin):
-    """Класс для взаимодействия с вакансиями"""
-    __slots__ = ("search_query", "filter_words", "min_salary_range", "max_salary_range",
-                 "top_n", "__sorted_vacancies", "__manager")
+    """
+    Класс для взаимодействия с вакансиями.
+    Вакансии отбираются менеджером вакансий по индексам ключевых слов и зарплат и возвращаются уже
+    упорядоченными по убыванию зарплат, поэтому ни топ вакансий, ни полный список не требуют сортировки
+    """
+    __slots__ = ("search_query", "filter_words", "min_salary_range", "max_salary_range", "top_n",
+                 "__sorted_vacancies", "__manager", "__source", "__result_store")
 
     def __init__(self,
                  search_query: str,
                  filter_words: list[str],
                  min_salary_range: int,
                  max_salary_range: int,
-                 top_n: int = 10) -> None:
+                 top_n: int = 10,
+                 source: Optional[HeadHunterVacanciesSource] = None,
+                 result_store: Optional[QueryResultStore] = None) -> None:
         self.search_query = search_query
         self.filter_words = filter_words
         self.min_salary_range = self.__validate_salary_range(min_salary_range)
         self.max_salary_range = self.__validate_salary_range(max_salary_range)
         self.top_n = top_n if isinstance(top_n, int) else 10
-        self.__sorted_vacancies: list = []
+        self.__sorted_vacancies: list[Vacancy] = []
         self.__manager: VacancyManager | None = None
+        self.__source = source
+        self.__result_store = result_store if result_store is not None else QueryResultStore.shared()
         super().__init__()
         self.logger = self.configure()
 
     @property
     def sorted_vacancies(self) -> list[Vacancy]:
-        """Возвращает список объектов Vacancy"""
+        """Возвращает список объектов Vacancy, отсортированный по убыванию зарплат"""
         return self.__sorted_vacancies
 
     def __len__(self) -> int:
         """Возвращает количество вакансий в списке"""
-        return len(self.sorted_vacancies)
+        return len(self.__sorted_vacancies)
+
+    def __load_stored_vacancies(self) -> bool:
+        """Использует менеджер вакансий сохраненного в памяти результата запроса, если он есть"""
+        self.__manager = self.__result_store.get_manager(self.search_query)
+        return self.__manager is not None
 
     def __receive_and_save_vacancies(self) -> None:
         """Получает и сохраняет вакансии"""
-        hh_api = HeadHunterVacanciesSource()
+        if self.__load_stored_vacancies():
+            return
+        hh_api = self.__source or HeadHunterVacanciesSource()
         all_vacancies = hh_api.get_vacancies(self.search_query)
+        self.__save_vacancies(all_vacancies)
 
-        self.__file_manager = JsonVacanciesFileManager(os.path.join(DATA_DIR, "vacancies.json"))
-        self.__file_manager.save_vacancies(all_vacancies)
+    async def __receive_and_save_vacancies_async(self, source: Optional[AsyncHeadHunterVacanciesSource]) -> None:
+        """
+        Асинхронно получает и сохраняет вакансии. Файл сохраняется в отдельном потоке, чтобы ожидание
+        блокировки файла не останавливало цикл событий
+        """
+        if self.__load_stored_vacancies():
+            return
+        if source is None:
+            async with AsyncHeadHunterVacanciesSource() as hh_api:
+                all_vacancies = await hh_api.get_vacancies(self.search_query)
+        else:
+            all_vacancies = await source.get_vacancies(self.search_query)
+        await asyncio.to_thread(self.__save_vacancies, all_vacancies)
 
-        self.__manager = VacancyManager(all_vacancies)
+    def __save_vacancies(self, all_vacancies: list[Vacancy]) -> None:
+        """
+        Сохраняет вакансии в файл и передает их менеджеру вакансий. Файл изменяется под блокировкой
+        за одно чтение и одну запись: полученные вакансии заменяют сохраненные с теми же id, а вакансии,
+        записанные другими процессами, сохраняются
+        """
+        self.__file_manager = JsonVacanciesFileManager(os.path.join(DATA_DIR, "vacancies.json"))
+        self.__file_manager.update_vacancies(all_vacancies, (vac.vac_id for vac in all_vacancies))
+        stored_manager = self.__result_store.put(self.search_query, all_vacancies) if all_vacancies else None
+        self.__manager = stored_manager or VacancyManager(all_vacancies)
 
-    def __process_vacancies(self) -> list[Vacancy]:
-        """Фильтрует и сортирует вакансии"""
+    def __filter_vacancies(self) -> list[Vacancy]:
+        """Отбирает вакансии по ключевым словам и диапазону зарплат в порядке убывания зарплат"""
         if self.__manager:
-            filtered = self.__manager.filter_by_keywords(self.filter_words)
-            filtered = self.__manager.filter_by_salary(self.min_salary_range, self.max_salary_range, filtered)
-            return self.__manager.sort_vacancies(filtered)
+            return self.__manager.select_vacancies(self.filter_words, self.min_salary_range, self.max_salary_range)
         return []
 
-    def get_vacancies(self) -> list[Vacancy]:
-        """Возвращает список отсортированных вакансий"""
-        self.__receive_and_save_vacancies()
-        self.__sorted_vacancies = self.__process_vacancies()
+    def __process_vacancies(self, top_only: bool) -> list[Vacancy]:
+        """Отбирает вакансии. Возвращает отсортированные вакансии или, если top_only, только топ вакансий"""
+        self.__sorted_vacancies = self.__filter_vacancies()
+        if top_only:
+            self.logger.info(f"Отобраны топ-{self.top_n} из {len(self.__sorted_vacancies)} вакансий")
+            return self.__sorted_vacancies[:self.top_n]
         return self.__sorted_vacancies
 
+    def get_vacancies(self, top_only: bool = False) -> list[Vacancy]:
+        """
+        Возвращает список отсортированных вакансий
+        :top_only: вернуть только топ вакансий
+        """
+        self.__receive_and_save_vacancies()
+        return self.__process_vacancies(top_only)
+
+    async def get_vacancies_async(self,
+                                  source: Optional[AsyncHeadHunterVacanciesSource] = None,
+                                  top_only: bool = False) -> list[Vacancy]:
+        """
+        Асинхронно возвращает список отсортированных вакансий
+        :source: общий асинхронный источник, если несколько поисков выполняются в одном цикле событий
+        :top_only: вернуть только топ вакансий
+        """
+        await self.__receive_and_save_vacancies_async(source)
+        return self.__process_vacancies(top_only)
+
     def get_top_vacancies(self) -> None:
         """Выводит пользователю топ вакансий"""
         print(f"Топ-{self.top_n} вакансий:")
-        for v in self.sorted_vacancies[:self.top_n]:
+        for v in self.__sorted_vacancies[:self.top_n]:
             print(v)
         self.logger.info(f"Топ-{self.top_n} вакансий выведены в консоль")
 
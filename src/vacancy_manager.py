@@ -1,33 +1,140 @@
 import re
-from typing import Optional
+from collections.abc import Sequence
+from operator import attrgetter
+from typing import Iterable, Iterator, Optional, Union, overload
+
+import pandas as pd
 
 from src.class_vacancy import Vacancy
+from src.file_manager import FileManager, SQLiteVacanciesFileManager, frame_to_vacancies, normalize_vacancy_frame
+from src.keyword_index import KeywordIndex, KeywordMatch
 from src.logging_config import LoggingConfigClassMixin
+from src.salary_index import SalaryIndex
+
+
+class VacancyListView(Sequence[Vacancy]):
+    """
+    Представление списка вакансий только для чтения: элементы берутся из самого списка без копирования,
+    а изменить список через представление нельзя
+    """
+
+    __slots__ = ("__vacancies",)
+
+    def __init__(self, vacancies: list[Vacancy]) -> None:
+        """Конструктор представления по списку вакансий"""
+        self.__vacancies = vacancies
+
+    def __len__(self) -> int:
+        """Возвращает количество вакансий в списке"""
+        return len(self.__vacancies)
+
+    @overload
+    def __getitem__(self, index: int) -> Vacancy:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Vacancy]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Vacancy, list[Vacancy]]:
+        """Возвращает вакансию по номеру или копию части списка по срезу"""
+        return self.__vacancies[index]
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        """Возвращает вакансии списка"""
+        return iter(self.__vacancies)
 
 
 class VacancyManager(LoggingConfigClassMixin):
-    """Класс для работы со списком вакансий"""
+    """
+    Класс для работы со списком вакансий
+    :vacancies: список объектов Vacancy
+    :store: база данных SQLite, в которой выполняется фильтрация, если список вакансий не передан
+    Для фильтрации по ключевым словам по списку вакансий один раз строится инвертированный индекс (KeywordIndex),
+    для фильтрации по зарплате и сортировки - упорядоченный по зарплате индекс (SalaryIndex). Индексы обновляются
+    при добавлении и удалении вакансий через add_vacancies и remove_vacancies и перестраиваются при замене списка.
+    Менеджер хранит свою копию списка вакансий, а свойство vacancies возвращает представление списка
+    только для чтения (VacancyListView), поэтому список не изменяется в обход индексов
+    """
 
-    def __init__(self, vacancies: list[Vacancy]):
+    def __init__(self,
+                 vacancies: Optional[list[Vacancy]] = None,
+                 store: Optional[SQLiteVacanciesFileManager] = None):
         """Конструктор для создания объектов класса VacancyManager"""
-        self.__vacancies = vacancies
+        self.__vacancies = list(vacancies) if vacancies is not None else None
+        self.__store = store
+        self.__keyword_index: Optional[KeywordIndex] = None
+        self.__salary_index: Optional[SalaryIndex] = None
         super().__init__()
         self.logger = self.configure()
 
     @property
-    def vacancies(self) -> list[Vacancy]:
-        """Возвращает список объектов Vacancy"""
-        return self.__vacancies
+    def vacancies(self) -> VacancyListView:
+        """
+        Возвращает список объектов Vacancy только для чтения. Изменять список следует
+        через add_vacancies и remove_vacancies
+        """
+        return VacancyListView(self.__get_vacancies())
 
     @vacancies.setter
-    def vacancies(self, new_vacancies: list[Vacancy]) -> None:
-        """Преобразует список объектов Vacancy"""
-        self.__vacancies = new_vacancies
-
-    def filter_by_keywords(self, filter_words: list[str]) -> list[Vacancy]:
-        """Фильтрует вакансии по заданным ключевым словам"""
-        pattern = re.compile(r"\b(" + "|".join(filter_words) + r")\b", re.IGNORECASE)
-        target_transactions = [v for v in self.vacancies if pattern.search(f"{v.name} {v.requirements}")]
+    def vacancies(self, new_vacancies: Iterable[Vacancy]) -> None:
+        """Заменяет список объектов Vacancy"""
+        self.__vacancies = list(new_vacancies)
+        self.__keyword_index = None
+        self.__salary_index = None
+
+    def __get_vacancies(self) -> list[Vacancy]:
+        """Возвращает список объектов Vacancy, при необходимости читает его из базы данных"""
+        if self.__vacancies is None:
+            self.__vacancies = self.__store.read_vacancies() if self.__store is not None else []
+        return self.__vacancies
+
+    def add_vacancies(self, new_vacancies: Iterable[Vacancy]) -> None:
+        """Добавляет вакансии в список и в построенные индексы"""
+        new_vacancies = list(new_vacancies)
+        self.__get_vacancies().extend(new_vacancies)
+        for index in self.__built_indexes():
+            index.add(new_vacancies)
+        self.logger.info(f"В список добавлено {len(new_vacancies)} вакансий")
+
+    def remove_vacancies(self, vac_ids: Iterable[str]) -> None:
+        """Удаляет вакансии с указанными id из списка и из построенных индексов"""
+        vac_ids = set(vac_ids)
+        vacancies = self.__get_vacancies()
+        vacancies[:] = [v for v in vacancies if v.vac_id not in vac_ids]
+        for index in self.__built_indexes():
+            index.remove(vac_ids)
+        self.logger.info(f"Из списка удалены вакансии: {sorted(vac_ids)}")
+
+    def __built_indexes(self) -> list[KeywordIndex | SalaryIndex]:
+        """Возвращает уже построенные индексы"""
+        return [index for index in (self.__keyword_index, self.__salary_index) if index is not None]
+
+    def __get_keyword_index(self) -> KeywordIndex:
+        """Возвращает индекс ключевых слов, при необходимости строит его по списку вакансий"""
+        if self.__keyword_index is None:
+            vacancies = self.__get_vacancies()
+            self.__keyword_index = KeywordIndex(vacancies)
+            self.logger.info(f"Построен индекс ключевых слов по {len(vacancies)} вакансиям")
+        return self.__keyword_index
+
+    def __get_salary_index(self) -> SalaryIndex:
+        """Возвращает индекс по зарплате, при необходимости строит его по списку вакансий"""
+        if self.__salary_index is None:
+            vacancies = self.__get_vacancies()
+            self.__salary_index = SalaryIndex(vacancies)
+            self.logger.info(f"Построен индекс по зарплате по {len(vacancies)} вакансиям")
+        return self.__salary_index
+
+    def filter_by_keywords(self, filter_words: list[str], match: KeywordMatch = "any") -> list[Vacancy]:
+        """
+        Фильтрует вакансии по заданным ключевым словам
+        :match: "any" - вакансия содержит любое из слов, "all" - вакансия содержит все слова
+        """
+        if self.__store is not None and self.__vacancies is None and match == "any":
+            target_transactions = self.__store.find_vacancies(filter_words=filter_words, sort=False)
+        else:
+            target_transactions = self.__get_keyword_index().search(filter_words, match)
         self.logger.info(f"Список объектов Vacancy отфильтрован по ключевым словам: {filter_words}")
         return target_transactions
 
@@ -35,17 +142,100 @@ class VacancyManager(LoggingConfigClassMixin):
                          min_target_salary: int,
                          max_target_salary: int,
                          target_transactions: Optional[list[Vacancy]]) -> list[Vacancy]:
-        """Фильтрует вакансии по заданному диапазону заработных плат"""
+        """
+        Фильтрует вакансии по заданному диапазону заработных плат. Если список вакансий для фильтрации
+        не передан, вакансии отбираются по индексу и возвращаются отсортированными по убыванию зарплат
+        """
         self.logger.info(f"Список объектов Vacancy отфильтрован по диапазону зарплат: "
                          f"{min_target_salary} - {max_target_salary}")
-        if target_transactions:
+        if target_transactions is not None:
             return [v for v in target_transactions if v.salary_from >= min_target_salary
                     and v.salary_to <= max_target_salary]
-        return [v for v in self.vacancies if v.salary_from >= min_target_salary and v.salary_to <= max_target_salary]
+        if self.__store is not None and self.__vacancies is None:
+            return self.__store.find_vacancies(min_salary=min_target_salary, max_salary=max_target_salary, sort=False)
+        return self.__get_salary_index().range(min_target_salary, max_target_salary)
 
     def sort_vacancies(self, target_transactions: Optional[list[Vacancy]]) -> list[Vacancy]:
         """Сортирует вакансии по заработным платам в порядке убывания"""
         self.logger.info("Список объектов Vacancy отсортирован по убыванию зарплат")
-        if target_transactions:
-            return sorted(target_transactions, reverse=True)
-        return sorted(self.vacancies, reverse=True)
+        if target_transactions is not None:
+            return sorted(target_transactions, key=attrgetter("sort_key"), reverse=True)
+        return list(self.__get_salary_index())
+
+    def select_vacancies(self,
+                         filter_words: list[str],
+                         min_target_salary: int,
+                         max_target_salary: int) -> list[Vacancy]:
+        """Фильтрует вакансии по ключевым словам и диапазону зарплат и сортирует их по убыванию зарплат"""
+        if self.__store is not None and self.__vacancies is None:
+            self.logger.info(f"Вакансии отобраны в базе данных по ключевым словам {filter_words} и диапазону "
+                             f"зарплат {min_target_salary} - {max_target_salary}")
+            return self.__store.find_vacancies(filter_words, min_target_salary, max_target_salary)
+        filtered = self.filter_by_keywords(filter_words)
+        if not filtered:
+            return []
+        matched = {id(v) for v in filtered}
+        return [v for v in self.filter_by_salary(min_target_salary, max_target_salary, None) if id(v) in matched]
+
+
+class VacancyFrameManager(LoggingConfigClassMixin):
+    """
+    Класс для работы с вакансиями в виде таблицы pandas: фильтрация и сортировка выполняются векторными
+    операциями над столбцами, а объекты Vacancy создаются только для строк, которые выводятся пользователю
+    :frame: таблица с данными о вакансиях (например, результат FileManager.read_dataframe)
+    """
+
+    SORT_COLUMNS = ["salary_from", "salary_to"]
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        """Конструктор для создания объектов класса VacancyFrameManager"""
+        self.__frame = normalize_vacancy_frame(frame)
+        super().__init__()
+        self.logger = self.configure()
+
+    @classmethod
+    def from_file_manager(cls, file_manager: FileManager) -> "VacancyFrameManager":
+        """Создает менеджер по таблице, прочитанной из файла"""
+        return cls(file_manager.read_dataframe())
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Возвращает таблицу с данными о вакансиях"""
+        return self.__frame
+
+    def filter_by_keywords(self, filter_words: list[str], frame: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Фильтрует строки таблицы по заданным ключевым словам в названии и требованиях вакансии"""
+        frame = self.__frame if frame is None else frame
+        pattern = r"\b(?:" + "|".join(filter_words) + r")\b"
+        text = frame["name"] + " " + frame["requirements"]
+        self.logger.info(f"Таблица вакансий отфильтрована по ключевым словам: {filter_words}")
+        return frame[text.str.contains(pattern, flags=re.IGNORECASE, regex=True)]
+
+    def filter_by_salary(self,
+                         min_target_salary: int,
+                         max_target_salary: int,
+                         frame: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Фильтрует строки таблицы по заданному диапазону заработных плат"""
+        frame = self.__frame if frame is None else frame
+        self.logger.info(f"Таблица вакансий отфильтрована по диапазону зарплат: "
+                         f"{min_target_salary} - {max_target_salary}")
+        return frame[(frame["salary_from"] >= min_target_salary) & (frame["salary_to"] <= max_target_salary)]
+
+    def sort_vacancies(self, frame: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Сортирует строки таблицы по заработным платам в порядке убывания, сохраняя порядок равных строк"""
+        frame = self.__frame if frame is None else frame
+        self.logger.info("Таблица вакансий отсортирована по убыванию зарплат")
+        return frame.sort_values(self.SORT_COLUMNS, ascending=False, kind="stable")
+
+    def select_vacancies(self,
+                         filter_words: list[str],
+                         min_target_salary: int,
+                         max_target_salary: int) -> pd.DataFrame:
+        """Фильтрует строки таблицы по ключевым словам и диапазону зарплат и сортирует их по убыванию зарплат"""
+        filtered = self.filter_by_salary(min_target_salary, max_target_salary, self.__frame)
+        return self.sort_vacancies(self.filter_by_keywords(filter_words, filtered))
+
+    def to_vacancies(self, frame: Optional[pd.DataFrame] = None, limit: Optional[int] = None) -> list[Vacancy]:
+        """Создает объекты Vacancy для первых limit строк таблицы (для всех строк, если limit не указан)"""
+        frame = self.__frame if frame is None else frame
+        return frame_to_vacancies(frame if limit is None else frame.head(limit))
@@ -0,0 +1,232 @@
+import re
+from collections.abc import Sequence
+from typing import Iterable, Iterator, Optional, Union, overload
+
+import numpy as np
+import pandas as pd
+
+from src.class_vacancy import Vacancy
+from src.file_manager import FileManager, normalize_vacancy_frame
+from src.keyword_index import KeywordMatch
+from src.logging_config import LoggingConfigClassMixin
+
+
+class VacancyRows(Sequence[Vacancy]):
+    """
+    Выборка строк таблицы VacancyTable. Хранит только номера строк, объекты Vacancy создаются
+    при обращении к элементам выборки и не сохраняются
+    """
+
+    __slots__ = ("__table", "__rows")
+
+    def __init__(self, table: "VacancyTable", rows: np.ndarray) -> None:
+        """Конструктор выборки по таблице и номерам ее строк"""
+        self.__table = table
+        self.__rows = rows
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Возвращает номера строк таблицы, входящих в выборку"""
+        return self.__rows
+
+    def __len__(self) -> int:
+        """Возвращает количество вакансий в выборке"""
+        return len(self.__rows)
+
+    @overload
+    def __getitem__(self, index: int) -> Vacancy:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "VacancyRows":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Vacancy, "VacancyRows"]:
+        """Возвращает вакансию по номеру в выборке или новую выборку по срезу"""
+        if isinstance(index, slice):
+            return VacancyRows(self.__table, self.__rows[index])
+        return self.__table[int(self.__rows[index])]
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        """Возвращает вакансии выборки, создавая их по одной"""
+        for row in self.__rows.tolist():
+            yield self.__table[row]
+
+
+class VacancyTable(LoggingConfigClassMixin):
+    """
+    Столбцовое хранилище вакансий для больших наборов данных: зарплаты хранятся в массивах NumPy, регионы
+    и работодатели - в словарях значений, а в строках таблицы - только их коды. Объекты Vacancy создаются
+    при обращении к строкам таблицы.
+    Методы filter_by_keywords, filter_by_salary, sort_vacancies и select_vacancies повторяют методы
+    VacancyManager и возвращают выборки VacancyRows, которые можно передавать в следующий метод.
+    Массивы NumPy выделяются с запасом и при заполнении увеличиваются не менее чем вдвое, поэтому
+    добавление вакансий небольшими порциями не копирует всю таблицу при каждом вызове extend
+    :vacancies: объекты Vacancy для заполнения таблицы
+    """
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()) -> None:
+        """Конструктор для создания объектов класса VacancyTable"""
+        self.__vac_ids: list[str] = []
+        self.__names: list[str] = []
+        self.__urls: list[str] = []
+        self.__requirements: list[str] = []
+        self.__salary_from = np.empty(0, dtype=np.int64)
+        self.__salary_to = np.empty(0, dtype=np.int64)
+        self.__employer_codes = np.empty(0, dtype=np.int32)
+        self.__employers: list[tuple[str, str]] = []
+        self.__employer_lookup: dict[tuple[str, str], int] = {}
+        self.__area_codes = np.empty(0, dtype=np.int32)
+        self.__areas: list[str] = []
+        self.__area_lookup: dict[str, int] = {}
+        super().__init__()
+        self.logger = self.configure()
+        self.extend(vacancies)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "VacancyTable":
+        """Создает таблицу по таблице pandas (например, результату FileManager.read_dataframe) без объектов Vacancy"""
+        table = cls()
+        table.__extend_columns(normalize_vacancy_frame(frame))
+        return table
+
+    @classmethod
+    def from_file_manager(cls, file_manager: FileManager) -> "VacancyTable":
+        """Создает таблицу по вакансиям, прочитанным из файла"""
+        return cls.from_frame(file_manager.read_dataframe())
+
+    def __len__(self) -> int:
+        """Возвращает количество вакансий в таблице"""
+        return len(self.__vac_ids)
+
+    def __getitem__(self, row: int) -> Vacancy:
+        """Создает объект Vacancy по строке таблицы"""
+        size = len(self)
+        employer_name, employer_url = self.__employers[self.__employer_codes[:size][row]]
+        return Vacancy(self.__vac_ids[row], self.__names[row], self.__urls[row], int(self.__salary_from[:size][row]),
+                       int(self.__salary_to[:size][row]), employer_name, employer_url, self.__requirements[row],
+                       self.__areas[self.__area_codes[:size][row]])
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        """Возвращает вакансии таблицы, создавая их по одной"""
+        return iter(self.rows())
+
+    def rows(self, rows: Optional[np.ndarray] = None) -> VacancyRows:
+        """Возвращает выборку по номерам строк (по умолчанию - все строки таблицы)"""
+        return VacancyRows(self, np.arange(len(self)) if rows is None else rows)
+
+    def extend(self, vacancies: Iterable[Vacancy]) -> None:
+        """Добавляет вакансии в таблицу"""
+        vacancies = list(vacancies)
+        if not vacancies:
+            return
+        start, stop = self.__reserve(len(vacancies))
+        self.__salary_from[start:stop] = np.fromiter((v.salary_from for v in vacancies), np.int64, len(vacancies))
+        self.__salary_to[start:stop] = np.fromiter((v.salary_to for v in vacancies), np.int64, len(vacancies))
+        self.__employer_codes[start:stop] = self.__encode(
+            ((v.employer_name, v.employer_url) for v in vacancies), self.__employers, self.__employer_lookup)
+        self.__area_codes[start:stop] = self.__encode((v.area for v in vacancies), self.__areas, self.__area_lookup)
+        self.__vac_ids.extend(v.vac_id for v in vacancies)
+        self.__names.extend(v.name for v in vacancies)
+        self.__urls.extend(v.url for v in vacancies)
+        self.__requirements.extend(v.requirements for v in vacancies)
+        self.logger.info(f"В таблицу добавлено {len(vacancies)} вакансий")
+
+    def __extend_columns(self, frame: pd.DataFrame) -> None:
+        """Добавляет в таблицу строки нормализованной таблицы pandas"""
+        start, stop = self.__reserve(len(frame))
+        self.__salary_from[start:stop] = frame["salary_from"].to_numpy(np.int64)
+        self.__salary_to[start:stop] = frame["salary_to"].to_numpy(np.int64)
+        employers = zip(frame["employer_name"].tolist(), frame["employer_url"].tolist())
+        self.__employer_codes[start:stop] = self.__encode(employers, self.__employers, self.__employer_lookup)
+        areas = (area if area else "не указано" for area in frame["area"].tolist())
+        self.__area_codes[start:stop] = self.__encode(areas, self.__areas, self.__area_lookup)
+        self.__vac_ids.extend(frame["vac_id"].tolist())
+        self.__names.extend(frame["name"].tolist())
+        self.__urls.extend(frame["url"].tolist())
+        self.__requirements.extend(frame["requirements"].tolist())
+        self.logger.info(f"В таблицу добавлено {len(frame)} вакансий")
+
+    def __reserve(self, count: int) -> tuple[int, int]:
+        """
+        Увеличивает массивы NumPy, если в них не помещаются еще count строк: новая емкость не меньше
+        удвоенной прежней. Возвращает границы строк, которые нужно заполнить
+        """
+        start = len(self)
+        stop = start + count
+        if stop > len(self.__salary_from):
+            capacity = max(stop, 2 * len(self.__salary_from))
+            self.__salary_from = self.__resized(self.__salary_from, capacity, start)
+            self.__salary_to = self.__resized(self.__salary_to, capacity, start)
+            self.__employer_codes = self.__resized(self.__employer_codes, capacity, start)
+            self.__area_codes = self.__resized(self.__area_codes, capacity, start)
+        return start, stop
+
+    @staticmethod
+    def __resized(array: np.ndarray, capacity: int, size: int) -> np.ndarray:
+        """Возвращает массив заданной емкости с первыми size значениями исходного массива"""
+        result = np.empty(capacity, dtype=array.dtype)
+        result[:size] = array[:size]
+        return result
+
+    @staticmethod
+    def __encode(values: Iterable, dictionary: list, lookup: dict) -> np.ndarray:
+        """Заменяет значения их кодами в словаре значений, добавляя в словарь новые значения"""
+        codes = []
+        for value in values:
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(dictionary)
+                dictionary.append(value)
+            codes.append(code)
+        return np.array(codes, dtype=np.int32)
+
+    def __selected(self, target_transactions: Optional[VacancyRows]) -> np.ndarray:
+        """Возвращает номера строк выборки (по умолчанию - всех строк таблицы)"""
+        return np.arange(len(self)) if target_transactions is None else target_transactions.rows
+
+    def filter_by_keywords(self,
+                           filter_words: list[str],
+                           target_transactions: Optional[VacancyRows] = None,
+                           match: KeywordMatch = "any") -> VacancyRows:
+        """
+        Фильтрует вакансии по заданным ключевым словам в названии и требованиях вакансии
+        :match: "any" - вакансия содержит любое из слов, "all" - вакансия содержит все слова
+        """
+        rows = self.__selected(target_transactions)
+        if filter_words:
+            if match == "all":
+                patterns = [re.compile(r"\b(?:" + word + r")\b", re.IGNORECASE) for word in filter_words]
+            else:
+                patterns = [re.compile(r"\b(?:" + "|".join(filter_words) + r")\b", re.IGNORECASE)]
+            texts = (f"{self.__names[row]} {self.__requirements[row]}" for row in rows.tolist())
+            mask = np.fromiter((all(p.search(text) for p in patterns) for text in texts), bool, len(rows))
+            rows = rows[mask]
+        self.logger.info(f"Таблица вакансий отфильтрована по ключевым словам: {filter_words}")
+        return VacancyRows(self, rows)
+
+    def filter_by_salary(self,
+                         min_target_salary: int,
+                         max_target_salary: int,
+                         target_transactions: Optional[VacancyRows] = None) -> VacancyRows:
+        """Фильтрует вакансии по заданному диапазону заработных плат"""
+        rows = self.__selected(target_transactions)
+        mask = (self.__salary_from[rows] >= min_target_salary) & (self.__salary_to[rows] <= max_target_salary)
+        self.logger.info(f"Таблица вакансий отфильтрована по диапазону зарплат: "
+                         f"{min_target_salary} - {max_target_salary}")
+        return VacancyRows(self, rows[mask])
+
+    def sort_vacancies(self, target_transactions: Optional[VacancyRows] = None) -> VacancyRows:
+        """Сортирует вакансии по убыванию заработных плат, сохраняя порядок вакансий с равными зарплатами"""
+        rows = self.__selected(target_transactions)
+        order = np.lexsort((-self.__salary_to[rows], -self.__salary_from[rows]))
+        self.logger.info("Таблица вакансий отсортирована по убыванию зарплат")
+        return VacancyRows(self, rows[order])
+
+    def select_vacancies(self,
+                         filter_words: list[str],
+                         min_target_salary: int,
+                         max_target_salary: int) -> VacancyRows:
+        """Фильтрует вакансии по ключевым словам и диапазону зарплат и сортирует их по убыванию зарплат"""
+        filtered = self.filter_by_salary(min_target_salary, max_target_salary)
+        return self.sort_vacancies(self.filter_by_keywords(filter_words, filtered))
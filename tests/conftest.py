@@ -1,3 +1,9 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from urllib.parse import parse_qs, urlparse
+
 import pytest
 
 from src.api_classes import HeadHunterVacanciesSource
@@ -147,3 +153,47 @@ def vacancies_interaction() -> VacancyInteraction:
                               50000,
                               100000,
                               2)
+
+
+class StubHeadHunterHandler(BaseHTTPRequestHandler):
+    """Обработчик локального сервера, имитирующего API HeadHunter.ru"""
+
+    pages = 3
+
+    def do_GET(self) -> None:
+        """Отдает страницу с вакансиями или ошибку для пути /error"""
+        parsed = urlparse(self.path)
+        if parsed.path == "/error":
+            self.send_response(500)
+            self.end_headers()
+            return
+        query = parse_qs(parsed.query)
+        page = int(query.get("page", ["0"])[0])
+        text = query.get("text", [""])[0]
+        items = [{"id": f"{text}-{page}",
+                  "name": f"{text} {page}",
+                  "alternate_url": f"https://hh.ru/vacancy/{page}",
+                  "salary": {"from": 100000 + page, "to": None, "currency": "RUR"},
+                  "employer": {"name": "Company", "alternate_url": "https://hh.ru/employer/1"},
+                  "snippet": {"requirement": "Python"},
+                  "area": {"name": "Москва"}}]
+        body = json.dumps({"items": items, "pages": self.pages}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        """Отключает вывод запросов в консоль"""
+        pass
+
+
+@pytest.fixture
+def stub_hh_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHeadHunterHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
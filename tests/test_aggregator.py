@@ -0,0 +1,127 @@
+import time
+from typing import Any
+
+import pytest
+from requests import Response
+
+from src.aggregator import SourceRegistry, VacancyAggregator
+from src.api_classes import BaseVacanciesSource, JsonFeedVacanciesSource
+from src.class_vacancy import Vacancy
+
+
+class FixtureVacanciesSource(BaseVacanciesSource):
+    """Локальный источник вакансий для тестов"""
+
+    def __init__(self, vacancies: list[Vacancy], delay: float = 0, error: Exception | None = None) -> None:
+        self.vacancies = vacancies
+        self.delay = delay
+        self.error = error
+
+    def _connect(self) -> Response | None:
+        return None
+
+    def get_vacancies_data(self, key_word: str) -> list:
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.vacancies
+
+    def get_vacancies(self, key_word: str) -> list[Vacancy]:
+        return self.get_vacancies_data(key_word)
+
+
+def test_registry_register(vacancy_1: Vacancy) -> None:
+    """Проверяет регистрацию и удаление источников"""
+    registry = SourceRegistry()
+    source = FixtureVacanciesSource([vacancy_1])
+
+    registry.register("fixture", source)
+    assert registry.get("fixture") is source
+    assert registry.names == ["fixture"]
+
+    registry.unregister("fixture")
+    assert len(registry) == 0
+
+
+def test_registry_register_wrong_type() -> None:
+    """Проверяет, что в реестр нельзя добавить объект, не являющийся источником"""
+    with pytest.raises(TypeError):
+        SourceRegistry().register("wrong", object())  # type: ignore
+
+
+def test_default_registry() -> None:
+    """Проверяет, что общий реестр содержит источник HeadHunter.ru"""
+    assert "hh" in SourceRegistry.default().names
+
+
+def test_aggregator_deduplicates(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет объединение вакансий из разных источников без повторов"""
+    duplicate = Vacancy("other-1", vacancy_1.name.upper(), "https://example.com/1", vacancy_1.salary_from,
+                        vacancy_1.salary_to, vacancy_1.employer_name, "", "", vacancy_1.area)
+    registry = SourceRegistry()
+    registry.register("first", FixtureVacanciesSource([vacancy_1, vacancy_2]))
+    registry.register("second", FixtureVacanciesSource([duplicate, vacancy_3]))
+
+    result = VacancyAggregator(registry).get_vacancies("python")
+
+    assert [vac.vac_id for vac in result] == [vacancy_1.vac_id, vacancy_2.vac_id, vacancy_3.vac_id]
+
+
+def test_aggregator_keeps_same_text_within_source(vacancy_2: Vacancy, vacancy_5: Vacancy) -> None:
+    """Проверяет, что одинаковые вакансии одного источника с разными id не считаются повторами"""
+    registry = SourceRegistry()
+    registry.register("first", FixtureVacanciesSource([vacancy_2, vacancy_5, vacancy_2]))
+
+    result = VacancyAggregator(registry).get_vacancies("python")
+
+    assert [vac.vac_id for vac in result] == [vacancy_2.vac_id, vacancy_5.vac_id]
+
+
+def test_aggregator_timeout_and_errors(vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет пропуск медленных и неработающих источников без ожидания их завершения"""
+    registry = SourceRegistry()
+    registry.register("fast", FixtureVacanciesSource([vacancy_1]))
+    registry.register("slow", FixtureVacanciesSource([vacancy_2], delay=1))
+    registry.register("broken", FixtureVacanciesSource([], error=ValueError("Ошибка")))
+
+    start = time.monotonic()
+    result = VacancyAggregator(registry, timeout=0.2).get_vacancies("python")
+
+    assert time.monotonic() - start < 0.9
+    assert result == [vacancy_1]
+
+
+def test_aggregator_empty_registry() -> None:
+    """Проверяет поведение при пустом реестре источников"""
+    assert VacancyAggregator(SourceRegistry()).get_vacancies("python") == []
+
+
+def test_json_feed_source(stub_hh_server: str) -> None:
+    """Проверяет получение вакансий из JSON-источника по соответствию полей"""
+    source = JsonFeedVacanciesSource(f"{stub_hh_server}/vacancies",
+                                     field_map={"vac_id": "id", "name": "name", "url": "alternate_url",
+                                                "salary_from": "salary.from", "salary_to": "salary.to",
+                                                "employer_name": "employer.name", "area": "area.name"})
+
+    result = source.get_vacancies("python")
+
+    assert [vac.vac_id for vac in result] == ["python-0"]
+    assert result[0].salary_from == 100000
+    assert result[0].employer_name == "Company"
+    assert result[0].requirements == ""
+
+
+def test_json_feed_source_error(stub_hh_server: str) -> None:
+    """Проверяет обработку ошибки JSON-источника"""
+    source = JsonFeedVacanciesSource(f"{stub_hh_server}/error", field_map={"vac_id": "id"})
+
+    assert source.get_vacancies("python") == []
+
+
+def test_get_by_path() -> None:
+    """Проверяет получение значения по пути из ключей"""
+    data: Any = {"salary": {"from": 1}}
+
+    assert JsonFeedVacanciesSource._get_by_path(data, "salary.from") == 1
+    assert JsonFeedVacanciesSource._get_by_path(data, "salary.from.value") is None
+    assert JsonFeedVacanciesSource._get_by_path([1], "") == [1]
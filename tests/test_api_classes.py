@@ -4,8 +4,10 @@ from unittest.mock import MagicMock, patch
 
 from requests import Response
 
-from src.api_classes import HeadHunterVacanciesSource
+from src.api_classes import HeadHunterVacanciesSource, create_session
 from src.class_vacancy import Vacancy
+from src.request_scheduler import RequestScheduler
+from src.response_cache import ResponseCache
 
 
 def make_mock_response(status_code: int) -> Response:
@@ -15,7 +17,7 @@ def make_mock_response(status_code: int) -> Response:
     return mock_resp
 
 
-@patch("src.api_classes.requests.get")
+@patch("src.api_classes.requests.Session.get")
 def test_connect_success(mock_get: Any, api_client: Any) -> None:
     """Проверяет успешный случай подключения через api"""
     mock_get.return_value = make_mock_response(200)
@@ -24,7 +26,7 @@ def test_connect_success(mock_get: Any, api_client: Any) -> None:
     mock_get.assert_called_once()
 
 
-@patch("src.api_classes.requests.get")
+@patch("src.api_classes.requests.Session.get")
 def test_connect_error(mock_get: Any, api_client: Any) -> None:
     """Проверяет неуспешный случай подключения через api"""
     mock_get.return_value = make_mock_response(400)
@@ -44,7 +46,7 @@ def make_mock_response_json(items: list[dict], pages: int) -> MagicMock:
     return mock_resp
 
 
-@patch("src.api_classes.requests.get")
+@patch("src.api_classes.requests.Session.get")
 def test_get_vacancies_data_one_page(mock_get: Any, api_client: HeadHunterVacanciesSource) -> None:
     """Проверяет ответ API с одной страницей"""
     mock_get.return_value = make_mock_response_json(items=[{"id": 1, "name": "Vacancy 1"}], pages=1)
@@ -57,7 +59,7 @@ def test_get_vacancies_data_one_page(mock_get: Any, api_client: HeadHunterVacanc
     mock_get.assert_called()
 
 
-@patch("src.api_classes.requests.get")
+@patch("src.api_classes.requests.Session.get")
 def test_get_vacancies_data_many_pages(mock_get: Any, api_client: HeadHunterVacanciesSource) -> None:
     """Проверяет ответ API с одной страницей"""
     mock_get.return_value = make_mock_response_json(items=[{"id": 1, "name": "Vacancy 1"}], pages=3)
@@ -78,7 +80,7 @@ def make_mock_response_json_error() -> MagicMock:
     return mock_resp
 
 
-@patch("src.api_classes.requests.get")
+@patch("src.api_classes.requests.Session.get")
 def test_get_vacancies_data_error(mock_get: Any, api_client: HeadHunterVacanciesSource) -> None:
     """Проверяет поведение метода при возникновении исключения"""
     mock_get.return_value = make_mock_response_json_error()
@@ -132,3 +134,277 @@ def test_format_vacancies(raw_data_for_vacancy: list[dict]) -> None:
     assert vacancy.employer_url == "http://example.com/employer/1"
     assert vacancy.requirements == "Python, Django"
     assert vacancy.area == "Москва"
+
+
+@patch("src.api_classes.requests.Session.get")
+def test_get_vacancies_data_pages_order(mock_get: Any, api_client: HeadHunterVacanciesSource) -> None:
+    """Проверяет, что страницы, полученные параллельно, объединяются в порядке номеров"""
+    def fake_get(url: str, headers: dict, params: dict | None = None, timeout: float = 0) -> MagicMock:
+        if params is None:
+            return make_mock_response(200)
+        page = params["page"]
+        return make_mock_response_json(items=[{"id": page}], pages=4)
+
+    mock_get.side_effect = fake_get
+
+    result = api_client.get_vacancies_data("python")
+
+    assert [vac["id"] for vac in result] == [0, 1, 2, 3]
+    assert api_client._HeadHunterVacanciesSource__params["page"] == 0
+
+
+@patch("src.api_classes.requests.Session.get")
+def test_get_vacancies_data_page_error(mock_get: Any, api_client: HeadHunterVacanciesSource) -> None:
+    """Проверяет, что ошибка на одной из страниц не прерывает получение остальных"""
+    def fake_get(url: str, headers: dict, params: dict | None = None, timeout: float = 0) -> MagicMock:
+        if params is None:
+            return make_mock_response(200)
+        if params["page"] == 1:
+            return make_mock_response_json_error()
+        return make_mock_response_json(items=[{"id": params["page"]}], pages=3)
+
+    mock_get.side_effect = fake_get
+
+    result = api_client.get_vacancies_data("python")
+
+    assert [vac["id"] for vac in result] == [0, 2]
+
+
+@patch("src.api_classes.requests.Session.get")
+def test_fetch_vacancies_data_reports_failed_pages(mock_get: Any, api_client: HeadHunterVacanciesSource) -> None:
+    """Проверяет, что получение данных сообщает о количестве найденных вакансий и не полученных страницах"""
+    def fake_get(url: str, headers: dict, params: dict | None = None, timeout: float = 0) -> MagicMock:
+        if params is None:
+            return make_mock_response(200)
+        if params["page"] == 1:
+            return make_mock_response_json_error()
+        response = make_mock_response_json(items=[{"id": params["page"]}], pages=3)
+        response.json.return_value["found"] = 3
+        return response
+
+    mock_get.side_effect = fake_get
+
+    vacancies_data, found, failed_pages = api_client.fetch_vacancies_data("python")
+
+    assert [vac["id"] for vac in vacancies_data] == [0, 2]
+    assert (found, failed_pages) == (3, 1)
+
+
+@patch("src.api_classes.requests.Session.get")
+def test_get_vacancies_data_pages_limit(mock_get: Any, api_client: HeadHunterVacanciesSource) -> None:
+    """Проверяет ограничение количества запрашиваемых страниц"""
+    mock_get.return_value = make_mock_response_json(items=[{"id": 1}], pages=20)
+
+    result = api_client.get_vacancies_data("python")
+
+    assert len(result) == HeadHunterVacanciesSource.MAX_PAGES
+
+
+def test_create_session() -> None:
+    """Проверяет настройку пула соединений и повторных попыток в HTTP-сессии"""
+    session = create_session(pool_size=7, max_retries=2)
+    adapter = session.get_adapter("https://api.hh.ru/vacancies")
+
+    assert adapter._pool_maxsize == 7
+    assert adapter.max_retries.total == 2
+
+
+def test_shared_session_reused() -> None:
+    """Проверяет, что экземпляры источника используют общую HTTP-сессию"""
+    first = HeadHunterVacanciesSource()
+    second = HeadHunterVacanciesSource()
+
+    assert first.session is second.session
+    assert HeadHunterVacanciesSource(pool_size=20).session is not first.session
+
+
+def test_custom_session() -> None:
+    """Проверяет использование переданной HTTP-сессии"""
+    session = MagicMock()
+    session.get.return_value = make_mock_response_json(items=[{"id": 1}], pages=1)
+    source = HeadHunterVacanciesSource(session=session)
+
+    result = source.get_vacancies_data("python")
+
+    assert result == [{"id": 1}]
+    assert session.get.call_count == 2
+
+
+def test_get_vacancies_data_without_probe() -> None:
+    """Проверяет, что без проверочного запроса данные получаются одним запросом"""
+    session = MagicMock()
+    session.get.return_value = make_mock_response_json(items=[{"id": 1}], pages=1)
+    source = HeadHunterVacanciesSource(session=session, check_connection=False)
+
+    result = source.get_vacancies_data("python")
+
+    assert result == [{"id": 1}]
+    session.get.assert_called_once()
+
+
+def test_get_vacancies_data_without_probe_error() -> None:
+    """Проверяет обработку ошибочного статус-кода первой страницы без проверочного запроса"""
+    session = MagicMock()
+    session.get.return_value = make_mock_response(500)
+    source = HeadHunterVacanciesSource(session=session, check_connection=False,
+                                       scheduler=RequestScheduler(max_retries=0))
+    source.logger = MagicMock()
+
+    result = source.get_vacancies_data("python")
+
+    assert result == []
+    session.get.assert_called_once()
+    source.logger.error.assert_called_once_with("Ошибка подключения через API")
+
+
+def test_get_vacancies_data_from_cache(tmp_path: Any) -> None:
+    """Проверяет, что повторный запрос берется из кэша без обращения к API"""
+    session = MagicMock()
+    response = make_mock_response_json(items=[{"id": 1}], pages=1)
+    response.headers = {}
+    session.get.return_value = response
+    source = HeadHunterVacanciesSource(session=session, check_connection=False, cache=ResponseCache(str(tmp_path)))
+
+    first = source.get_vacancies_data("python")
+    second = source.get_vacancies_data("python")
+
+    assert first == second == [{"id": 1}]
+    session.get.assert_called_once()
+
+
+def test_get_vacancies_data_from_cache_without_probe(tmp_path: Any) -> None:
+    """Проверяет, что при получении первой страницы из кэша проверочный запрос не выполняется"""
+    session = MagicMock()
+    response = make_mock_response_json(items=[{"id": 1}], pages=1)
+    response.headers = {}
+    session.get.return_value = response
+    source = HeadHunterVacanciesSource(session=session, cache=ResponseCache(str(tmp_path)))
+
+    first = source.get_vacancies_data("python")
+    second = source.get_vacancies_data("python")
+
+    assert first == second == [{"id": 1}]
+    assert session.get.call_count == 2
+
+
+def test_get_vacancies_data_cache_extra_params(tmp_path: Any) -> None:
+    """Проверяет, что запросы с разными дополнительными параметрами не получают ответы друг друга из кэша"""
+    session = MagicMock()
+    first_window = make_mock_response_json(items=[{"id": 1}], pages=1)
+    second_window = make_mock_response_json(items=[{"id": 2}], pages=1)
+    first_window.headers = second_window.headers = {}
+    session.get.side_effect = [first_window, second_window]
+    source = HeadHunterVacanciesSource(session=session, check_connection=False, cache=ResponseCache(str(tmp_path)))
+
+    first = source.get_vacancies_data("python", {"date_from": "2025-01-01T00:00:00"})
+    second = source.get_vacancies_data("python", {"date_from": "2025-06-01T00:00:00"})
+
+    assert first == [{"id": 1}]
+    assert second == [{"id": 2}]
+    assert session.get.call_count == 2
+
+
+def test_get_vacancies_data_cache_revalidation(tmp_path: Any) -> None:
+    """Проверяет условный запрос для устаревшей записи кэша и ответ 304"""
+    session = MagicMock()
+    response = make_mock_response_json(items=[{"id": 1}], pages=1)
+    response.headers = {"ETag": '"v1"'}
+    not_modified = make_mock_response(304)
+    session.get.side_effect = [response, not_modified]
+    source = HeadHunterVacanciesSource(session=session, check_connection=False,
+                                       cache=ResponseCache(str(tmp_path), ttl=0))
+
+    source.get_vacancies_data("python")
+    result = source.get_vacancies_data("python")
+
+    assert result == [{"id": 1}]
+    assert session.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_iter_vacancies(raw_data_for_vacancy: list[dict]) -> None:
+    """Проверяет постраничное получение объектов Vacancy"""
+    session = MagicMock()
+    response = make_mock_response_json(items=raw_data_for_vacancy, pages=3)
+    session.get.return_value = response
+    source = HeadHunterVacanciesSource(session=session)
+
+    vacancies = source.iter_vacancies("python")
+    first = next(vacancies)
+    rest = list(vacancies)
+
+    assert isinstance(first, Vacancy)
+    assert first.vac_id == "123"
+    assert len(rest) == 2
+
+
+def test_iter_vacancies_data_stop_early() -> None:
+    """Проверяет досрочное завершение постраничного получения данных"""
+    session = MagicMock()
+    session.get.return_value = make_mock_response_json(items=[{"id": 1}], pages=1)
+    source = HeadHunterVacanciesSource(session=session)
+
+    pages = source.iter_vacancies_data("python")
+
+    assert next(pages) == [{"id": 1}]
+    assert list(pages) == []
+
+
+def test_iter_format_vacancies(raw_data_for_vacancy: list[dict]) -> None:
+    """Проверяет ленивое преобразование данных о вакансиях в объекты Vacancy"""
+    vacancies = HeadHunterVacanciesSource.iter_format_vacancies(iter(raw_data_for_vacancy))
+
+    assert next(vacancies).name == "Python Developer"
+    assert next(vacancies, None) is None
+
+
+def test_max_pages_limited_by_depth() -> None:
+    """Проверяет ограничение количества страниц глубиной выдачи API"""
+    assert HeadHunterVacanciesSource(max_pages=100).max_pages == 20
+    assert HeadHunterVacanciesSource(max_pages=8).max_pages == 8
+
+
+def test_get_vacancies_data_extra_params() -> None:
+    """Проверяет передачу дополнительных параметров подзапроса"""
+    session = MagicMock()
+    session.get.return_value = make_mock_response_json(items=[{"id": 1}], pages=1)
+    source = HeadHunterVacanciesSource(session=session, check_connection=False)
+
+    source.get_vacancies_data("python", {"area": 1, "date_from": "2025-01-01T00:00:00"})
+
+    params = session.get.call_args.kwargs["params"]
+    assert params["area"] == 1
+    assert params["date_from"] == "2025-01-01T00:00:00"
+    assert params["text"] == "python"
+
+
+def test_count_vacancies() -> None:
+    """Проверяет получение количества найденных вакансий"""
+    session = MagicMock()
+    response = make_mock_response_json(items=[], pages=1)
+    response.json.return_value = {"items": [], "found": 4321}
+    session.get.return_value = response
+    source = HeadHunterVacanciesSource(session=session)
+
+    assert source.count_vacancies("python") == 4321
+    assert session.get.call_args.kwargs["params"]["per_page"] == 1
+
+
+def test_request_timeout() -> None:
+    """Проверяет, что запросы к API выполняются с ограничением времени ожидания ответа"""
+    session = MagicMock()
+    session.get.return_value = make_mock_response_json(items=[], pages=1)
+    source = HeadHunterVacanciesSource(session=session, check_connection=False, timeout=5)
+
+    source.get_vacancies_data("python")
+
+    assert session.get.call_args.kwargs["timeout"] == 5
+
+
+def test_count_vacancies_error() -> None:
+    """Проверяет, что ошибка получения количества вакансий отличается от пустого результата"""
+    session = MagicMock()
+    session.get.return_value = make_mock_response(500)
+    source = HeadHunterVacanciesSource(session=session, scheduler=RequestScheduler(max_retries=0))
+    source.logger = MagicMock()
+
+    assert source.count_vacancies("python") is None
@@ -0,0 +1,83 @@
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+from src.async_api_classes import AsyncHeadHunterVacanciesSource
+from src.class_vacancy import Vacancy
+from src.request_scheduler import RequestScheduler
+from src.vacancy_interaction import VacancyInteraction
+
+
+def test_get_vacancies_data(stub_hh_server: str) -> None:
+    """Проверяет асинхронное получение всех страниц в порядке номеров"""
+    async def run() -> list:
+        async with AsyncHeadHunterVacanciesSource(url=f"{stub_hh_server}/vacancies") as source:
+            return await source.get_vacancies_data("python")
+
+    result = asyncio.run(run())
+
+    assert [vac["id"] for vac in result] == ["python-0", "python-1", "python-2"]
+
+
+def test_get_vacancies_data_without_probe(stub_hh_server: str) -> None:
+    """Проверяет асинхронное получение данных без проверочного запроса"""
+    async def run() -> list:
+        async with AsyncHeadHunterVacanciesSource(url=f"{stub_hh_server}/vacancies",
+                                                  check_connection=False) as source:
+            return await source.get_vacancies_data("python")
+
+    result = asyncio.run(run())
+
+    assert len(result) == 3
+
+
+def test_get_vacancies_data_connection_error(stub_hh_server: str) -> None:
+    """Проверяет обработку ошибочного статус-кода ответа"""
+    async def run() -> list:
+        async with AsyncHeadHunterVacanciesSource(url=f"{stub_hh_server}/error",
+                                                  scheduler=RequestScheduler(max_retries=0)) as source:
+            source.logger = MagicMock()
+            result = await source.get_vacancies_data("python")
+            source.logger.error.assert_called_once_with("Ошибка подключения через API")
+            return result
+
+    assert asyncio.run(run()) == []
+
+
+def test_get_vacancies_many_queries(stub_hh_server: str) -> None:
+    """Проверяет выполнение нескольких поисков в одном цикле событий"""
+    async def run() -> list[list[Vacancy]]:
+        async with AsyncHeadHunterVacanciesSource(url=f"{stub_hh_server}/vacancies") as source:
+            return await asyncio.gather(source.get_vacancies("python"), source.get_vacancies("java"))
+
+    python_vacancies, java_vacancies = asyncio.run(run())
+
+    assert all(isinstance(vac, Vacancy) for vac in python_vacancies)
+    assert [vac.vac_id for vac in java_vacancies] == ["java-0", "java-1", "java-2"]
+
+
+def test_interaction_get_vacancies_async(stub_hh_server: str, tmp_path: Any, monkeypatch: Any) -> None:
+    """Проверяет асинхронный сценарий получения и обработки вакансий"""
+    monkeypatch.setattr("src.vacancy_interaction.DATA_DIR", str(tmp_path))
+    interaction = VacancyInteraction("python", ["python"], 100001, 200000, 2)
+
+    async def run() -> list[Vacancy]:
+        async with AsyncHeadHunterVacanciesSource(url=f"{stub_hh_server}/vacancies") as source:
+            return await interaction.get_vacancies_async(source)
+
+    result = asyncio.run(run())
+
+    assert [vac.vac_id for vac in result] == ["python-2", "python-1"]
+    assert (tmp_path / "vacancies.json").exists()
+
+
+def test_iter_vacancies(stub_hh_server: str) -> None:
+    """Проверяет асинхронное постраничное получение объектов Vacancy"""
+    async def run() -> list[Vacancy]:
+        async with AsyncHeadHunterVacanciesSource(url=f"{stub_hh_server}/vacancies") as source:
+            return [vacancy async for vacancy in source.iter_vacancies("python")]
+
+    result = asyncio.run(run())
+
+    assert sorted(vac.vac_id for vac in result) == ["python-0", "python-1", "python-2"]
+    assert result[0].vac_id == "python-0"
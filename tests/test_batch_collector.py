@@ -0,0 +1,85 @@
+import asyncio
+import threading
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from src.async_api_classes import AsyncHeadHunterVacanciesSource
+from src.batch_collector import VacancyBatchCollector
+from src.class_vacancy import Vacancy
+from src.file_manager import JsonVacanciesFileManager
+
+
+def make_raw_vacancy(vac_id: str) -> dict:
+    """Возвращает данные о вакансии в формате API HeadHunter.ru"""
+    return {"id": vac_id,
+            "name": f"Vacancy {vac_id}",
+            "alternate_url": f"https://hh.ru/vacancy/{vac_id}",
+            "salary": {"from": 100000, "to": 150000, "currency": "RUR"},
+            "employer": {"name": "Company", "alternate_url": "https://hh.ru/employer/1"},
+            "snippet": {"requirement": "Python"},
+            "area": {"name": "Москва"}}
+
+
+def test_collect_deduplicates_and_saves_once() -> None:
+    """Проверяет объединение результатов запросов без повторов и однократное сохранение"""
+    responses = {"python": [make_raw_vacancy("1"), make_raw_vacancy("2")],
+                 "django": [make_raw_vacancy("2"), make_raw_vacancy("3")]}
+    source = AsyncHeadHunterVacanciesSource()
+    source.get_vacancies_data = AsyncMock(side_effect=lambda query: responses[query])  # type: ignore
+    file_manager = MagicMock()
+    collector = VacancyBatchCollector(source, file_manager)
+
+    result = collector.collect(["python", "django", "python", " "])
+
+    assert [vac.vac_id for vac in result] == ["1", "2", "3"]
+    assert source.get_vacancies_data.await_count == 2
+    file_manager.update_vacancies.assert_called_once()
+    assert file_manager.update_vacancies.call_args.args[0] == result
+
+
+def test_collect_empty_queries() -> None:
+    """Проверяет поведение при пустом списке запросов"""
+    file_manager = MagicMock()
+    collector = VacancyBatchCollector(MagicMock(), file_manager)
+
+    assert collector.collect([]) == []
+    file_manager.update_vacancies.assert_not_called()
+
+
+def test_collect_async_with_stub_server(stub_hh_server: str) -> None:
+    """Проверяет пакетный сбор вакансий в одном цикле событий через локальный сервер"""
+    file_manager = MagicMock()
+
+    async def run() -> Any:
+        async with AsyncHeadHunterVacanciesSource(url=f"{stub_hh_server}/vacancies") as source:
+            return await VacancyBatchCollector(source, file_manager).collect_async(["python", "java"])
+
+    result = asyncio.run(run())
+
+    assert len(result) == 6
+    file_manager.update_vacancies.assert_called_once()
+
+
+def test_collect_keeps_other_saved_vacancies(tmp_path: Any, vacancy_1: Vacancy) -> None:
+    """Проверяет, что сохранение результата пакетного сбора не удаляет из файла вакансии, записанные ранее"""
+    file_manager = JsonVacanciesFileManager(str(tmp_path / "vacancies.json"))
+    file_manager.save_vacancies([vacancy_1])
+    source = AsyncHeadHunterVacanciesSource()
+    source.get_vacancies_data = AsyncMock(return_value=[make_raw_vacancy("1"), make_raw_vacancy("2")])  # type: ignore
+
+    result = VacancyBatchCollector(source, file_manager).collect(["python"])
+
+    assert [vac.vac_id for vac in file_manager.read_vacancies()] == [vacancy_1.vac_id] + [vac.vac_id for vac in result]
+
+
+def test_collect_saves_outside_event_loop() -> None:
+    """Проверяет, что результат пакетного сбора сохраняется не в потоке цикла событий"""
+    source = AsyncHeadHunterVacanciesSource()
+    source.get_vacancies_data = AsyncMock(return_value=[make_raw_vacancy("1")])  # type: ignore
+    file_manager = MagicMock()
+    save_threads = []
+    file_manager.update_vacancies.side_effect = lambda *args: save_threads.append(threading.get_ident())
+
+    VacancyBatchCollector(source, file_manager).collect(["python"])
+
+    assert save_threads and save_threads[0] != threading.get_ident()
@@ -0,0 +1,73 @@
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.batched_writer import BatchedVacancyWriter
+from src.class_vacancy import Vacancy
+from src.file_manager import JsonLinesVacanciesFileManager, JsonVacanciesFileManager, SQLiteVacanciesFileManager
+
+
+@pytest.mark.parametrize("manager_class, file_name", [
+    (JsonVacanciesFileManager, "vacancies.json"),
+    (JsonLinesVacanciesFileManager, "vacancies.jsonl"),
+    (SQLiteVacanciesFileManager, "vacancies.db"),
+])
+def test_update_vacancies(tmp_path: Any, manager_class: Any, file_name: str, vacancy_1: Vacancy,
+                          vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет добавление и удаление вакансий за одну запись файла"""
+    manager = manager_class(str(tmp_path / file_name))
+    manager.save_vacancies([vacancy_1, vacancy_2])
+    replacement = Vacancy(vacancy_2.vac_id, "Новое название", vacancy_2.url, 1, 2, "", "", "", "")
+
+    result = manager.update_vacancies([replacement, vacancy_3, vacancy_3], [vacancy_1.vac_id, vacancy_2.vac_id, "404"])
+
+    assert result == (2, 2)
+    assert sorted((vac.vac_id, vac.name) for vac in manager.read_vacancies()) == sorted(
+        [(vacancy_2.vac_id, "Новое название"), (vacancy_3.vac_id, vacancy_3.name)])
+
+
+def test_writer_coalesces_changes(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет объединение накопленных изменений одной вакансии и их запись одним вызовом"""
+    file_manager = MagicMock()
+    file_manager.update_vacancies.return_value = (2, 1)
+    writer = BatchedVacancyWriter(file_manager)
+
+    writer.add_vacancies([vacancy_1, vacancy_2])
+    writer.remove_vacancies([vacancy_1.vac_id, vacancy_3.vac_id])
+    writer.add_vacancies([vacancy_3])
+
+    assert writer.pending == 4
+    assert writer.flush() == (2, 1)
+    file_manager.update_vacancies.assert_called_once_with([vacancy_2, vacancy_3], {vacancy_1.vac_id, vacancy_3.vac_id})
+    assert writer.pending == 0
+    assert writer.flush() == (0, 0)
+    file_manager.update_vacancies.assert_called_once()
+
+
+def test_writer_flushes_automatically(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет автоматическую запись при накоплении изменений и по истечении времени ожидания"""
+    file_manager = MagicMock()
+    writer = BatchedVacancyWriter(file_manager, max_pending=2, max_delay=10)
+
+    with patch("src.batched_writer.time.monotonic", return_value=100.0):
+        writer.add_vacancies([vacancy_1])
+        writer.remove_vacancies([vacancy_2.vac_id])
+    assert file_manager.update_vacancies.call_count == 1
+
+    with patch("src.batched_writer.time.monotonic", return_value=200.0):
+        writer.add_vacancies([vacancy_3])
+    with patch("src.batched_writer.time.monotonic", return_value=210.0):
+        writer.remove_vacancies([])
+    assert file_manager.update_vacancies.call_count == 2
+
+
+def test_writer_context_manager(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет запись накопленных изменений при выходе из контекстного менеджера"""
+    manager = JsonVacanciesFileManager(str(tmp_path / "vacancies.json"))
+
+    with BatchedVacancyWriter(manager) as writer:
+        writer.add_vacancies([vacancy_1, vacancy_2])
+        assert manager.read_vacancies() == []
+
+    assert [vac.vac_id for vac in manager.read_vacancies()] == [vacancy_1.vac_id, vacancy_2.vac_id]
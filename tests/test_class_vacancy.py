@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import Any
 
 import pytest
@@ -76,6 +77,15 @@ def test___eq__(vacancy_2: Vacancy, vacancy_4: Vacancy, vacancy_5: Vacancy) -> N
     assert Vacancy.__eq__(vacancy_2, "строка") is NotImplemented
 
 
+def test_sort_key(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет ключ сортировки вакансии и совпадение сортировки по ключу и по методу __lt__"""
+    vacancies = [vacancy_3, vacancy_1, vacancy_2]
+
+    assert vacancy_1.sort_key == (80000, 180000)
+    assert vacancy_3.sort_key == vacancy_3.salary_range == (0, 80000)
+    assert sorted(vacancies, key=attrgetter("sort_key"), reverse=True) == sorted(vacancies, reverse=True)
+
+
 @pytest.mark.parametrize("salary_from, expected", [
     (100000, 100000),
     (100000.0, 100000),
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.api_classes import HeadHunterVacanciesSource
+from src.deep_pagination import AreaPartitioner, PublicationDatePartitioner
+
+
+def make_source(max_pages: int = 2, per_page: int = 100) -> MagicMock:
+    """Возвращает фейковый источник вакансий с заданной глубиной выдачи"""
+    source = MagicMock(spec=HeadHunterVacanciesSource)
+    source.max_pages = max_pages
+    source.per_page = per_page
+    return source
+
+
+def test_area_partitioner_deduplicates() -> None:
+    """Проверяет объединение результатов подзапросов по регионам без повторов"""
+    source = make_source()
+    source.get_vacancies_data.side_effect = lambda key_word, params: {
+        1: [{"id": "1"}, {"id": "2"}],
+        2: [{"id": "2"}, {"id": "3"}],
+    }[params["area"]]
+    partitioner = AreaPartitioner([1, 2, 1], source)
+
+    result = partitioner.get_vacancies_data("python")
+
+    assert [vac["id"] for vac in result] == ["1", "2", "3"]
+    assert source.get_vacancies_data.call_count == 2
+
+
+def test_publication_date_partitioner_split() -> None:
+    """Проверяет деление интервала публикации, пока вакансий в нем больше глубины выдачи"""
+    date_to = datetime(2025, 1, 31, tzinfo=timezone.utc)
+    source = make_source()
+
+    def count_vacancies(key_word: str, params: dict) -> int:
+        start = datetime.strptime(params["date_from"], PublicationDatePartitioner.DATE_FORMAT)
+        end = datetime.strptime(params["date_to"], PublicationDatePartitioner.DATE_FORMAT)
+        return int((end - start) / timedelta(days=1) * 50)
+
+    source.count_vacancies.side_effect = count_vacancies
+    partitioner = PublicationDatePartitioner(source, period=timedelta(days=16), date_to=date_to)
+
+    windows = partitioner.split("python")
+
+    assert len(windows) == 4
+    assert windows[0]["date_from"] == "2025-01-15T00:00:00+0000"
+    assert windows[-1]["date_to"] == "2025-01-31T00:00:00+0000"
+    assert all(count_vacancies("python", window) <= partitioner.depth for window in windows)
+
+
+def test_publication_date_partitioner_skips_empty_windows() -> None:
+    """Проверяет, что интервалы без вакансий не запрашиваются"""
+    source = make_source()
+    source.count_vacancies.return_value = 0
+    partitioner = PublicationDatePartitioner(source)
+
+    assert partitioner.get_vacancies_data("python") == []
+    source.get_vacancies_data.assert_not_called()
+
+
+def test_publication_date_partitioner_min_window() -> None:
+    """Проверяет, что интервал не делится меньше минимального"""
+    source = make_source()
+    source.count_vacancies.return_value = 10000
+    partitioner = PublicationDatePartitioner(source, period=timedelta(hours=1), min_window=timedelta(minutes=30))
+    partitioner.logger = MagicMock()
+
+    windows = partitioner.split("python")
+
+    assert len(windows) == 2
+    partitioner.logger.warning.assert_called()
+
+
+def test_publication_date_partitioner_retries_failed_count() -> None:
+    """Проверяет, что интервал, количество вакансий в котором не удалось получить, запрашивается повторно"""
+    source = make_source()
+    source.count_vacancies.side_effect = [None, 150]
+    partitioner = PublicationDatePartitioner(source, period=timedelta(days=1),
+                                             date_to=datetime(2025, 1, 31, tzinfo=timezone.utc))
+
+    windows = partitioner.split("python")
+
+    assert windows == [{"date_from": "2025-01-30T00:00:00+0000", "date_to": "2025-01-31T00:00:00+0000"}]
+    assert source.count_vacancies.call_count == 2
+
+
+def test_publication_date_partitioner_count_failure() -> None:
+    """Проверяет, что интервал не теряется молча, если количество вакансий в нем так и не получено"""
+    source = make_source()
+    source.count_vacancies.return_value = None
+    partitioner = PublicationDatePartitioner(source, count_retries=1)
+    partitioner.logger = MagicMock()
+
+    with pytest.raises(RuntimeError):
+        partitioner.split("python")
+    assert source.count_vacancies.call_count == 2
+    source.get_vacancies_data.assert_not_called()
+
+
+def test_publication_date_partitioner_default_date_to() -> None:
+    """Проверяет, что период по умолчанию заканчивается текущим моментом и передается с часовым поясом"""
+    source = make_source()
+    source.count_vacancies.return_value = 150
+    partitioner = PublicationDatePartitioner(source, period=timedelta(days=1))
+
+    before = datetime.now(timezone.utc).replace(microsecond=0)
+    windows = partitioner.split("python")
+
+    date_to = datetime.strptime(windows[0]["date_to"], PublicationDatePartitioner.DATE_FORMAT)
+    assert date_to.tzinfo is not None
+    assert date_to >= before
@@ -0,0 +1,94 @@
+import multiprocessing
+import os
+import threading
+from typing import Any
+
+import pytest
+
+from src.class_vacancy import Vacancy
+from src.file_lock import FileLock
+from src.file_manager import JsonLinesVacanciesFileManager, JsonVacanciesFileManager
+
+CONTEXT = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn")
+
+
+def hold_lock(path: str, locked: Any, release: Any) -> None:
+    """Захватывает блокировку в дочернем процессе и удерживает ее до сигнала"""
+    with FileLock(path):
+        locked.set()
+        release.wait(10)
+
+
+def add_vacancies(manager_class: Any, filename: str, worker: int) -> None:
+    """Добавляет вакансии в общий файл из дочернего процесса"""
+    manager = manager_class(filename)
+    for number in range(5):
+        vac_id = f"{worker}-{number}"
+        manager.add_vacancies([Vacancy(vac_id, "Вакансия", f"https://hh.ru/vacancy/{vac_id}", 0, 0, "", "", "", "")])
+
+
+def test_lock_is_reentrant(tmp_path: Any) -> None:
+    """Проверяет повторный захват блокировки владеющим ею потоком"""
+    lock = FileLock.for_path(str(tmp_path / "vacancies.json.lock"))
+
+    with lock:
+        with lock:
+            assert lock.is_locked
+        assert lock.is_locked
+
+    assert not lock.is_locked
+    assert FileLock.for_path(str(tmp_path / "vacancies.json.lock")) is lock
+
+
+def test_lock_blocks_other_thread(tmp_path: Any) -> None:
+    """Проверяет, что блокировка, захваченная потоком, недоступна другому потоку"""
+    lock = FileLock(str(tmp_path / "vacancies.json.lock"), timeout=0.1)
+    errors = []
+
+    def try_lock() -> None:
+        try:
+            lock.acquire()
+        except TimeoutError as err:
+            errors.append(err)
+
+    with lock:
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+
+    assert len(errors) == 1
+
+
+def test_lock_blocks_other_process(tmp_path: Any) -> None:
+    """Проверяет, что блокировка, захваченная другим процессом, ожидается до истечения времени ожидания"""
+    path = str(tmp_path / "vacancies.json.lock")
+    locked, release = CONTEXT.Event(), CONTEXT.Event()
+    process = CONTEXT.Process(target=hold_lock, args=(path, locked, release))
+    process.start()
+    try:
+        assert locked.wait(10)
+        with pytest.raises(TimeoutError):
+            FileLock(path, timeout=0.2).acquire()
+    finally:
+        release.set()
+        process.join(10)
+
+    with FileLock(path, timeout=1):
+        assert os.path.exists(path)
+
+
+@pytest.mark.parametrize("manager_class, file_name", [
+    (JsonVacanciesFileManager, "vacancies.json"),
+    (JsonLinesVacanciesFileManager, "vacancies.jsonl"),
+])
+def test_concurrent_add_without_lost_updates(tmp_path: Any, manager_class: Any, file_name: str) -> None:
+    """Проверяет, что вакансии, одновременно добавляемые несколькими процессами, не теряются"""
+    filename = str(tmp_path / file_name)
+    manager_class(filename)
+    processes = [CONTEXT.Process(target=add_vacancies, args=(manager_class, filename, worker)) for worker in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+
+    assert len({vac.vac_id for vac in manager_class(filename).read_vacancies()}) == 20
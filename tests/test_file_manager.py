@@ -1,11 +1,27 @@
 import json
+import os
 from typing import Any
 from unittest.mock import MagicMock, mock_open, patch
 
+import pandas as pd
 import pytest
 
 from src.class_vacancy import Vacancy
-from src.file_manager import CSVVacanciesFileManager, JsonVacanciesFileManager, XLSXVacanciesFileManager
+from src.file_manager import (
+    CSVVacanciesFileManager,
+    FsyncPolicy,
+    JsonLinesVacanciesFileManager,
+    JsonVacanciesFileManager,
+    ParquetVacanciesFileManager,
+    SQLiteVacanciesFileManager,
+    XLSXVacanciesFileManager
+)
+
+
+@pytest.fixture(autouse=True)
+def work_in_tmp_path(tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Переходит во временный каталог, чтобы файлы блокировки не создавались в каталоге проекта"""
+    monkeypatch.chdir(tmp_path)
 
 
 @pytest.mark.parametrize("manager_class, file_path, file_name", [
@@ -269,24 +285,30 @@ def test_read_vacancies_from_xlsx_error(mock_open_file: Any, mock_dataframe: Any
     assert result == []
 
 
+@patch("src.file_manager.os.replace")
 @patch("src.file_manager.json.dump")
 @patch("src.file_manager.open", new_callable=mock_open)
 def test_save_vacancies_to_json_success(mock_open_file: Any,
                                         mock_json_dump: Any,
+                                        mock_replace: Any,
                                         vacancy_1: Vacancy,
                                         vacancy_2: Vacancy) -> None:
-    """Проверяет сериализацию вакансий в Json-файл"""
+    """Проверяет сериализацию вакансий во временный файл, который затем заменяет Json-файл"""
     vacancies = [vacancy_1, vacancy_2]
     instance = JsonVacanciesFileManager.__new__(JsonVacanciesFileManager)
     instance._JsonVacanciesFileManager__filename = "test.json"
     instance.logger = MagicMock()
+    instance.fsync_policy = FsyncPolicy(FsyncPolicy.NEVER)
 
     mock_vacancy_dicts = [{"title": "dev"}]
     instance._vacancies_to_dicts = MagicMock(return_value=mock_vacancy_dicts)
 
     instance.save_vacancies(vacancies)
 
-    mock_open_file.assert_called_once_with("test.json", "w", encoding="utf-8")
+    tmp_filename = mock_open_file.call_args.args[0]
+    assert tmp_filename.startswith("test.json.") and tmp_filename.endswith(".tmp.json")
+    mock_open_file.assert_called_once_with(tmp_filename, "w", encoding="utf-8")
+    mock_replace.assert_called_once_with(tmp_filename, "test.json")
     instance._vacancies_to_dicts.assert_called_once_with(vacancies)
     mock_json_dump.assert_called_once_with(
         mock_vacancy_dicts,
@@ -305,19 +327,25 @@ def test_save_vacancies_to_json_error(mock_open_file: Any, vacancy_1: Vacancy) -
     instance = JsonVacanciesFileManager.__new__(JsonVacanciesFileManager)
     instance._JsonVacanciesFileManager__filename = "test.json"
     instance.logger = MagicMock()
+    instance.fsync_policy = FsyncPolicy(FsyncPolicy.NEVER)
     instance._vacancies_to_dicts = MagicMock()
 
     instance.save_vacancies(vacancies)
     instance.logger.error.assert_called_once()
 
 
+@patch("src.file_manager.os.replace")
 @patch("src.file_manager.pd.DataFrame")
-def test_save_vacancies_to_csv_success(mock_dataframe: Any, vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+def test_save_vacancies_to_csv_success(mock_dataframe: Any,
+                                       mock_replace: Any,
+                                       vacancy_1: Vacancy,
+                                       vacancy_2: Vacancy) -> None:
     """Проверяет сериализацию вакансий в CSV-файл"""
     vacancies = [vacancy_1, vacancy_2]
     instance = CSVVacanciesFileManager.__new__(CSVVacanciesFileManager)
     instance._CSVVacanciesFileManager__filename = "test.csv"
     instance.logger = MagicMock()
+    instance.fsync_policy = FsyncPolicy(FsyncPolicy.NEVER)
 
     mock_vacancy_dicts = [{"title": "a"}, {"title": "b"}]
     instance._vacancies_to_dicts = MagicMock(return_value=mock_vacancy_dicts)
@@ -329,7 +357,9 @@ def test_save_vacancies_to_csv_success(mock_dataframe: Any, vacancy_1: Vacancy,
 
     instance._vacancies_to_dicts.assert_called_once_with(vacancies)
     mock_dataframe.assert_called_once_with(mock_vacancy_dicts)
-    mock_df_instance.to_csv.assert_called_once_with("test.csv", index=False, encoding="utf-8")
+    tmp_filename = mock_df_instance.to_csv.call_args.args[0]
+    mock_df_instance.to_csv.assert_called_once_with(tmp_filename, index=False, encoding="utf-8")
+    mock_replace.assert_called_once_with(tmp_filename, "test.csv")
 
     instance.logger.info.assert_any_call("Файл test.csv открыт для редактирования")
     instance.logger.info.assert_any_call("Данные о вакансиях сохранены в файл test.csv")
@@ -342,6 +372,7 @@ def test_save_vacancies_to_csv_error(mock_dataframe: Any, vacancy_1: Vacancy) ->
     instance = CSVVacanciesFileManager.__new__(CSVVacanciesFileManager)
     instance._CSVVacanciesFileManager__filename = "test.csv"
     instance.logger = MagicMock()
+    instance.fsync_policy = FsyncPolicy(FsyncPolicy.NEVER)
 
     instance._vacancies_to_dicts = MagicMock(return_value=[{"title": "dev"}])
 
@@ -353,13 +384,18 @@ def test_save_vacancies_to_csv_error(mock_dataframe: Any, vacancy_1: Vacancy) ->
     instance.logger.error.assert_called_once()
 
 
+@patch("src.file_manager.os.replace")
 @patch("src.file_manager.pd.DataFrame")
-def test_save_vacancies_to_xlsx_success(mock_dataframe: Any, vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+def test_save_vacancies_to_xlsx_success(mock_dataframe: Any,
+                                        mock_replace: Any,
+                                        vacancy_1: Vacancy,
+                                        vacancy_2: Vacancy) -> None:
     """Проверяет сериализацию вакансий в XLSX-файл"""
     vacancies = [vacancy_1, vacancy_2]
     instance = XLSXVacanciesFileManager.__new__(XLSXVacanciesFileManager)
     instance._XLSXVacanciesFileManager__filename = "test.xlsx"
     instance.logger = MagicMock()
+    instance.fsync_policy = FsyncPolicy(FsyncPolicy.NEVER)
 
     mock_vacancy_dicts = [{"title": "a"}, {"title": "b"}]
     instance._vacancies_to_dicts = MagicMock(return_value=mock_vacancy_dicts)
@@ -371,7 +407,9 @@ def test_save_vacancies_to_xlsx_success(mock_dataframe: Any, vacancy_1: Vacancy,
 
     instance._vacancies_to_dicts.assert_called_once_with(vacancies)
     mock_dataframe.assert_called_once_with(mock_vacancy_dicts)
-    mock_df_instance.to_excel.assert_called_once_with("test.xlsx", index=False, engine="openpyxl")
+    tmp_filename = mock_df_instance.to_excel.call_args.args[0]
+    mock_df_instance.to_excel.assert_called_once_with(tmp_filename, index=False, engine="openpyxl")
+    mock_replace.assert_called_once_with(tmp_filename, "test.xlsx")
 
     instance.logger.info.assert_any_call("Файл test.xlsx открыт для редактирования")
     instance.logger.info.assert_any_call("Данные о вакансиях сохранены в файл test.xlsx")
@@ -384,6 +422,7 @@ def test_save_vacancies_to_xlsx_error(mock_dataframe: Any, vacancy_1: Vacancy) -
     instance = XLSXVacanciesFileManager.__new__(XLSXVacanciesFileManager)
     instance._XLSXVacanciesFileManager__filename = "test.xlsx"
     instance.logger = MagicMock()
+    instance.fsync_policy = FsyncPolicy(FsyncPolicy.NEVER)
 
     instance._vacancies_to_dicts = MagicMock(return_value=[{"title": "dev"}])
 
@@ -393,3 +432,395 @@ def test_save_vacancies_to_xlsx_error(mock_dataframe: Any, vacancy_1: Vacancy) -
 
     instance.save_vacancies(vacancies)
     instance.logger.error.assert_called_once()
+
+
+def test_jsonl_add_and_read(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет дозапись вакансий в JSONL-файл и их построчное чтение"""
+    filename = tmp_path / "vacancies.jsonl"
+    manager = JsonLinesVacanciesFileManager(str(filename))
+
+    manager.add_vacancies([vacancy_1, vacancy_2])
+    manager.add_vacancies([vacancy_2, vacancy_3, vacancy_3])
+
+    assert [vac.vac_id for vac in manager.read_vacancies()] == [vacancy_1.vac_id, vacancy_2.vac_id, vacancy_3.vac_id]
+    assert len(filename.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_jsonl_remove_and_compact(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет удаление вакансии отметкой в конце файла и сжатие файла"""
+    filename = tmp_path / "vacancies.jsonl"
+    manager = JsonLinesVacanciesFileManager(str(filename), compact_ratio=1)
+    manager.save_vacancies([vacancy_1, vacancy_2, vacancy_3])
+
+    manager.remove_vacancies(vacancy_2)
+
+    assert [vac.vac_id for vac in manager.iter_vacancies()] == [vacancy_1.vac_id, vacancy_3.vac_id]
+    assert len(filename.read_text(encoding="utf-8").splitlines()) == 4
+
+    manager.compact()
+
+    assert len(filename.read_text(encoding="utf-8").splitlines()) == 2
+    assert [vac.vac_id for vac in manager.read_vacancies()] == [vacancy_1.vac_id, vacancy_3.vac_id]
+
+
+def test_jsonl_auto_compact(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет автоматическое сжатие файла при большом количестве отметок об удалении"""
+    filename = tmp_path / "vacancies.jsonl"
+    manager = JsonLinesVacanciesFileManager(str(filename), compact_ratio=0.3)
+    manager.save_vacancies([vacancy_1, vacancy_2])
+
+    manager.remove_vacancies(vacancy_1)
+
+    assert len(filename.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_jsonl_auto_compact_default_ratio(tmp_path: Any, vacancy_1: Vacancy) -> None:
+    """Проверяет, что при настройках по умолчанию файл сжимается, когда удалена большая часть вакансий"""
+    filename = tmp_path / "vacancies.jsonl"
+    manager = JsonLinesVacanciesFileManager(str(filename))
+    vacancies = [Vacancy(str(number), vacancy_1.name, vacancy_1.url, vacancy_1.salary_from, vacancy_1.salary_to,
+                         vacancy_1.employer_name, vacancy_1.employer_url, vacancy_1.requirements, vacancy_1.area)
+                 for number in range(10)]
+    manager.add_vacancies(vacancies)
+
+    for vacancy in vacancies[:8]:
+        manager.remove_vacancies(vacancy)
+
+    assert len(filename.read_text(encoding="utf-8").splitlines()) < 10
+    assert [vac.vac_id for vac in manager.read_vacancies()] == ["8", "9"]
+
+
+def test_jsonl_add_after_remove(tmp_path: Any, vacancy_1: Vacancy) -> None:
+    """Проверяет повторное добавление удаленной вакансии"""
+    manager = JsonLinesVacanciesFileManager(str(tmp_path / "vacancies.jsonl"), compact_ratio=1)
+    manager.add_vacancies([vacancy_1])
+    manager.remove_vacancies(vacancy_1)
+    manager.logger = MagicMock()
+
+    manager.remove_vacancies(vacancy_1)
+    manager.add_vacancies([vacancy_1])
+
+    manager.logger.info.assert_any_call(f"Вакансия {vacancy_1.name} не найдена")
+    assert [vac.vac_id for vac in manager.read_vacancies()] == [vacancy_1.vac_id]
+
+
+def test_jsonl_external_change(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет, что изменения файла другим объектом учитываются при дозаписи"""
+    filename = str(tmp_path / "vacancies.jsonl")
+    first = JsonLinesVacanciesFileManager(filename)
+    second = JsonLinesVacanciesFileManager(filename)
+    first.add_vacancies([vacancy_1])
+
+    second.add_vacancies([vacancy_2])
+    first.add_vacancies([vacancy_2])
+
+    assert [vac.vac_id for vac in first.read_vacancies()] == [vacancy_1.vac_id, vacancy_2.vac_id]
+
+
+def test_jsonl_skip_broken_line(tmp_path: Any, vacancy_1: Vacancy) -> None:
+    """Проверяет пропуск поврежденной строки при чтении JSONL-файла"""
+    filename = tmp_path / "vacancies.jsonl"
+    manager = JsonLinesVacanciesFileManager(str(filename))
+    manager.add_vacancies([vacancy_1])
+    with open(filename, "a", encoding="utf-8") as f:
+        f.write('{"vac_id": "broken"\n')
+
+    assert [vac.vac_id for vac in manager.read_vacancies()] == [vacancy_1.vac_id]
+
+
+def test_jsonl_persistent_index(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет, что индекс JSONL-файла сохраняется и используется другим объектом без перестроения"""
+    filename = str(tmp_path / "vacancies.jsonl")
+    JsonLinesVacanciesFileManager(filename, compact_ratio=1).add_vacancies([vacancy_1, vacancy_2, vacancy_3])
+    manager = JsonLinesVacanciesFileManager(filename, compact_ratio=1)
+    manager.logger = MagicMock()
+
+    manager.remove_vacancies(vacancy_2)
+
+    assert manager.has_vacancy(vacancy_1.vac_id)
+    assert not manager.has_vacancy(vacancy_2.vac_id)
+    assert manager.get_vacancy(vacancy_3.vac_id).requirements == vacancy_3.requirements  # type: ignore[union-attr]
+    assert manager.get_vacancy(vacancy_2.vac_id) is None
+    assert all("индекс" not in str(call) for call in manager.logger.info.call_args_list)
+    assert os.path.exists(f"{filename}.idx")
+
+
+def test_jsonl_index_compaction(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет, что файл индекса переписывается при росте числа записей и загружается без потерь"""
+    filename = str(tmp_path / "vacancies.jsonl")
+    vacancies = [Vacancy(str(number), vacancy_1.name, vacancy_1.url, vacancy_1.salary_from, vacancy_1.salary_to,
+                         vacancy_1.employer_name, vacancy_1.employer_url, vacancy_1.requirements, vacancy_1.area)
+                 for number in range(20)]
+    manager = JsonLinesVacanciesFileManager(filename, compact_ratio=1)
+    manager.INDEX_MIN_REWRITE_LINES = 10  # type: ignore[misc]
+    manager.add_vacancies(vacancies + [vacancy_2])
+    for vacancy in vacancies:
+        manager.remove_vacancies(vacancy)
+
+    with open(f"{filename}.idx", encoding="utf-8") as f:
+        assert len(f.readlines()) <= 10
+    other = JsonLinesVacanciesFileManager(filename, compact_ratio=1)
+    assert not other.has_vacancy(vacancies[-1].vac_id)
+    assert other.get_vacancy(vacancy_2.vac_id).name == vacancy_2.name  # type: ignore[union-attr]
+
+
+def test_jsonl_index_catch_up(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет дополнение индекса строками, дозаписанными в файл без его обновления"""
+    filename = tmp_path / "vacancies.jsonl"
+    manager = JsonLinesVacanciesFileManager(str(filename))
+    manager.add_vacancies([vacancy_1])
+    with open(filename, "a", encoding="utf-8") as f:
+        f.write(json.dumps(manager._vacancy_to_dict(vacancy_2), ensure_ascii=False) + "\n")
+
+    other = JsonLinesVacanciesFileManager(str(filename))
+
+    assert other.get_vacancy(vacancy_2.vac_id).name == vacancy_2.name  # type: ignore[union-attr]
+    assert [vac.vac_id for vac in manager.read_vacancies()] == [vacancy_1.vac_id, vacancy_2.vac_id]
+
+
+def test_jsonl_index_rebuild(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет перестроение поврежденного или устаревшего индекса"""
+    filename = tmp_path / "vacancies.jsonl"
+    JsonLinesVacanciesFileManager(str(filename)).save_vacancies([vacancy_1])
+    (tmp_path / "vacancies.jsonl.idx").write_text("{broken", encoding="utf-8")
+    manager = JsonLinesVacanciesFileManager(str(filename))
+
+    assert manager.has_vacancy(vacancy_1.vac_id)
+
+    filename.write_text(json.dumps({"vac_id": vacancy_2.vac_id}) + "\n", encoding="utf-8")
+
+    assert not manager.has_vacancy(vacancy_1.vac_id)
+    assert manager.has_vacancy(vacancy_2.vac_id)
+
+
+def test_has_and_get_vacancy(vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет поиск вакансии по id в файле, который не поддерживает индекс"""
+    with patch("src.file_manager.JsonVacanciesFileManager._JsonVacanciesFileManager__create_file_if_not_exists"):
+        manager = JsonVacanciesFileManager("test.json")
+    with patch.object(manager, "read_vacancies", return_value=[vacancy_1, vacancy_2]):
+        assert manager.has_vacancy(vacancy_2.vac_id)
+        assert manager.get_vacancy("404") is None
+
+
+def test_sqlite_save_and_read(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет сохранение и чтение вакансий из базы данных SQLite"""
+    manager = SQLiteVacanciesFileManager(str(tmp_path / "vacancies.db"))
+
+    manager.save_vacancies([vacancy_1, vacancy_2])
+    result = manager.read_vacancies()
+
+    assert [vac.vac_id for vac in result] == [vacancy_1.vac_id, vacancy_2.vac_id]
+    assert result[1].salary_to == vacancy_2.salary_to
+    assert result[0].requirements == vacancy_1.requirements
+
+
+def test_sqlite_upsert_and_remove(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет добавление с обновлением и удаление вакансий по ключу"""
+    manager = SQLiteVacanciesFileManager(str(tmp_path / "vacancies.db"))
+    manager.add_vacancies([vacancy_1])
+    updated = Vacancy(vacancy_1.vac_id, "Новое название", vacancy_1.url, 1, 2, "", "", "", "")
+
+    manager.add_vacancies([updated, vacancy_2])
+    manager.logger = MagicMock()
+    manager.remove_vacancies(vacancy_2)
+    manager.remove_vacancies(vacancy_2)
+
+    manager.logger.info.assert_any_call(f"Вакансия {vacancy_2.name} успешно удалена")
+    manager.logger.info.assert_called_with(f"Вакансия {vacancy_2.name} не найдена")
+    result = manager.read_vacancies()
+    assert [(vac.vac_id, vac.name) for vac in result] == [(vacancy_1.vac_id, "Новое название")]
+
+
+def test_sqlite_find_vacancies(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет фильтрацию вакансий средствами базы данных"""
+    manager = SQLiteVacanciesFileManager(str(tmp_path / "vacancies.db"))
+    manager.save_vacancies([vacancy_1, vacancy_2, vacancy_3])
+
+    by_words = manager.find_vacancies(["ТЕСТИРОВЩИК", "sql"])
+    by_salary = manager.find_vacancies(min_salary=0, max_salary=120000)
+    combined = manager.find_vacancies(["python", "sql"], 50000, 200000)
+
+    assert [vac.vac_id for vac in by_words] == [vacancy_2.vac_id, vacancy_3.vac_id]
+    assert [vac.vac_id for vac in by_salary] == [vacancy_2.vac_id, vacancy_3.vac_id]
+    assert [vac.vac_id for vac in combined] == [vacancy_1.vac_id]
+    assert manager.find_vacancies(['"']) == []
+    assert len(manager.find_vacancies([" "])) == 3
+
+
+def test_sqlite_get_vacancy(tmp_path: Any, vacancy_1: Vacancy) -> None:
+    """Проверяет поиск вакансии в базе данных по первичному ключу"""
+    manager = SQLiteVacanciesFileManager(str(tmp_path / "vacancies.db"))
+    manager.add_vacancies([vacancy_1])
+
+    assert manager.has_vacancy(vacancy_1.vac_id)
+    assert not manager.has_vacancy("404")
+    assert manager.get_vacancy(vacancy_1.vac_id).name == vacancy_1.name  # type: ignore[union-attr]
+
+
+def test_remove_vacancies_batch(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет удаление нескольких вакансий с однократной перезаписью файла"""
+    with patch("src.file_manager.JsonVacanciesFileManager._JsonVacanciesFileManager__create_file_if_not_exists"):
+        manager = JsonVacanciesFileManager("test.json")
+    with (patch.object(manager, "read_vacancies", return_value=[vacancy_1, vacancy_2, vacancy_3]),
+          patch.object(manager, "save_vacancies") as mock_save):
+        result = manager.remove_vacancies_batch([vacancy_1.vac_id, "404"], lambda vac: vac.area == "Волгоград")
+
+    assert result == (2, 1)
+    mock_save.assert_called_once_with([vacancy_2])
+
+
+def test_remove_vacancies_batch_nothing_found(vacancy_1: Vacancy) -> None:
+    """Проверяет, что файл не перезаписывается, если удалять нечего"""
+    with patch("src.file_manager.JsonVacanciesFileManager._JsonVacanciesFileManager__create_file_if_not_exists"):
+        manager = JsonVacanciesFileManager("test.json")
+    with (patch.object(manager, "read_vacancies", return_value=[vacancy_1]),
+          patch.object(manager, "save_vacancies") as mock_save):
+        assert manager.remove_vacancies_batch(["404", "405", "404"]) == (0, 2)
+
+    mock_save.assert_not_called()
+
+
+def test_jsonl_remove_vacancies_batch(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy,
+                                      vacancy_3: Vacancy) -> None:
+    """Проверяет удаление нескольких вакансий из JSONL-файла одной дозаписью"""
+    filename = tmp_path / "vacancies.jsonl"
+    manager = JsonLinesVacanciesFileManager(str(filename), compact_ratio=1)
+    manager.save_vacancies([vacancy_1, vacancy_2, vacancy_3])
+
+    result = manager.remove_vacancies_batch([vacancy_1.vac_id, "404"], lambda vac: vac.salary_from == 0)
+
+    assert result == (2, 1)
+    assert [vac.vac_id for vac in manager.read_vacancies()] == [vacancy_2.vac_id]
+    assert len(filename.read_text(encoding="utf-8").splitlines()) == 5
+
+
+def test_sqlite_remove_vacancies_batch(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy,
+                                       vacancy_3: Vacancy) -> None:
+    """Проверяет удаление нескольких вакансий из базы данных в одной транзакции"""
+    manager = SQLiteVacanciesFileManager(str(tmp_path / "vacancies.db"))
+    manager.save_vacancies([vacancy_1, vacancy_2, vacancy_3])
+
+    assert manager.remove_vacancies_batch([vacancy_1.vac_id, "404"], lambda vac: vac.area == "Волгоград") == (2, 1)
+    assert manager.remove_vacancies_batch(predicate=lambda vac: False) == (0, 0)
+    assert [vac.vac_id for vac in manager.read_vacancies()] == [vacancy_2.vac_id]
+    assert manager.find_vacancies(["SQL"]) == []
+
+
+def test_atomic_write_keeps_file_on_error(tmp_path: Any, vacancy_1: Vacancy) -> None:
+    """Проверяет, что при ошибке записи исходный файл не изменяется, а временный файл удаляется"""
+    filename = tmp_path / "vacancies.json"
+    manager = JsonVacanciesFileManager(str(filename), fsync=FsyncPolicy.ALWAYS)
+    manager.save_vacancies([vacancy_1])
+
+    with patch("src.file_manager.json.dump", side_effect=ValueError("error")):
+        manager.save_vacancies([])
+
+    assert [vac.vac_id for vac in manager.read_vacancies()] == [vacancy_1.vac_id]
+    assert sorted(os.listdir(tmp_path)) == ["vacancies.json", "vacancies.json.lock"]
+
+
+@pytest.mark.parametrize("mode, expected", [
+    (FsyncPolicy.ALWAYS, [True, True, True]),
+    (FsyncPolicy.BATCHED, [False, True, False]),
+    (FsyncPolicy.NEVER, [False, False, False]),
+])
+def test_fsync_policy(mode: str, expected: list[bool]) -> None:
+    """Проверяет, после каких записей политика требует сброса данных на диск"""
+    policy = FsyncPolicy(mode, batch_size=2, interval=60)
+
+    assert [policy.should_sync() for _ in range(3)] == expected
+
+
+def test_fsync_policy_unknown_mode() -> None:
+    """Проверяет ошибку при неизвестной политике сброса данных на диск"""
+    with pytest.raises(ValueError):
+        FsyncPolicy("sometimes")
+
+
+def test_jsonl_append_after_torn_write(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет, что дозапись после оборванной строки не повреждает новую вакансию"""
+    filename = tmp_path / "vacancies.jsonl"
+    manager = JsonLinesVacanciesFileManager(str(filename), fsync=FsyncPolicy.ALWAYS)
+    manager.add_vacancies([vacancy_1])
+    with open(filename, "a", encoding="utf-8") as f:
+        f.write('{"vac_id": "torn"')
+
+    manager.add_vacancies([vacancy_2])
+
+    assert [vac.vac_id for vac in manager.read_vacancies()] == [vacancy_1.vac_id, vacancy_2.vac_id]
+
+
+def test_parquet_save_and_read(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет сохранение вакансий в Parquet-файл и их чтение"""
+    manager = ParquetVacanciesFileManager(str(tmp_path / "vacancies.parquet"))
+    assert manager.read_vacancies() == []
+
+    manager.save_vacancies([vacancy_1, vacancy_2, vacancy_3])
+    result = manager.read_vacancies()
+
+    assert [vac.vac_id for vac in result] == [vacancy_1.vac_id, vacancy_2.vac_id, vacancy_3.vac_id]
+    assert [(vac.salary_from, vac.salary_to) for vac in result] == [(80000, 180000), (110000, 110000), (0, 80000)]
+    assert result[0].requirements == vacancy_1.requirements
+
+
+def test_parquet_read_dataframe(tmp_path: Any, vacancy_1: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет чтение из Parquet-файла только нужных столбцов с целочисленными зарплатами"""
+    manager = ParquetVacanciesFileManager(str(tmp_path / "vacancies.parquet"), compression="gzip")
+    manager.save_vacancies([vacancy_1, vacancy_3])
+
+    df = manager.read_dataframe(["salary_from", "area"])
+
+    assert str(pd.read_parquet(manager.filename)["salary_from"].dtype) == "Int64"
+    assert list(df.columns) == ["salary_from", "area"]
+    assert str(df["salary_from"].dtype) == "int64"
+    assert df["salary_from"].tolist() == [80000, 0]
+    assert df["area"].tolist() == ["Москва", "Волгоград"]
+
+
+def test_parquet_add_vacancies(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет дозапись вакансий в Parquet-файл"""
+    manager = ParquetVacanciesFileManager(str(tmp_path / "vacancies.parquet"), compression=None)
+    manager.add_vacancies([vacancy_1])
+
+    manager.add_vacancies([vacancy_1, vacancy_2])
+
+    assert [vac.vac_id for vac in manager.read_vacancies()] == [vacancy_1.vac_id, vacancy_2.vac_id]
+
+
+@pytest.mark.parametrize("manager_class, file_name", [
+    (JsonVacanciesFileManager, "vacancies.json"),
+    (CSVVacanciesFileManager, "vacancies.csv"),
+    (XLSXVacanciesFileManager, "vacancies.xlsx"),
+    (JsonLinesVacanciesFileManager, "vacancies.jsonl"),
+    (SQLiteVacanciesFileManager, "vacancies.db"),
+    (ParquetVacanciesFileManager, "vacancies.parquet"),
+])
+def test_read_dataframe(tmp_path: Any, manager_class: Any, file_name: str, vacancy_1: Vacancy,
+                        vacancy_3: Vacancy) -> None:
+    """Проверяет чтение вакансий в таблицу pandas с выбранными столбцами и едиными типами"""
+    manager = manager_class(str(tmp_path / file_name))
+    assert list(manager.read_dataframe(["vac_id", "salary_to"]).columns) == ["vac_id", "salary_to"]
+    manager.save_vacancies([vacancy_1, vacancy_3])
+
+    df = manager.read_dataframe(["vac_id", "salary_from", "salary_to", "area"])
+    result = manager.read_vacancies()
+
+    assert df.values.tolist() == [[vacancy_1.vac_id, 80000, 180000, "Москва"],
+                                  [vacancy_3.vac_id, 0, 80000, "Волгоград"]]
+    assert [str(dtype) for dtype in df.dtypes[1:3]] == ["int64", "int64"]
+    assert [(vac.vac_id, vac.salary_range, vac.url) for vac in result] == [
+        (vacancy_1.vac_id, (80000, 180000), vacancy_1.url), (vacancy_3.vac_id, (0, 80000), vacancy_3.url)]
+
+
+def test_read_dataframe_error(tmp_path: Any) -> None:
+    """Проверяет, что при ошибке чтения возвращается пустая таблица"""
+    filename = tmp_path / "vacancies.json"
+    manager = JsonVacanciesFileManager(str(filename))
+    filename.write_text("{broken", encoding="utf-8")
+    manager.logger = MagicMock()
+
+    df = manager.read_dataframe(["name", "salary_from"])
+
+    assert df.empty
+    assert list(df.columns) == ["name", "salary_from"]
+    manager.logger.error.assert_called_once()
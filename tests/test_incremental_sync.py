@@ -0,0 +1,115 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+from src.api_classes import HeadHunterVacanciesSource
+from src.incremental_sync import IncrementalVacancyCollector
+
+
+def make_raw_vacancy(vac_id: str, published_at: str) -> dict:
+    """Возвращает данные о вакансии в формате API HeadHunter.ru"""
+    return {"id": vac_id,
+            "name": f"Vacancy {vac_id}",
+            "alternate_url": f"https://hh.ru/vacancy/{vac_id}",
+            "salary": {"from": 100000, "to": None, "currency": "RUR"},
+            "employer": {"name": "Company", "alternate_url": "https://hh.ru/employer/1"},
+            "snippet": {"requirement": "Python"},
+            "area": {"name": "Москва"},
+            "published_at": published_at}
+
+
+def make_collector(tmp_path: Any, responses: list[Any]) -> tuple[IncrementalVacancyCollector, Any, Any]:
+    """
+    Возвращает коллектор с фейковым источником и файловым менеджером. Ответ источника - список вакансий
+    (полный результат) или кортеж из вакансий, количества найденных вакансий и количества не полученных страниц
+    """
+    source = HeadHunterVacanciesSource()
+    source.fetch_vacancies_data = MagicMock(side_effect=[  # type: ignore
+        response if isinstance(response, tuple) else (response, len(response), 0) for response in responses])
+    file_manager = MagicMock()
+    collector = IncrementalVacancyCollector(source, file_manager, str(tmp_path / "state.json"))
+    return collector, source, file_manager
+
+
+def test_sync_first_run(tmp_path: Any) -> None:
+    """Проверяет первый запуск: запрашиваются все вакансии и запоминается дата самой новой"""
+    collector, source, file_manager = make_collector(tmp_path, [[
+        make_raw_vacancy("1", "2025-07-20T10:00:00+0300"),
+        make_raw_vacancy("2", "2025-07-21T09:00:00+0300"),
+    ]])
+
+    result = collector.sync("Python")
+
+    assert [vac.vac_id for vac in result] == ["1", "2"]
+    assert source.fetch_vacancies_data.call_args.args == ("Python", {"order_by": "publication_time"})
+    file_manager.add_vacancies.assert_called_once_with(result)
+    assert collector.get_watermark("python") == "2025-07-21T09:00:00+0300"
+
+
+def test_sync_next_run(tmp_path: Any) -> None:
+    """Проверяет повторный запуск: запрашиваются только вакансии новее сохраненной отметки"""
+    collector, source, file_manager = make_collector(tmp_path, [
+        [make_raw_vacancy("1", "2025-07-20T10:00:00+0300")],
+        [],
+    ])
+    collector.sync("python")
+
+    result = collector.sync("python")
+
+    assert result == []
+    assert source.fetch_vacancies_data.call_args.args[1]["date_from"] == "2025-07-20T10:00:00+0300"
+    file_manager.add_vacancies.assert_called_once()
+    assert collector.get_watermark("python") == "2025-07-20T10:00:00+0300"
+
+
+def test_reset(tmp_path: Any) -> None:
+    """Проверяет сброс отметки для запроса"""
+    collector, _, _ = make_collector(tmp_path, [[make_raw_vacancy("1", "2025-07-20T10:00:00+0300")]])
+    collector.sync("python")
+
+    collector.reset("python")
+
+    assert collector.get_watermark("python") is None
+
+
+def test_latest_published_at() -> None:
+    """Проверяет выбор наибольшей даты публикации с учетом часового пояса"""
+    vacancies_data = [make_raw_vacancy("1", "2025-07-20T10:00:00+0300"),
+                      make_raw_vacancy("2", "2025-07-20T08:30:00+0000"),
+                      make_raw_vacancy("3", "некорректная дата")]
+
+    result = IncrementalVacancyCollector._latest_published_at(vacancies_data, "2025-07-19T10:00:00+0300")
+
+    assert result == "2025-07-20T08:30:00+0000"
+
+
+def test_sync_truncated_result(tmp_path: Any) -> None:
+    """Проверяет, что вакансии сверх глубины выдачи запрашиваются следующим интервалом до самой старой вакансии"""
+    collector, source, file_manager = make_collector(tmp_path, [
+        ([make_raw_vacancy("3", "2025-07-22T10:00:00+0300"), make_raw_vacancy("2", "2025-07-21T10:00:00+0300")],
+         3, 0),
+        [make_raw_vacancy("2", "2025-07-21T10:00:00+0300"), make_raw_vacancy("1", "2025-07-20T10:00:00+0300")],
+    ])
+
+    result = collector.sync("python")
+
+    assert [vac.vac_id for vac in result] == ["3", "2", "1"]
+    assert source.fetch_vacancies_data.call_args.args[1]["date_to"] == "2025-07-21T10:00:00+0300"
+    assert collector.get_watermark("python") == "2025-07-22T10:00:00+0300"
+
+
+def test_sync_keeps_watermark_when_incomplete(tmp_path: Any) -> None:
+    """Проверяет, что отметка не сдвигается, если страницу не удалось получить или выдача обрезана"""
+    collector, _, file_manager = make_collector(tmp_path, [
+        [make_raw_vacancy("1", "2025-07-20T10:00:00+0300")],
+        ([make_raw_vacancy("3", "2025-07-22T10:00:00+0300")], 2, 1),
+        ([make_raw_vacancy("3", "2025-07-22T10:00:00+0300")], 5, 0),
+        ([make_raw_vacancy("3", "2025-07-22T10:00:00+0300")], 5, 0),
+    ])
+    collector.logger = MagicMock()
+    collector.sync("python")
+
+    assert [vac.vac_id for vac in collector.sync("python")] == ["3"]
+    assert collector.get_watermark("python") == "2025-07-20T10:00:00+0300"
+    assert [vac.vac_id for vac in collector.sync("python")] == ["3"]
+    assert collector.get_watermark("python") == "2025-07-20T10:00:00+0300"
+    assert file_manager.add_vacancies.call_count == 3
@@ -0,0 +1,56 @@
+from src.class_vacancy import Vacancy
+from src.keyword_index import KeywordIndex
+
+
+def test_search_any(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет поиск вакансий, содержащих любое из ключевых слов, в порядке добавления"""
+    index = KeywordIndex([vacancy_1, vacancy_2, vacancy_3])
+
+    result = index.search(["sql", "PYTHON"])
+
+    assert [v.vac_id for v in result] == [vacancy_1.vac_id, vacancy_3.vac_id]
+
+
+def test_search_all(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет поиск вакансий, содержащих все ключевые слова"""
+    index = KeywordIndex([vacancy_1, vacancy_2, vacancy_3])
+
+    assert [v.vac_id for v in index.search(["QA", "sql"], "all")] == [vacancy_3.vac_id]
+    assert index.search(["QA", "python"], "all") == []
+
+
+def test_search_whole_words_only(vacancy_2: Vacancy) -> None:
+    """Проверяет, что ключевое слово не находится как часть другого слова"""
+    index = KeywordIndex([vacancy_2])
+
+    assert index.search(["Super"]) == []
+    assert index.search(["superset"]) == [vacancy_2]
+
+
+def test_search_phrase_and_pattern(vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет поиск по фразам и регулярным выражениям, которые не являются одним словом"""
+    index = KeywordIndex([vacancy_1, vacancy_2])
+
+    assert index.search(["qa engineer"]) == [vacancy_2]
+    assert index.search(["pyth.n"]) == [vacancy_1]
+
+
+def test_search_empty_words(vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет, что пустой список ключевых слов не ограничивает результат"""
+    index = KeywordIndex([vacancy_1, vacancy_2])
+
+    assert index.search([]) == [vacancy_1, vacancy_2]
+
+
+def test_add_and_remove(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет обновление индекса при добавлении и удалении вакансий"""
+    index = KeywordIndex([vacancy_1])
+    index.add([vacancy_3, vacancy_2])
+
+    assert len(index) == 3
+    assert [v.vac_id for v in index.search(["тестировщик"])] == [vacancy_3.vac_id, vacancy_2.vac_id]
+
+    assert index.remove([vacancy_3.vac_id, "unknown"]) == 1
+    assert len(index) == 2
+    assert index.search(["sql"]) == []
+    assert list(index) == [vacancy_1, vacancy_2]
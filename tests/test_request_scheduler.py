@@ -0,0 +1,105 @@
+from email.utils import formatdate
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Response
+
+from src.api_classes import HeadHunterVacanciesSource
+from src.request_scheduler import RequestScheduler
+
+
+def make_response(status_code: int, data: dict | None = None, headers: dict | None = None) -> MagicMock:
+    """Возвращает фейковый Response с заданным статус-кодом, данными и заголовками"""
+    response = MagicMock(spec=Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = data or {}
+    return response
+
+
+def test_reserve_within_burst() -> None:
+    """Проверяет, что запросы в пределах допустимого количества выполняются без ожидания"""
+    scheduler = RequestScheduler(requests_per_second=2, burst=3)
+
+    assert [scheduler._reserve() for _ in range(3)] == [0, 0, 0]
+
+
+def test_reserve_over_limit() -> None:
+    """Проверяет ожидание при превышении допустимой частоты запросов"""
+    with patch("src.request_scheduler.time.monotonic", return_value=100.0):
+        scheduler = RequestScheduler(requests_per_second=2, burst=1)
+        first = scheduler._reserve()
+        second = scheduler._reserve()
+        third = scheduler._reserve()
+
+    assert first == 0
+    assert second == pytest.approx(0.5)
+    assert third == pytest.approx(1.0)
+
+
+def test_penalize() -> None:
+    """Проверяет приостановку запросов после ответа о превышении лимита"""
+    with patch("src.request_scheduler.time.monotonic", return_value=100.0):
+        scheduler = RequestScheduler(requests_per_second=100, burst=100)
+        scheduler.penalize(5)
+
+        assert scheduler._reserve() == pytest.approx(5)
+
+
+@pytest.mark.parametrize("retry_after, expected", [
+    ("3", 3.0),
+    ("100", 30.0),
+])
+def test_backoff_delay_retry_after(retry_after: str, expected: float) -> None:
+    """Проверяет задержку по заголовку Retry-After"""
+    scheduler = RequestScheduler(max_delay=30)
+
+    assert scheduler.backoff_delay(0, retry_after) == expected
+
+
+def test_backoff_delay_retry_after_date() -> None:
+    """Проверяет задержку по заголовку Retry-After в формате даты"""
+    scheduler = RequestScheduler(max_delay=30)
+
+    assert 0 <= scheduler.backoff_delay(0, formatdate(usegmt=True)) <= 1
+
+
+def test_backoff_delay_exponential() -> None:
+    """Проверяет экспоненциальную задержку со случайным разбросом"""
+    scheduler = RequestScheduler(base_delay=1, max_delay=5)
+
+    assert 0.5 <= scheduler.backoff_delay(0) <= 1
+    assert 2 <= scheduler.backoff_delay(2) <= 4
+    assert 2.5 <= scheduler.backoff_delay(10) <= 5
+
+
+@patch.object(RequestScheduler, "wait")
+def test_source_retries_throttled_page(mock_wait: Any) -> None:
+    """Проверяет повтор запроса страницы после ответов 429 и 503"""
+    session = MagicMock()
+    session.get.side_effect = [make_response(429, headers={"Retry-After": "2"}),
+                               make_response(503),
+                               make_response(200, {"items": [{"id": 1}], "pages": 1})]
+    scheduler = RequestScheduler(requests_per_second=100, burst=100)
+    source = HeadHunterVacanciesSource(session=session, check_connection=False, scheduler=scheduler)
+
+    result = source.get_vacancies_data("python")
+
+    assert result == [{"id": 1}]
+    assert session.get.call_count == 3
+    assert any(call.args == (2.0,) for call in mock_wait.call_args_list)
+
+
+@patch.object(RequestScheduler, "wait")
+def test_source_retries_exhausted(mock_wait: Any) -> None:
+    """Проверяет, что после исчерпания повторов страница пропускается с записью ошибки"""
+    session = MagicMock()
+    session.get.return_value = make_response(500)
+    source = HeadHunterVacanciesSource(session=session, check_connection=False,
+                                       scheduler=RequestScheduler(requests_per_second=100, burst=100, max_retries=2))
+
+    result = source.get_vacancies_data("python")
+
+    assert result == []
+    assert session.get.call_count == 3
@@ -0,0 +1,90 @@
+import os
+import time
+from typing import Any
+
+from src.response_cache import ResponseCache
+
+
+def make_params(text: str = "python", page: int = 0) -> dict:
+    """Возвращает параметры запроса к API"""
+    return {"text": text, "page": page, "per_page": 100, "only_with_salary": True, "currency": "RUR", "area": 113}
+
+
+def test_make_key() -> None:
+    """Проверяет, что ключ записи зависит от всех параметров запроса, но не от их порядка"""
+    assert ResponseCache.make_key(make_params()) == ResponseCache.make_key(dict(reversed(make_params().items())))
+    assert ResponseCache.make_key(make_params()) != ResponseCache.make_key({**make_params(), "date_from": "2025"})
+    assert ResponseCache.make_key(make_params(page=0)) != ResponseCache.make_key(make_params(page=1))
+
+
+def test_set_and_get(tmp_path: Any) -> None:
+    """Проверяет сохранение и чтение записи кэша"""
+    cache = ResponseCache(str(tmp_path))
+
+    cache.set(make_params(), {"items": [{"id": "1"}]}, {"ETag": '"abc"'})
+    entry = cache.get(make_params())
+
+    assert entry is not None
+    assert entry["data"] == {"items": [{"id": "1"}]}
+    assert cache.is_fresh(entry)
+    assert cache.get(make_params(text="java")) is None
+
+
+def test_entry_expired(tmp_path: Any) -> None:
+    """Проверяет устаревание записи по истечении времени жизни"""
+    cache = ResponseCache(str(tmp_path), ttl=0)
+    cache.set(make_params(), {"items": []})
+
+    entry = cache.get(make_params())
+
+    assert entry is not None
+    assert not cache.is_fresh(entry)
+
+
+def test_conditional_headers() -> None:
+    """Проверяет формирование заголовков условного запроса"""
+    entry = {"etag": '"abc"', "last_modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+
+    assert ResponseCache.conditional_headers(entry) == {"If-None-Match": '"abc"',
+                                                        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    assert ResponseCache.conditional_headers(None) == {}
+
+
+def test_refresh(tmp_path: Any) -> None:
+    """Проверяет продление времени жизни записи"""
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    cache.set(make_params(), {"items": []})
+    entry = cache.get(make_params())
+    assert entry is not None
+    entry["stored_at"] = time.time() - 120
+
+    cache.refresh(make_params(), entry)
+
+    refreshed = cache.get(make_params())
+    assert refreshed is not None and cache.is_fresh(refreshed)
+
+
+def test_lru_eviction(tmp_path: Any) -> None:
+    """Проверяет вытеснение давно не использованных записей"""
+    cache = ResponseCache(str(tmp_path), max_entries=2)
+    cache.set(make_params(page=0), {"page": 0})
+    cache.set(make_params(page=1), {"page": 1})
+    old_time = time.time() - 100
+    os.utime(os.path.join(str(tmp_path), f"{ResponseCache.make_key(make_params(page=1))}.json"),
+             (old_time, old_time))
+
+    cache.set(make_params(page=2), {"page": 2})
+
+    assert len(cache) == 2
+    assert cache.get(make_params(page=1)) is None
+    assert cache.get(make_params(page=0)) is not None
+
+
+def test_clear(tmp_path: Any) -> None:
+    """Проверяет очистку кэша"""
+    cache = ResponseCache(str(tmp_path))
+    cache.set(make_params(), {"items": []})
+
+    cache.clear()
+
+    assert len(cache) == 0
@@ -0,0 +1,105 @@
+from typing import Any
+from unittest.mock import patch
+
+from src.class_vacancy import Vacancy
+from src.keyword_index import KeywordIndex
+from src.result_store import QueryResultStore
+from src.vacancy_interaction import VacancyInteraction
+
+
+def test_put_and_get(vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет сохранение и получение результата запроса"""
+    store = QueryResultStore()
+
+    store.put("Python", [vacancy_1, vacancy_2])
+
+    assert store.get(" python ") == [vacancy_1, vacancy_2]
+    assert store.get("java") is None
+    assert store.size == 2
+
+
+def test_get_expired(vacancy_1: Vacancy) -> None:
+    """Проверяет удаление устаревшего результата"""
+    store = QueryResultStore(ttl=10)
+    with patch("src.result_store.time.monotonic", return_value=100.0):
+        store.put("python", [vacancy_1])
+    with patch("src.result_store.time.monotonic", return_value=111.0):
+        assert store.get("python") is None
+    assert len(store) == 0
+    assert store.size == 0
+
+
+def test_eviction_by_size(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет вытеснение давно не использованных результатов при превышении объема"""
+    store = QueryResultStore(max_vacancies=2)
+    store.put("python", [vacancy_1])
+    store.put("java", [vacancy_2])
+    store.get("python")
+
+    store.put("go", [vacancy_3])
+
+    assert store.get("java") is None
+    assert store.get("python") == [vacancy_1]
+    assert store.get("go") == [vacancy_3]
+
+
+def test_put_too_large(vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет, что результат больше допустимого объема не сохраняется"""
+    store = QueryResultStore(max_vacancies=1)
+
+    store.put("python", [vacancy_1, vacancy_2])
+
+    assert store.get("python") is None
+
+
+def test_invalidate_and_clear(vacancy_1: Vacancy) -> None:
+    """Проверяет удаление результатов из хранилища"""
+    store = QueryResultStore()
+    store.put("python", [vacancy_1])
+    store.put("java", [vacancy_1])
+
+    store.invalidate("python")
+    assert store.get("python") is None
+
+    store.clear()
+    assert len(store) == 0
+
+
+def test_shared() -> None:
+    """Проверяет, что общее хранилище создается один раз на процесс"""
+    assert QueryResultStore.shared() is QueryResultStore.shared()
+
+
+def test_interaction_uses_stored_result(vacancy_1: Vacancy, vacancy_3: Vacancy, tmp_path: Any,
+                                        monkeypatch: Any) -> None:
+    """Проверяет, что повторный запрос обрабатывается без обращения к API и перезаписи файла"""
+    monkeypatch.setattr("src.vacancy_interaction.DATA_DIR", str(tmp_path))
+    store = QueryResultStore()
+    with patch("src.vacancy_interaction.HeadHunterVacanciesSource") as mock_source, \
+            patch("src.vacancy_interaction.JsonVacanciesFileManager") as mock_file_manager:
+        mock_source.return_value.get_vacancies.return_value = [vacancy_1, vacancy_3]
+        VacancyInteraction("python", ["python"], 0, 200000, result_store=store).get_vacancies()
+        result = VacancyInteraction("python", ["sql"], 0, 200000, result_store=store).get_vacancies()
+
+    assert result == [vacancy_3]
+    mock_source.return_value.get_vacancies.assert_called_once()
+    mock_file_manager.return_value.update_vacancies.assert_called_once()
+
+
+def test_interaction_reuses_stored_index(vacancy_1: Vacancy, vacancy_3: Vacancy, tmp_path: Any,
+                                         monkeypatch: Any) -> None:
+    """Проверяет, что уточнения запроса используют индексы, построенные по сохраненному результату"""
+    monkeypatch.setattr("src.vacancy_interaction.DATA_DIR", str(tmp_path))
+    store = QueryResultStore()
+    with patch("src.vacancy_interaction.HeadHunterVacanciesSource") as mock_source, \
+            patch("src.vacancy_interaction.JsonVacanciesFileManager"), \
+            patch("src.vacancy_manager.KeywordIndex", wraps=KeywordIndex) as mock_index:
+        mock_source.return_value.get_vacancies.return_value = [vacancy_1, vacancy_3]
+        VacancyInteraction("python", ["python"], 0, 200000, result_store=store).get_vacancies()
+        first = VacancyInteraction("python", ["sql"], 0, 200000, result_store=store).get_vacancies()
+        second = VacancyInteraction(" Python ", ["python"], 0, 200000, result_store=store).get_vacancies()
+
+    assert first == [vacancy_3]
+    assert second == [vacancy_1]
+    mock_index.assert_called_once()
+    assert store.get_manager("python") is store.get_manager("PYTHON")
@@ -0,0 +1,46 @@
+import random
+
+from src.class_vacancy import Vacancy
+from src.salary_index import SalaryIndex
+
+
+def make_vacancy(vac_id: str, salary_from: int, salary_to: int) -> Vacancy:
+    """Создает вакансию с заданными границами зарплаты"""
+    return Vacancy(vac_id, "Вакансия", "url", salary_from, salary_to, "Компания", "url", "Требования", "Москва")
+
+
+def test_range_sorted_descending(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет выборку по диапазону зарплат в порядке убывания"""
+    index = SalaryIndex([vacancy_3, vacancy_1, vacancy_2])
+
+    assert [v.vac_id for v in index.range(0, 200000)] == [vacancy_2.vac_id, vacancy_1.vac_id, vacancy_3.vac_id]
+    assert [v.vac_id for v in index.range(80000, 120000)] == [vacancy_2.vac_id]
+    assert index.range(120000, 80000) == []
+
+
+def test_range_inverted_salary() -> None:
+    """Проверяет выборку вакансии, у которой верхняя граница зарплаты меньше нижней"""
+    inverted = make_vacancy("1", 150000, 50000)
+    regular = make_vacancy("2", 90000, 100000)
+    index = SalaryIndex([regular, inverted])
+
+    assert [v.vac_id for v in index.range(60000, 100000)] == ["1", "2"]
+    assert [v.vac_id for v in index.range(120000, 100000)] == ["1"]
+    assert index.range(60000, 40000) == []
+
+
+def test_range_matches_scan() -> None:
+    """Проверяет, что выборка по индексу совпадает с перебором и сортировкой списка"""
+    rnd = random.Random(7)
+    vacancies = [make_vacancy(str(i), rnd.choice([0, 50000, 80000, 100000]), rnd.choice([0, 60000, 100000, 150000]))
+                 for i in range(300)]
+    index = SalaryIndex(vacancies[:200])
+    index.add(vacancies[200:])
+    index.remove(["5", "77", "250"])
+    rest = [v for v in vacancies if v.vac_id not in {"5", "77", "250"}]
+
+    for min_salary, max_salary in [(0, 0), (0, 100000), (50000, 100000), (60000, 150000), (100000, 50000)]:
+        expected = sorted((v for v in rest if v.salary_from >= min_salary and v.salary_to <= max_salary),
+                          reverse=True)
+        assert [v.vac_id for v in index.range(min_salary, max_salary)] == [v.vac_id for v in expected]
+    assert [v.vac_id for v in index] == [v.vac_id for v in sorted(rest, reverse=True)]
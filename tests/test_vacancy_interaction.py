@@ -1,9 +1,14 @@
+import asyncio
+import threading
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.class_vacancy import Vacancy
+from src.file_manager import JsonVacanciesFileManager
+from src.result_store import QueryResultStore
+from src.salary_index import SalaryIndex
 from src.vacancy_interaction import VacancyInteraction
 
 
@@ -83,3 +88,96 @@ def test__validate_salary_range(salary: Any, expected: int) -> None:
     result = VacancyInteraction._VacancyInteraction__validate_salary_range(salary)  # type: ignore
 
     assert result == expected
+
+
+def test_get_vacancies_top_only(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy, vacancy_4: Vacancy,
+                                tmp_path: Any, monkeypatch: Any, capsys: Any) -> None:
+    """Проверяет отбор топ вакансий и вывод остальных вакансий по убыванию зарплат"""
+    monkeypatch.setattr("src.vacancy_interaction.DATA_DIR", str(tmp_path))
+    source = MagicMock()
+    source.get_vacancies.return_value = [vacancy_3, vacancy_1, vacancy_4, vacancy_2]
+    interaction = VacancyInteraction("python", [], 0, 200000, 2, source, QueryResultStore())
+
+    with patch("src.vacancy_interaction.JsonVacanciesFileManager"):
+        top = interaction.get_vacancies(top_only=True)
+
+    assert [v.vac_id for v in top] == [vacancy_2.vac_id, vacancy_1.vac_id]
+    assert len(interaction) == 4
+
+    interaction.get_top_vacancies()
+    interaction.get_other_vacancies()
+
+    captured = capsys.readouterr().out
+    assert captured.index("Тестировщик / QA Engineer") < captured.index("Backend-разработчик")
+    assert [v.vac_id for v in interaction.sorted_vacancies] == [vacancy_2.vac_id, vacancy_1.vac_id,
+                                                                vacancy_3.vac_id, vacancy_4.vac_id]
+    assert captured.count("Junior QA/тестировщик") == 2
+
+
+def test_get_vacancies_sorted(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy, tmp_path: Any,
+                              monkeypatch: Any) -> None:
+    """Проверяет, что без режима топ вакансий возвращается весь отсортированный список"""
+    monkeypatch.setattr("src.vacancy_interaction.DATA_DIR", str(tmp_path))
+    source = MagicMock()
+    source.get_vacancies.return_value = [vacancy_3, vacancy_1, vacancy_2]
+    interaction = VacancyInteraction("python", [], 0, 200000, 1, source, QueryResultStore())
+
+    with patch("src.vacancy_interaction.JsonVacanciesFileManager"):
+        result = interaction.get_vacancies()
+
+    assert [v.vac_id for v in result] == [vacancy_2.vac_id, vacancy_1.vac_id, vacancy_3.vac_id]
+    assert interaction.sorted_vacancies is result
+
+
+def test_get_vacancies_keeps_other_saved_vacancies(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy,
+                                                   tmp_path: Any, monkeypatch: Any) -> None:
+    """Проверяет, что сохранение результата поиска не удаляет из файла вакансии, записанные ранее"""
+    monkeypatch.setattr("src.vacancy_interaction.DATA_DIR", str(tmp_path))
+    file_manager = JsonVacanciesFileManager(str(tmp_path / "vacancies.json"))
+    file_manager.save_vacancies([vacancy_1, vacancy_2])
+    source = MagicMock()
+    source.get_vacancies.return_value = [vacancy_2, vacancy_3]
+
+    VacancyInteraction("python", [], 0, 200000, 1, source, QueryResultStore()).get_vacancies()
+
+    assert [v.vac_id for v in file_manager.read_vacancies()] == [vacancy_1.vac_id, vacancy_2.vac_id,
+                                                                 vacancy_3.vac_id]
+
+
+def test_get_vacancies_uses_salary_index(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy, tmp_path: Any,
+                                         monkeypatch: Any) -> None:
+    """Проверяет, что вакансии отбираются по индексу зарплат без сортировки результата"""
+    monkeypatch.setattr("src.vacancy_interaction.DATA_DIR", str(tmp_path))
+    source = MagicMock()
+    source.get_vacancies.return_value = [vacancy_3, vacancy_1, vacancy_2]
+    interaction = VacancyInteraction("python", ["python", "sql"], 0, 200000, 1, source, QueryResultStore())
+
+    with patch("src.vacancy_interaction.JsonVacanciesFileManager"), \
+            patch("src.vacancy_manager.SalaryIndex", wraps=SalaryIndex) as mock_index, \
+            patch("src.vacancy_manager.sorted") as mock_sorted:
+        result = interaction.get_vacancies()
+
+    assert [v.vac_id for v in result] == [vacancy_1.vac_id, vacancy_3.vac_id]
+    mock_index.assert_called_once()
+    mock_sorted.assert_not_called()
+
+
+def test_get_vacancies_async_saves_outside_event_loop(vacancy_1: Vacancy, vacancy_2: Vacancy, tmp_path: Any,
+                                                      monkeypatch: Any) -> None:
+    """Проверяет, что асинхронный поиск сохраняет файл не в потоке цикла событий"""
+    monkeypatch.setattr("src.vacancy_interaction.DATA_DIR", str(tmp_path))
+    source = MagicMock()
+    source.get_vacancies = AsyncMock(return_value=[vacancy_1, vacancy_2])
+    interaction = VacancyInteraction("python", [], 0, 200000, 1, result_store=QueryResultStore())
+    save_threads = []
+
+    async def run() -> Any:
+        with patch("src.vacancy_interaction.JsonVacanciesFileManager") as mock_file_manager:
+            mock_file_manager.return_value.update_vacancies.side_effect = \
+                lambda *args: save_threads.append(threading.get_ident())
+            return await interaction.get_vacancies_async(source)
+
+    result = asyncio.run(run())
+
+    assert [v.vac_id for v in result] == [vacancy_2.vac_id, vacancy_1.vac_id]
+    assert save_threads and save_threads[0] != threading.get_ident()
@@ -1,5 +1,11 @@
+from typing import Any
+
+import pandas as pd
+import pytest
+
 from src.class_vacancy import Vacancy
-from src.vacancy_manager import VacancyManager
+from src.file_manager import CSVVacanciesFileManager, SQLiteVacanciesFileManager
+from src.vacancy_manager import VacancyFrameManager, VacancyManager
 
 
 def test_filter_by_keywords(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
@@ -30,3 +36,153 @@ def test_sort_vacancies(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacan
     result = vac_manager.sort_vacancies(None)
 
     assert result == [vacancy_2, vacancy_1, vacancy_3]
+
+
+def test_empty_target_transactions(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет, что пустой список вакансий для фильтрации и сортировки остается пустым"""
+    vac_manager = VacancyManager([vacancy_1, vacancy_2, vacancy_3])
+
+    assert vac_manager.filter_by_salary(0, 200000, []) == []
+    assert vac_manager.sort_vacancies([]) == []
+    assert vac_manager.filter_by_salary(0, 200000, vac_manager.filter_by_keywords(["kotlin"])) == []
+
+
+def test_select_vacancies(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет отбор вакансий по ключевым словам и зарплате с сортировкой"""
+    vac_manager = VacancyManager([vacancy_1, vacancy_2, vacancy_3])
+
+    result = vac_manager.select_vacancies(["тестировщик", "SQL"], 0, 120000)
+
+    assert [vac.vac_id for vac in result] == [vacancy_2.vac_id, vacancy_3.vac_id]
+    assert vac_manager.select_vacancies(["golang"], 0, 120000) == []
+
+
+def test_select_vacancies_from_store(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy,
+                                     vacancy_3: Vacancy) -> None:
+    """Проверяет, что фильтры выполняются в базе данных SQLite"""
+    store = SQLiteVacanciesFileManager(str(tmp_path / "vacancies.db"))
+    store.save_vacancies([vacancy_1, vacancy_2, vacancy_3])
+    vac_manager = VacancyManager(store=store)
+
+    by_words = vac_manager.filter_by_keywords(["тестировщик", "SQL"])
+    by_salary = vac_manager.filter_by_salary(80000, 120000, None)
+    selected = vac_manager.select_vacancies(["тестировщик", "SQL"], 0, 120000)
+
+    assert [vac.vac_id for vac in by_words] == [vacancy_2.vac_id, vacancy_3.vac_id]
+    assert [vac.vac_id for vac in by_salary] == [vacancy_2.vac_id]
+    assert [vac.vac_id for vac in selected] == [vacancy_2.vac_id, vacancy_3.vac_id]
+    assert [vac.vac_id for vac in vac_manager.vacancies] == [vacancy_1.vac_id, vacancy_2.vac_id, vacancy_3.vac_id]
+
+
+def test_frame_manager_matches_vacancy_manager(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy,
+                                               vacancy_4: Vacancy, vacancy_5: Vacancy) -> None:
+    """Проверяет, что векторные фильтры и сортировка дают тот же результат, что и обработка списка вакансий"""
+    vacancies = [vacancy_1, vacancy_2, vacancy_3, vacancy_4, vacancy_5]
+    frame_manager = VacancyFrameManager(pd.DataFrame([{"vac_id": vac.vac_id, "name": vac.name,
+                                                       "salary_from": vac.salary_from, "salary_to": vac.salary_to,
+                                                       "requirements": vac.requirements} for vac in vacancies]))
+    vac_manager = VacancyManager(vacancies)
+
+    by_words = frame_manager.filter_by_keywords(["тестировщик", "SQL"])
+    by_salary = frame_manager.filter_by_salary(0, 120000)
+    selected = frame_manager.select_vacancies(["тестировщик", "SQL"], 0, 120000)
+
+    assert by_words["vac_id"].tolist() == [vac.vac_id for vac in
+                                           vac_manager.filter_by_keywords(["тестировщик", "SQL"])]
+    assert frame_manager.sort_vacancies(by_salary)["vac_id"].tolist() == [
+        vac.vac_id for vac in vac_manager.filter_by_salary(0, 120000, None)]
+    assert selected["vac_id"].tolist() == [vac.vac_id for vac in
+                                           vac_manager.select_vacancies(["тестировщик", "SQL"], 0, 120000)]
+    assert frame_manager.sort_vacancies()["vac_id"].tolist() == [vac.vac_id for vac in
+                                                                 vac_manager.sort_vacancies(None)]
+
+
+def test_frame_manager_to_vacancies(tmp_path: Any, vacancy_1: Vacancy, vacancy_2: Vacancy,
+                                    vacancy_3: Vacancy) -> None:
+    """Проверяет, что объекты Vacancy создаются только для выводимых строк таблицы"""
+    file_manager = CSVVacanciesFileManager(str(tmp_path / "vacancies.csv"))
+    file_manager.save_vacancies([vacancy_1, vacancy_2, vacancy_3])
+    frame_manager = VacancyFrameManager.from_file_manager(file_manager)
+
+    top = frame_manager.to_vacancies(frame_manager.sort_vacancies(), limit=2)
+
+    assert [vac.vac_id for vac in top] == [vacancy_2.vac_id, vacancy_1.vac_id]
+    assert top[0].salary_range == (110000, 110000)
+    assert len(frame_manager.to_vacancies()) == 3
+
+
+def test_filter_by_keywords_match_all(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет фильтрацию вакансий, содержащих все ключевые слова"""
+    vac_manager = VacancyManager([vacancy_1, vacancy_2, vacancy_3])
+
+    result = vac_manager.filter_by_keywords(["тестировщик", "SQL"], match="all")
+
+    assert [v.vac_id for v in result] == [vacancy_3.vac_id]
+
+
+def test_filter_by_keywords_after_add_and_remove(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет, что индекс ключевых слов обновляется при добавлении и удалении вакансий"""
+    vac_manager = VacancyManager([vacancy_1])
+    assert vac_manager.filter_by_keywords(["тестировщик"]) == []
+
+    vac_manager.add_vacancies([vacancy_2, vacancy_3])
+    assert [v.vac_id for v in vac_manager.filter_by_keywords(["тестировщик"])] == [vacancy_2.vac_id,
+                                                                                   vacancy_3.vac_id]
+
+    vac_manager.remove_vacancies([vacancy_2.vac_id])
+    assert [v.vac_id for v in vac_manager.vacancies] == [vacancy_1.vac_id, vacancy_3.vac_id]
+    assert [v.vac_id for v in vac_manager.filter_by_keywords(["тестировщик"])] == [vacancy_3.vac_id]
+
+
+def test_filter_by_keywords_after_vacancies_replaced(vacancy_1: Vacancy, vacancy_2: Vacancy) -> None:
+    """Проверяет, что индекс ключевых слов перестраивается после замены списка вакансий"""
+    vac_manager = VacancyManager([vacancy_1])
+    assert vac_manager.filter_by_keywords(["python"]) == [vacancy_1]
+
+    vac_manager.vacancies = [vacancy_2]
+
+    assert vac_manager.filter_by_keywords(["python"]) == []
+
+
+def test_vacancies_not_mutable_outside(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет, что список вакансий менеджера нельзя изменить в обход индексов"""
+    vacancies = [vacancy_1, vacancy_2]
+    vac_manager = VacancyManager(vacancies)
+    assert vac_manager.filter_by_keywords(["python"]) == [vacancy_1]
+
+    vacancies[0] = vacancy_3
+
+    assert list(vac_manager.vacancies) == [vacancy_1, vacancy_2]
+    with pytest.raises(TypeError):
+        vac_manager.vacancies[0] = vacancy_3  # type: ignore[index]
+    assert vac_manager.filter_by_keywords(["python"]) == [vacancy_1]
+    assert vac_manager.filter_by_salary(0, 200000, None) == vac_manager.sort_vacancies(None)
+
+    view = vac_manager.vacancies
+    vac_manager.add_vacancies([vacancy_3])
+    vac_manager.remove_vacancies([vacancy_1.vac_id])
+    assert list(view) == [vacancy_2, vacancy_3]
+
+
+def test_filter_by_salary_sorted(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy,
+                                 vacancy_4: Vacancy) -> None:
+    """Проверяет, что вакансии, отобранные по индексу зарплат, возвращаются по убыванию зарплат"""
+    vac_manager = VacancyManager([vacancy_3, vacancy_1, vacancy_4, vacancy_2])
+
+    result = vac_manager.filter_by_salary(0, 200000, None)
+
+    assert [vac.vac_id for vac in result] == [vacancy_2.vac_id, vacancy_1.vac_id, vacancy_3.vac_id, vacancy_4.vac_id]
+    assert [vac.vac_id for vac in result] == [vac.vac_id for vac in sorted(vac_manager.vacancies, reverse=True)]
+
+
+def test_filter_by_salary_after_add_and_remove(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет, что индекс зарплат обновляется при добавлении и удалении вакансий"""
+    vac_manager = VacancyManager([vacancy_1])
+    assert vac_manager.filter_by_salary(0, 120000, None) == []
+
+    vac_manager.add_vacancies([vacancy_3, vacancy_2])
+    assert [vac.vac_id for vac in vac_manager.filter_by_salary(0, 120000, None)] == [vacancy_2.vac_id,
+                                                                                     vacancy_3.vac_id]
+
+    vac_manager.remove_vacancies([vacancy_2.vac_id])
+    assert [vac.vac_id for vac in vac_manager.sort_vacancies(None)] == [vacancy_1.vac_id, vacancy_3.vac_id]
@@ -0,0 +1,92 @@
+from typing import Any
+
+import numpy as np
+
+from src.class_vacancy import Vacancy
+from src.file_manager import JsonVacanciesFileManager
+from src.vacancy_manager import VacancyManager
+from src.vacancy_table import VacancyRows, VacancyTable
+
+
+def test_table_rows(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет создание объектов Vacancy по строкам таблицы"""
+    table = VacancyTable([vacancy_1, vacancy_2])
+    table.extend([vacancy_3])
+
+    assert len(table) == 3
+    vacancy = table[2]
+    assert (vacancy.vac_id, vacancy.name, vacancy.url, vacancy.salary_range, vacancy.employer_name,
+            vacancy.employer_url, vacancy.requirements, vacancy.area) == (
+        vacancy_3.vac_id, vacancy_3.name, vacancy_3.url, vacancy_3.salary_range, vacancy_3.employer_name,
+        vacancy_3.employer_url, vacancy_3.requirements, vacancy_3.area)
+    assert [v.vac_id for v in table] == [vacancy_1.vac_id, vacancy_2.vac_id, vacancy_3.vac_id]
+
+
+def test_table_dictionary_encoding(vacancy_2: Vacancy, vacancy_5: Vacancy) -> None:
+    """Проверяет, что повторяющиеся регионы и работодатели хранятся в словаре один раз"""
+    table = VacancyTable([vacancy_2, vacancy_5])
+
+    assert table._VacancyTable__employers == [(vacancy_2.employer_name, vacancy_2.employer_url)]  # type: ignore
+    assert table._VacancyTable__areas == ["Москва"]  # type: ignore
+    assert table._VacancyTable__salary_from.dtype == np.int64  # type: ignore
+
+
+def test_table_matches_vacancy_manager(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy,
+                                       vacancy_4: Vacancy, vacancy_5: Vacancy) -> None:
+    """Проверяет, что фильтры и сортировка таблицы дают тот же результат, что и VacancyManager"""
+    vacancies = [vacancy_3, vacancy_1, vacancy_5, vacancy_4, vacancy_2]
+    table = VacancyTable(vacancies)
+    vac_manager = VacancyManager(vacancies)
+
+    def ids(result: Any) -> list[str]:
+        return [v.vac_id for v in result]
+
+    assert ids(table.filter_by_keywords(["тестировщик", "SQL"])) == ids(
+        vac_manager.filter_by_keywords(["тестировщик", "SQL"]))
+    assert ids(table.filter_by_keywords(["QA", "sql"], match="all")) == ids(
+        vac_manager.filter_by_keywords(["QA", "sql"], match="all"))
+    assert ids(table.sort_vacancies(table.filter_by_salary(0, 120000))) == ids(
+        vac_manager.filter_by_salary(0, 120000, None))
+    assert ids(table.sort_vacancies()) == ids(vac_manager.sort_vacancies(None))
+    assert ids(table.select_vacancies(["тестировщик"], 0, 120000)) == ids(
+        vac_manager.select_vacancies(["тестировщик"], 0, 120000))
+
+
+def test_rows_are_lazy(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет, что выборка хранит номера строк и поддерживает срезы"""
+    table = VacancyTable([vacancy_1, vacancy_2, vacancy_3])
+
+    selected = table.sort_vacancies()
+
+    assert isinstance(selected, VacancyRows)
+    assert selected.rows.tolist() == [1, 0, 2]
+    assert [v.vac_id for v in selected[:2]] == [vacancy_2.vac_id, vacancy_1.vac_id]
+    assert selected[-1].vac_id == vacancy_3.vac_id
+    assert len(table.filter_by_salary(500000, 600000, selected)) == 0
+
+
+def test_table_from_file_manager(tmp_path: Any, vacancy_1: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет создание таблицы по таблице pandas, прочитанной из файла"""
+    file_manager = JsonVacanciesFileManager(str(tmp_path / "vacancies.json"))
+    file_manager.save_vacancies([vacancy_1, vacancy_3])
+
+    table = VacancyTable.from_file_manager(file_manager)
+
+    assert [(v.vac_id, v.salary_range, v.area) for v in table] == [
+        (vacancy_1.vac_id, vacancy_1.salary_range, vacancy_1.area),
+        (vacancy_3.vac_id, vacancy_3.salary_range, vacancy_3.area)]
+
+
+def test_table_extend_amortized(vacancy_1: Vacancy, vacancy_2: Vacancy, vacancy_3: Vacancy) -> None:
+    """Проверяет, что массивы таблицы растут с запасом и лишние строки не попадают в выборки"""
+    table = VacancyTable()
+    capacities = set()
+    for vacancy in [vacancy_1, vacancy_2, vacancy_3] * 4:
+        table.extend([vacancy])
+        capacities.add(len(table._VacancyTable__salary_from))  # type: ignore[attr-defined]
+
+    assert len(table) == 12
+    assert capacities == {1, 2, 4, 8, 16}
+    assert table[-1].vac_id == vacancy_3.vac_id
+    assert len(table.filter_by_salary(0, 10 ** 9)) == 12
+    assert [v.vac_id for v in table.sort_vacancies()[:3]] == [vacancy_2.vac_id] * 3